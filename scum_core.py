@@ -1,5 +1,5 @@
 """SCUM Core Module"""
-import os, re, subprocess, psutil, socket, struct, json, sqlite3
+import os, re, subprocess, psutil, socket, struct, json, sqlite3, itertools
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
@@ -288,63 +288,116 @@ def ban_player_via_ini(steam_id, reason="", scum_path=None):
         print(f"Error banning player {steam_id}: {e}")
         return False
 def unban_player_via_ini(s): return False
-def send_rcon_command(command, host='localhost', port=8888, password=''):
-    """Send RCON command to SCUM server"""
-    try:
-        import socket
-        import struct
-        import time
-
-        # RCON packet types
-        SERVERDATA_AUTH = 3
-        SERVERDATA_EXECCOMMAND = 2
-        SERVERDATA_AUTH_RESPONSE = 2
-        SERVERDATA_RESPONSE_VALUE = 0
-
-        def send_packet(sock, packet_type, body):
-            """Send RCON packet"""
-            body_bytes = body.encode('utf-8') + b'\x00'
-            packet_size = len(body_bytes) + 10  # 4 (size) + 4 (id) + 4 (type) + 2 (nulls)
-            packet_id = 1
-
-            packet = struct.pack('<iii', packet_size, packet_id, packet_type) + body_bytes + b'\x00'
-            sock.send(packet)
-
-            # Receive response
-            response_size_data = sock.recv(4)
-            if len(response_size_data) < 4:
-                return None
 
-            response_size = struct.unpack('<i', response_size_data)[0]
-            response_data = sock.recv(response_size)
+# RCON is small request/reply traffic, so disable Nagle to send each packet immediately
+DEFAULT_RCON_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+# RCON packet types
+SERVERDATA_AUTH = 3
+SERVERDATA_EXECCOMMAND = 2
+SERVERDATA_AUTH_RESPONSE = 2
+SERVERDATA_RESPONSE_VALUE = 0
+
+# Request ids are unique per process so a reply can always be matched to its request
+_rcon_ids = itertools.count(1)
+# Packets larger than this are treated as a broken stream rather than read
+_RCON_MAX_PACKET = 1 << 20
+
+def _rcon_recv_exact(sock, n):
+    """Read exactly n bytes (recv may return fewer), or None if the peer closed first"""
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
 
-            if len(response_data) < 8:
-                return None
+def _rcon_read_packet(sock):
+    """Read one whole packet as (id, type, body), or None if the connection closed"""
+    head = _rcon_recv_exact(sock, 4)
+    if head is None:
+        return None
+    size = struct.unpack('<i', head)[0]
+    if not 10 <= size <= _RCON_MAX_PACKET:
+        raise ConnectionError(f"Malformed RCON packet (size {size})")
+    data = _rcon_recv_exact(sock, size)
+    if data is None:
+        return None
+    packet_id, packet_type = struct.unpack('<ii', data[:8])
+    return packet_id, packet_type, data[8:-2].decode('utf-8', errors='ignore')
+
+def _rcon_send_packet(sock, packet_type, body):
+    """Send one RCON packet and return the body of its reply (None if closed or auth rejected)
+
+    Every request gets its own id and packets carrying any other id are skipped: they are
+    leftovers of an earlier exchange (the empty packet ahead of an auth reply, the tail of
+    a multi-packet reply), so a reused connection never hands back a previous reply.
+    """
+    body_bytes = body.encode('utf-8') + b'\x00'
+    packet_size = len(body_bytes) + 9  # 4 (id) + 4 (type) + body + its null + 1 (empty string null)
+    packet_id = next(_rcon_ids) & 0x7fffffff or 1
+
+    packet = struct.pack('<iii', packet_size, packet_id, packet_type) + body_bytes + b'\x00'
+    sock.sendall(packet)
+
+    # An auth request is answered by an empty RESPONSE_VALUE and then the AUTH_RESPONSE
+    want_type = SERVERDATA_AUTH_RESPONSE if packet_type == SERVERDATA_AUTH else None
+    while True:
+        reply = _rcon_read_packet(sock)
+        if reply is None:
+            return None
+        resp_id, resp_type, resp_body = reply
+        if resp_id == -1:
+            return None  # the server rejected the password
+        if resp_id == packet_id and (want_type is None or resp_type == want_type):
+            return resp_body
 
-            resp_id, resp_type = struct.unpack('<ii', response_data[:8])
-            resp_body = response_data[8:-2].decode('utf-8', errors='ignore')
+def open_rcon_connection(host='localhost', port=8888, password='', socket_options=None):
+    """Connect and authenticate to RCON, returning the socket for reuse
 
-            return resp_body
+    Raises OSError if the connection or authentication fails. Pass the socket to
+    rcon_exec for each command and close it when done.
+    """
+    import time
 
-        # Connect to RCON
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        for level, optname, value in (DEFAULT_RCON_SOCKET_OPTIONS if socket_options is None else socket_options):
+            sock.setsockopt(level, optname, value)
         sock.settimeout(5.0)
         sock.connect((host, port))
 
         # Authenticate
-        auth_response = send_packet(sock, SERVERDATA_AUTH, password)
-        if auth_response is None:
-            sock.close()
-            return None
+        if _rcon_send_packet(sock, SERVERDATA_AUTH, password) is None:
+            raise ConnectionError("RCON authentication failed")
 
         # Small delay
         time.sleep(0.1)
-
-        # Send command
-        response = send_packet(sock, SERVERDATA_EXECCOMMAND, command)
-
+    except Exception:
         sock.close()
-        return response
+        raise
+    return sock
+
+def rcon_exec(sock, command):
+    """Run a command on an open RCON connection, raising ConnectionError if it was dropped"""
+    response = _rcon_send_packet(sock, SERVERDATA_EXECCOMMAND, command)
+    if response is None:
+        raise ConnectionError("RCON connection closed")
+    return response
+
+def send_rcon_command(command, host='localhost', port=8888, password='', socket_options=None):
+    """Send RCON command to SCUM server over a one-shot connection
+
+    socket_options: list of (level, optname, value) tuples passed to setsockopt
+    before connecting; defaults to DEFAULT_RCON_SOCKET_OPTIONS.
+    """
+    try:
+        sock = open_rcon_connection(host, port, password, socket_options)
+        try:
+            return _rcon_send_packet(sock, SERVERDATA_EXECCOMMAND, command)
+        finally:
+            sock.close()
 
     except Exception as e:
         print(f"RCON command failed: {e}")
@@ -494,7 +547,53 @@ def find_scum_config_dir(scum_path=None):
     except Exception as e:
         print(f"Error finding config directory: {e}")
         return None
-def find_scum_installations_in_directory(d): return []
+# Directories never worth descending into when hunting for SCUMServer.exe (compared lowercased)
+_SCAN_PRUNE = frozenset({'$recycle.bin', 'windows', 'node_modules', '.git', '__pycache__',
+                         'system volume information'})
+_SCAN_PRUNE_SUFFIX = os.sep + os.path.join('appdata', 'local', 'temp')
+_SCUM_EXE_LOWER = 'scumserver.exe'
+
+def find_scum_installations_in_directory(d, cancel=None) -> List[Tuple[Path, Optional[int]]]:
+    """Find every SCUMServer.exe under directory d, as (path, size in bytes or None) pairs.
+
+    Iterative os.scandir walk: DirEntry type checks reuse the stat data scandir already
+    has, junk/hidden directories are pruned before being queued, and a directory that
+    holds SCUMServer.exe is not descended further. If cancel (a threading.Event) gets
+    set, the walk stops and returns what it found so far.
+    """
+    found = []
+    stack = [os.fspath(d)]
+    while stack:
+        if cancel is not None and cancel.is_set():
+            break
+        top = stack.pop()
+        subdirs = []
+        hit = None
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            lower = name.lower()
+                            if lower in _SCAN_PRUNE or name.startswith('.'):
+                                continue
+                            subdirs.append(entry.path)
+                        elif name.lower() == _SCUM_EXE_LOWER:
+                            # Size from the same DirEntry, so callers need not stat it again
+                            try:
+                                hit = (entry.path, entry.stat().st_size)
+                            except OSError:
+                                hit = (entry.path, None)
+                    except OSError:
+                        continue
+        except OSError:
+            continue  # unreadable directory
+        if hit:
+            found.append((Path(hit[0]), hit[1]))
+            continue
+        stack.extend(p for p in subdirs if not p.lower().endswith(_SCAN_PRUNE_SUFFIX))
+    return found
 def find_steamcmd_dir(): return None
 def find_scum_server_dir(): return None
 def init_database(db_path):
@@ -560,6 +659,8 @@ def init_database(db_path):
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_status ON players(status)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_players_last_seen ON players(last_seen)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_steam_id ON player_sessions(steam_id)')
+        # Covering index for the per-player SUM(duration) playtime aggregate
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ps_steam_dur ON player_sessions(steam_id, duration) WHERE duration IS NOT NULL')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_admin_actions_timestamp ON admin_actions(timestamp)')
 
         conn.commit()
@@ -1,5 +1,6 @@
 import sys
 import os
+import re
 import json
 from pathlib import Path
 import socket
@@ -8,36 +9,1945 @@ import subprocess
 from datetime import datetime
 import time
 import sqlite3
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from functools import partial
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QGroupBox, QFileDialog,
     QTableWidget, QTableWidgetItem, QMessageBox, QProgressBar,
     QListWidget, QListWidgetItem, QStackedWidget, QSplitter, QLineEdit,
-    QGraphicsOpacityEffect, QStyle, QCheckBox, QGridLayout, QTabWidget,
+    QGraphicsOpacityEffect, QStyle, QCheckBox, QGridLayout, QFormLayout, QTabWidget,
     QSpinBox, QComboBox, QFileDialog, QTreeWidget, QTreeWidgetItem, QDialog,
-    QInputDialog, QRadioButton, QPlainTextEdit, QFrame
+    QInputDialog, QRadioButton, QPlainTextEdit, QFrame, QStyledItemDelegate,
+    QTableView, QHeaderView, QTreeView, QFileSystemModel, QStyleOptionViewItem, QListView, QProxyStyle,
+    QSizePolicy, QProgressDialog
+)
+from PySide6.QtGui import (
+    QIcon, QFont, QPixmap, QColor, QPainter, QBrush, QLinearGradient, QPen, QTextCursor, QTextCharFormat,
+    QPalette, QAbstractTextDocumentLayout, QIntValidator
+)
+from PySide6.QtCore import (
+    QTimer, Qt, QPropertyAnimation, QEasingCurve, QMetaObject, Slot, Q_ARG, QEvent, QRect, QPoint,
+    QAbstractTableModel, QModelIndex, QDir, QObject, QThread, Signal, QSignalBlocker, QStringListModel, QSize, QRectF
 )
-from PySide6.QtGui import QIcon, QFont, QPixmap, QColor
-from PySide6.QtCore import QTimer, QTime, QDate, Qt, QPropertyAnimation, QEasingCurve, QMetaObject, Slot, Q_ARG
 
 try:
     import psutil
 except Exception:
     psutil = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from scum_core import (
     find_scum_exe, find_scum_pid, start_server, stop_server,
     get_system_metrics, get_process_uptime, parse_players_from_log,
-    load_bans, add_ban, remove_ban, find_all_scum_installations
+    load_bans, add_ban, remove_ban, find_all_scum_installations,
+    send_rcon_command, get_rcon_config, open_rcon_connection, rcon_exec
 )
 
 APP_ROOT = Path(__file__).parent
 
+# SCUMSM_NO_STYLE=1 skips every stylesheet and runs on the stock Fusion style (no QSS
+# parse or re-polish), for slow admin machines or when a system theme is preferred
+STYLED = os.environ.get("SCUMSM_NO_STYLE") != "1"
+
+# Admin entries in AdminUsers.ini: SteamID="7656..."
+_STEAMID_RE = re.compile(r'SteamID="(\d+)"')
+
+# Window-wide stylesheet applied once by SCUMManager.apply_style(). Buttons, labels and
+# group boxes that need their own look are matched by objectName or by the "variant" /
+# "accent" / "state" properties instead of carrying an inline setStyleSheet each.
+# Table cells and header sections use solid fills: a qlineargradient there is
+# re-rasterised for every cell on every repaint, a flat brush is cached.
+APP_QSS = """
+    QWidget {
+        background: #0f1117;
+        color: #e6eef6;
+    }
+    QListWidget {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #0b0d12, stop:1 #1a1d23);
+        border-right: 2px solid #23252b;
+        border-radius: 0px;
+        selection-background-color: transparent;
+    }
+    QListWidget::item {
+        padding: 15px;
+        border-bottom: 1px solid #23252b;
+        border-left: 3px solid transparent;
+    }
+    QListWidget::item:selected {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e8b57, stop:1 #35c06f);
+        color: #ffffff;
+        border-left: 4px solid #ffffff;
+        border-radius: 0px;
+        font-weight: bold;
+    }
+    QListWidget::item:selected:active {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #4ade80);
+    }
+    QListWidget::item:hover {
+        background: #2b2f36;
+        border-left: 3px solid #ffb86b;
+    }
+    QListWidget::item:selected:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #6ef08b);
+        border-left: 4px solid #ffb86b;
+    }
+    QListWidget::item:focus {
+        border-left: 3px solid #bd93f9;
+    }
+    QGroupBox {
+        border: 2px solid #2b2f36;
+        margin-top: 6px;
+        padding: 15px;
+        border-radius: 10px;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a1d23, stop:1 #0f1117);
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #e6eef6;
+        font-weight: bold;
+    }
+    QPushButton {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
+        color: #072018;
+        padding: 10px 16px;
+        border-radius: 8px;
+        border: 1px solid #2b2f36;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
+    }
+    QPushButton:pressed {
+        background: #1e8b57;
+    }
+    QPushButton:disabled {
+        background: #666;
+        color: #ddd;
+    }
+    QTableView {
+        background: #0d1016;
+        border: 1px solid #2b2f36;
+        border-radius: 5px;
+        gridline-color: #23252b;
+        selection-background-color: transparent;
+    }
+    QTableView::item {
+        padding: 8px;
+        border-bottom: 1px solid #23252b;
+        border-right: 1px solid #23252b;
+        background: transparent;
+    }
+    QTableView::item:selected {
+        background: #2aa563;
+        color: #ffffff;
+        border: 2px solid #4ade80;
+        border-radius: 3px;
+        font-weight: bold;
+    }
+    QTableView::item:selected:active {
+        background: #3fcf77;
+    }
+    QTableView::item:hover {
+        background: #2b2f36;
+        border: 1px solid #ffb86b;
+    }
+    QTableView::item:selected:hover {
+        background: #5ce785;
+        border: 2px solid #ffb86b;
+    }
+    QTableView::item:focus {
+        border: 2px solid #bd93f9;
+    }
+    QTableView QHeaderView::section {
+        background: #23262d;
+        color: #e6eef6;
+        padding: 8px;
+        border: 1px solid #23252b;
+        font-weight: bold;
+        border-radius: 0px;
+    }
+    QTableView QHeaderView::section:hover {
+        background: #33373e;
+        border: 1px solid #ffb86b;
+    }
+    QProgressBar {
+        background: #081018;
+        border: 2px solid #1f2a2a;
+        border-radius: 8px;
+        text-align: center;
+        color: #e6eef6;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6ef08b, stop:1 #2fbf57);
+        border-radius: 6px;
+    }
+    QLineEdit {
+        background: #0d1016;
+        border: 1px solid #2b2f36;
+        border-radius: 5px;
+        padding: 5px;
+        color: #e6eef6;
+    }
+    QLineEdit:focus {
+        border: 1px solid #1e8b57;
+    }
+
+    /* Per-widget rules, selected by objectName / the "variant" property */
+    QPushButton#btnRefreshPlayers {
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #50fa7b, stop:1 #3fa56b);
+        border: none;
+        border-radius: 6px;
+        color: #0f1117;
+    }
+    QPushButton#btnKickAll {
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ff5555, stop:1 #cc4444);
+        border: none;
+        border-radius: 6px;
+        color: white;
+    }
+    QPushButton#btnAdminHelp {
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffb86b, stop:1 #cc9544);
+        border: none;
+        border-radius: 6px;
+        color: #0f1117;
+    }
+    QPushButton#btnSendRcon {
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #bd93f9, stop:1 #9b73d9);
+        border: none;
+        border-radius: 6px;
+        color: white;
+    }
+    QPushButton[variant="quick"] {
+        padding: 6px 12px;
+        font-size: 11px;
+        background: #2b2f36;
+        border: 1px solid #44475a;
+        border-radius: 4px;
+        color: #e6eef6;
+        margin: 2px;
+    }
+    QPushButton#btnAddConfigFolder {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
+        color: #072018;
+        padding: 10px 20px;
+        font-weight: bold;
+    }
+    QPushButton#btnAddConfigFolder:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6ef08b, stop:1 #35c06f);
+    }
+    QPushButton#btnVisualEditor {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #bd93f9, stop:1 #9b59b6);
+        color: #ffffff;
+        font-weight: bold;
+        padding: 10px 16px;
+    }
+    QPushButton#btnVisualEditor:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #d4b3ff, stop:1 #bb79d6);
+    }
+    QPushButton#btnSqliteStudio {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #f59e0b, stop:1 #d97706);
+        color: #ffffff;
+        font-weight: bold;
+        padding: 10px 16px;
+    }
+    QPushButton#btnSqliteStudio:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #fbbf24, stop:1 #f59e0b);
+    }
+    QGroupBox#grpPlayersRefresh {
+        border: 2px solid #bd93f9;
+        border-radius: 8px;
+        padding: 10px;
+        background: #2b2f36;
+        margin: 0px;
+        font-weight: bold;
+    }
+    QGroupBox#grpPlayersRefresh::title {
+        color: #bd93f9;
+        font-size: 13px;
+        padding: 0 8px;
+    }
+    QGroupBox#grpPlayersRcon {
+        border: 2px solid #bd93f9;
+        border-radius: 8px;
+        padding: 10px;
+        background: #1a1d23;
+        margin: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox#grpPlayersRcon::title {
+        color: #bd93f9;
+        font-size: 16px;
+        padding: 5px 10px;
+        background: rgba(189, 147, 249, 0.1);
+        border-radius: 6px;
+    }
+    QLabel#statusPill {
+        font-size: 12px;
+        padding: 5px;
+        background: #2b2f36;
+        border-radius: 3px;
+    }
+    QLabel#statusPill[state="ok"] { color: #50fa7b; }
+    QLabel#statusPill[state="bad"] { color: #ff6b6b; }
+    QLabel#statusPill[state="warn"] { color: #ffb86b; }
+    QLabel#statusPill[state="info"] { color: #8be9fd; }
+    QLabel#statusPill[state="visual"] { color: #bd93f9; }
+    QLabel[variant="caption"] {
+        color: #8be9fd;
+        font-size: 10px;
+        padding: 5px;
+    }
+    QGroupBox[accent="teal"] {
+        font-weight: bold;
+        border: 2px solid #1e8b57;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="green"] {
+        font-weight: bold;
+        border: 2px solid #50fa7b;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="cyan"] {
+        font-weight: bold;
+        border: 2px solid #8be9fd;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="purple"] {
+        font-weight: bold;
+        border: 2px solid #bd93f9;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="yellow"] {
+        font-weight: bold;
+        border: 2px solid #f1fa8c;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="red"] {
+        font-weight: bold;
+        border: 2px solid #ff5555;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="pink"] {
+        font-weight: bold;
+        border: 2px solid #ff79c6;
+        margin-top: 6px;
+    }
+    QGroupBox[accent="orange"] {
+        font-weight: bold;
+        border: 2px solid #ffb86b;
+        margin-top: 6px;
+    }
+    QLabel#statsTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #e6eef6;
+        padding: 10px 0px;
+    }
+    QPushButton#btnRefreshStats {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #3b82f6, stop:1 #1d4ed8);
+        color: #ffffff;
+        padding: 8px 16px;
+        border-radius: 6px;
+        border: 1px solid #2b2f36;
+        font-weight: bold;
+    }
+    QPushButton#btnRefreshStats:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #60a5fa, stop:1 #3b82f6);
+    }
+    QWidget#pagePlayerStats QGroupBox {
+        font-size: 14px;
+        font-weight: bold;
+        color: #e6eef6;
+        padding: 10px;
+        border: 2px solid #44475a;
+        border-radius: 8px;
+        margin-top: 10px;
+    }
+    QWidget#pagePlayerStats QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 10px 0 10px;
+    }
+    QLabel#statsChartPlaceholder {
+        color: #6272a4;
+        font-size: 12px;
+        padding: 20px;
+        background: #2b2f36;
+        border-radius: 6px;
+        border: 1px solid #44475a;
+    }
+    QTableView#playerStatsTable {
+        background: #2b2f36;
+        alternate-background-color: #32363e;
+        color: #e6eef6;
+        border: 1px solid #44475a;
+        border-radius: 6px;
+        gridline-color: #44475a;
+    }
+    QTableView#playerStatsTable QHeaderView::section {
+        background: #44475a;
+        color: #e6eef6;
+        padding: 8px;
+        border: 1px solid #6272a4;
+        font-weight: bold;
+    }
+    QTableView#playerStatsTable::item {
+        padding: 5px;
+        border-bottom: 1px solid #44475a;
+    }
+    QListWidget#topPlayersList {
+        background: #2b2f36;
+        color: #e6eef6;
+        border: 1px solid #44475a;
+        border-radius: 6px;
+    }
+    QListWidget#topPlayersList::item {
+        padding: 8px;
+        border-bottom: 1px solid #44475a;
+    }
+    QListWidget#topPlayersList::item:hover {
+        background: #44475a;
+    }
+    QTextEdit#statsActivityLog {
+        background: #2b2f36;
+        color: #e6eef6;
+        border: 1px solid #44475a;
+        border-radius: 6px;
+        font-size: 11px;
+    }
+    QDialog#installPicker {
+        background: #0f1117;
+        color: #e6eef6;
+    }
+    QDialog#installPicker QLabel {
+        color: #e6eef6;
+    }
+    QDialog#installPicker QLabel#installPickerTitle {
+        font-size: 16px;
+        font-weight: bold;
+        color: #50fa7b;
+        padding: 10px;
+    }
+    QDialog#installPicker QLabel#installPickerHint {
+        font-size: 12px;
+        color: #8be9fd;
+        padding: 5px;
+    }
+    QDialog#installPicker QPushButton {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
+        color: #072018;
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QDialog#installPicker QPushButton:hover {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
+    }
+    QDialog#installPicker QListWidget {
+        background: #0d1016;
+        border: 1px solid #2b2f36;
+        border-radius: 5px;
+        color: #e6eef6;
+        padding: 5px;
+    }
+    QDialog#installPicker QListWidget::item {
+        padding: 10px;
+        border-bottom: 1px solid #2b2f36;
+    }
+    QDialog#installPicker QListWidget::item:selected {
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e8b57, stop:1 #35c06f);
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QDialog#installPicker QListWidget::item:hover {
+        background: #2b2f36;
+    }
+"""
+
+# Stylesheets for the Dashboard and Players pages, built once at import so every
+# build_* call reuses the same string objects instead of re-creating them
+_STYLE_CARD_PERFORMANCE = """
+    QGroupBox {
+        border: 2px solid #0078d4;
+        border-radius: 8px;
+        margin-top: 6px;
+        font-weight: bold;
+        font-size: 14px;
+        color: #e6eef6;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e1e1e, stop:1 #2b2f36);
+    }
+    QGroupBox::title {
+        color: #0078d4;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 5px 10px;
+        left: 10px;
+        top: -8px;
+    }
+"""
+
+_STYLE_PROGRESSBAR_CPU = """
+    QProgressBar {
+        border: 2px solid #444;
+        border-radius: 4px;
+        text-align: center;
+        background: #0d1016;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+        padding: 2px;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #0078d4, stop:1 #00bcf2);
+        border-radius: 2px;
+    }
+"""
+
+_STYLE_PROGRESSBAR_RAM = """
+    QProgressBar {
+        border: 2px solid #444;
+        border-radius: 4px;
+        text-align: center;
+        background: #0d1016;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+        padding: 2px;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #10b981, stop:1 #50fa7b);
+        border-radius: 2px;
+    }
+"""
+
+_STYLE_CARD_DISK = """
+    QGroupBox {
+        border: 2px solid #f59e0b;
+        border-radius: 8px;
+        margin-top: 6px;
+        font-weight: bold;
+        font-size: 14px;
+        color: #e6eef6;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e1e1e, stop:1 #2b2f36);
+    }
+    QGroupBox::title {
+        color: #f59e0b;
+        font-weight: bold;
+        font-size: 14px;
+        padding: 5px 10px;
+        left: 10px;
+        top: -8px;
+    }
+"""
+
+_STYLE_PROGRESSBAR_DISK = """
+    QProgressBar {
+        border: 2px solid #444;
+        border-radius: 4px;
+        text-align: center;
+        background: #0d1016;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+        padding: 2px;
+    }
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #f59e0b, stop:1 #fbbf24);
+        border-radius: 2px;
+    }
+"""
+
+_STYLE_GROUPBOX_ONLINE = """
+    QGroupBox {
+        border: 3px solid #50fa7b;
+        border-radius: 12px;
+        padding: 15px;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a5f1a, stop:1 #0f3f0f);
+        margin: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        color: #50fa7b;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 5px 10px;
+        background: rgba(80, 250, 123, 0.1);
+        border-radius: 6px;
+    }
+"""
+
+_STYLE_LABEL_ONLINE_COUNT = """
+    font-size: 48px;
+    font-weight: bold;
+    color: #50fa7b;
+    text-align: center;
+"""
+
+_STYLE_GROUPBOX_SERVER_STATUS = """
+    QGroupBox {
+        border: 3px solid #8be9fd;
+        border-radius: 12px;
+        padding: 15px;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a3f5f, stop:1 #0f2f4f);
+        margin: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        color: #8be9fd;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 5px 10px;
+        background: rgba(139, 233, 253, 0.1);
+        border-radius: 6px;
+    }
+"""
+
+_STYLE_LABEL_SERVER_STATUS = """
+    font-size: 24px;
+    font-weight: bold;
+    color: #ff5555;
+    text-align: center;
+"""
+
+_STYLE_GROUPBOX_STATS = """
+    QGroupBox {
+        border: 3px solid #ffb86b;
+        border-radius: 12px;
+        padding: 15px;
+        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #5f3f1a, stop:1 #3f2f0f);
+        margin: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        color: #ffb86b;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 5px 10px;
+        background: rgba(255, 184, 107, 0.1);
+        border-radius: 6px;
+    }
+"""
+
+_STYLE_GROUPBOX_SEARCH = """
+    QGroupBox {
+        border: 2px solid #6272a4;
+        border-radius: 8px;
+        padding: 10px;
+        background: #2b2f36;
+        margin: 0px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        color: #6272a4;
+        font-size: 13px;
+        padding: 0 8px;
+    }
+"""
+
+_STYLE_PLAYER_SEARCH = """
+    padding: 8px 12px;
+    font-size: 13px;
+    min-width: 250px;
+    border: 2px solid #44475a;
+    border-radius: 6px;
+    background: #1a1d23;
+    color: #e6eef6;
+"""
+
+_STYLE_FILTER_COMBO = """
+    padding: 8px;
+    font-size: 13px;
+    border: 2px solid #44475a;
+    border-radius: 6px;
+    background: #1a1d23;
+    color: #e6eef6;
+"""
+
+_STYLE_GROUPBOX_ACTIONS = """
+    QGroupBox {
+        border: 2px solid #50fa7b;
+        border-radius: 8px;
+        padding: 10px;
+        background: #2b2f36;
+        margin: 0px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        color: #50fa7b;
+        font-size: 13px;
+        padding: 0 8px;
+    }
+"""
+
+
+_STYLE_CB_PLAYERS_AUTO_REFRESH = """
+    font-size: 12px;
+    color: #bd93f9;
+    font-weight: bold;
+"""
+
+_STYLE_GROUPBOX_TABLE = """
+    QGroupBox {
+        border: 2px solid #6272a4;
+        border-radius: 8px;
+        padding: 10px;
+        background: #1a1d23;
+        margin: 5px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        color: #6272a4;
+        font-size: 16px;
+        padding: 5px 10px;
+        background: rgba(98, 114, 164, 0.1);
+        border-radius: 6px;
+    }
+"""
+
+_STYLE_TABLE_PLAYERS = """
+    QTableView {
+        gridline-color: #44475a;
+        selection-background-color: #6272a4;
+        background: #1a1d23;
+        border: 1px solid #44475a;
+        border-radius: 6px;
+        font-size: 13px;
+    }
+    QTableView::item {
+        padding: 8px;
+        border-bottom: 1px solid #2b2f36;
+        color: #e6eef6;
+    }
+    QTableView::item:selected {
+        background: #4c5c8a;
+        color: #ffffff;
+    }
+    QHeaderView::section {
+        background: #3d4051;
+        color: #f8f8f2;
+        padding: 12px 8px;
+        border: none;
+        font-weight: bold;
+        font-size: 14px;
+        border-right: 1px solid #2b2f36;
+    }
+    QTableView::item:hover {
+        background: #2b2f36;
+    }
+"""
+
+_STYLE_RCON_INPUT = """
+    padding: 8px 12px;
+    font-size: 13px;
+    min-width: 400px;
+    border: 2px solid #44475a;
+    border-radius: 6px;
+    background: #0d1016;
+    color: #e6eef6;
+"""
+
+
+_STYLE_RCON_RESPONSE = """
+    QListView {
+        background: #0d1016;
+        border: 2px solid #2b2f36;
+        border-radius: 6px;
+        color: #50fa7b;
+        font-size: 11px;
+        padding: 8px;
+    }
+    QListView::item {
+        padding: 0px;
+    }
+"""
+
+# Setup page: completion bar, sub-tab bar and the Download tab progress/log widgets
+# Only the pane is styled here; the Setup tab bar itself is painted by SetupTabStyle
+_STYLE_SETUP_TABS = """
+    QTabWidget::pane {
+        border: 1px solid #2b2f36;
+        background: #0f1117;
+    }
+"""
+
+# Box and chunk of the Setup progress bars are painted by _FastProgressBar; only text metrics here
+_STYLE_CONNECTION_PROGRESS = """
+    QProgressBar {
+        font-size: 11px;
+        font-weight: bold;
+        color: #e6eef6;
+        min-height: 20px;
+    }
+"""
+
+_STYLE_DOWNLOAD_PROGRESS = """
+    QProgressBar {
+        font-size: 12px;
+        font-weight: bold;
+        color: #e6eef6;
+        min-height: 25px;
+    }
+"""
+
+_STYLE_DOWNLOAD_LOG = """
+    QTextEdit {
+        background: #0d1016;
+        border: 1px solid #2b2f36;
+        border-radius: 5px;
+        color: #e6eef6;
+        font-size: 10px;
+    }
+"""
+
+# RCON console scrollback, one model row per response line; the oldest rows are dropped
+RCON_MAX_LINES = 2000
+
+
+# Log viewers are QPlainTextEdits capped at this many blocks; older lines scroll away
+LOG_VIEW_MAX_LINES = 5000
+
+# server.cfg written by generate_server_config; the fixed layout lives here, the values come from the Setup page
+_SERVER_CFG_TEMPLATE = """# SCUM Server Configuration - Generated by SCUM Server Manager
+# Generated on {generated}
+
+[Server]
+Name = "{name}"
+Password = "{password}"
+MaxPlayers = {max_players}
+Port = {port}
+QueryPort = {query_port}
+RCONPort = {rcon_port}
+RCONPassword = "{rcon_password}"
+Difficulty = {difficulty}
+
+[Directories]
+Logs = "{logs_dir}"
+Save = "{save_dir}"
+
+[Performance]
+MemoryLimit = {memory_limit}
+AutoRestart = {auto_restart}
+RestartDelay = {restart_delay}
+AutoBackup = {auto_backup}
+BackupInterval = {backup_interval}
+"""
+
+# Fixed combo box choices
+_PLAYER_FILTERS = ("All Players", "Online Only", "Offline Only", "Admins", "Banned")
+_LOG_TIME_RANGES = ("All Time", "Last Hour", "Last 6 Hours", "Last 24 Hours", "Today", "Last 7 Days")
+_LOG_LEVELS = ("All", "Info", "Warning", "Error", "Critical")
+_DIFFICULTIES = ("0 - Peaceful", "1 - Easy", "2 - Normal", "3 - Hard", "4 - Extreme")
+_CPU_PRIORITIES = ("Low", "Normal", "High", "Realtime")
+
+# Per-view line colouring: (keywords, colour, prefix, bold), first match wins.
+# The second item of each pair is the fallback for lines matching no rule.
+_LOG_RULES_SERVER = ((
+    (("error",), "#ff6b6b", "", False),
+    (("warn",), "#ffb86b", "", False),
+    (("info",), "#8be9fd", "", False),
+), (None, "", False))
+_LOG_RULES_PLAYERS = ((
+    (("connected", "joined"), "#50fa7b", "✅ ", False),
+    (("disconnected", "left"), "#ffb86b", "❌ ", False),
+    (("kicked", "banned"), "#ff6b6b", "⛔ ", False),
+    (("identified",), "#8be9fd", "🔍 ", False),
+), (None, "", False))
+_LOG_RULES_ERRORS = ((
+    (("critical", "fatal"), "#ff0000", "🔴 ", True),
+    (("error",), "#ff6b6b", "❌ ", False),
+    (("warn",), "#ffb86b", "⚠️ ", False),
+), (None, "", False))
+_LOG_RULES_ADMIN = ((
+    (("kick", "ban"), "#ff6b6b", "⛔ ", False),
+    (("unban", "pardon"), "#50fa7b", "✅ ", False),
+    (("teleport", "spawn"), "#bd93f9", "✨ ", False),
+), ("#ffb86b", "⚡ ", False))
+_LOG_RULES_EVENTS = ((
+    (("started", "online"), "#50fa7b", "✅ ", False),
+    (("stopped", "shutdown"), "#ff6b6b", "⛔ ", False),
+    (("restart",), "#ffb86b", "🔄 ", False),
+    (("backup", "save"), "#8be9fd", "💾 ", False),
+    (("connected", "player"), "#bd93f9", "👥 ", False),
+), (None, "", False))
+
+
+# Timestamp and level of Logs/ lines: "[ts] [LEVEL] msg" (write_log) or "[ts] LEVEL: msg"
+_LOG_LINE_RE = re.compile(r'\[([^\]]+)\]\s*(?:\[(\w+)\]|(\w+):)')
+# Log level token -> entry of the Logs tab "Level" combo
+_LOG_LEVEL_NAMES = {'INFO': 'Info', 'WARNING': 'Warning', 'WARN': 'Warning',
+                    'ERROR': 'Error', 'CRITICAL': 'Critical', 'FATAL': 'Critical'}
+# A search containing none of these is matched as plain text rather than compiled
+_REGEX_META = frozenset('.^$*+?{}[]\\|()')
+
+
+def _read_log_tail(path: Path, max_lines: int = LOG_VIEW_MAX_LINES):
+    """Return (last max_lines lines, byte offset read up to) without holding the rest in memory"""
+    with path.open("rb") as f:
+        tail = deque(f, maxlen=max_lines)
+        end = f.tell()
+    return [line.decode("utf-8", errors="ignore").rstrip("\r\n") for line in tail], end
+
+
+def _load_json_file(path: Path):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _load_json_sections(path: Path, keys):
+    """Read only the given top-level keys of a JSON object file.
+
+    With ijson installed the file is streamed and reading stops once every
+    requested key has been seen, so unrelated sections are never fully loaded.
+    Without it this falls back to a full parse and filters the result.
+    """
+    wanted = set(keys)
+    if ijson is None:
+        data = _load_json_file(path)
+        return {k: v for k, v in data.items() if k in wanted}
+    found = {}
+    with path.open('rb') as fh:
+        for key, value in ijson.kvitems(fh, '', use_float=True):
+            if key in wanted:
+                found[key] = value
+                if len(found) == len(wanted):
+                    break
+    return found
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _parse_ini_lines(lines):
+    """Build {"[Section]": {key: value}} from an iterable of INI lines (a file object streams).
+
+    Keys before the first section header are ignored, as are comments and lines without '='.
+    """
+    result = {}
+    section = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            section = result[line] = {}
+            continue
+        key, sep, value = line.partition('=')
+        if sep and section is not None:
+            section[key.strip()] = value.strip()
+    return result
+
+
+def _set_qss(widget, sheet):
+    """setStyleSheet unless styling is switched off with SCUMSM_NO_STYLE"""
+    if STYLED:
+        widget.setStyleSheet(sheet)
+
+
+def _port_bindable(port, sock_type=socket.SOCK_STREAM):
+    """True if nothing else holds port on any local interface for this socket type"""
+    sock = socket.socket(socket.AF_INET, sock_type)
+    try:
+        if os.name != 'nt':
+            # Ignore TIME_WAIT leftovers; on Windows SO_REUSEADDR would let the bind
+            # succeed on a port another process is actively using
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('0.0.0.0', port))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+# Players-tab play time: "2h 30m" (also "2h", "45m"); "-" / "Active" don't match
+_PLAYTIME_RE = re.compile(r'\s*(?:(\d+)h)?\s*(?:(\d+)m)?\s*')
+
+
+def _parse_playtime(text):
+    """Minutes in a play-time string such as '2h 30m', or 0 if it isn't one"""
+    m = _PLAYTIME_RE.fullmatch(text or '')
+    if not m:
+        return 0
+    hours, minutes = m.groups()
+    return int(hours or 0) * 60 + int(minutes or 0)
+
+
+def _format_mb(size_bytes):
+    """'123.4 MB' for a byte count, or 'Unknown size' when it could not be read"""
+    if size_bytes is None:
+        return "Unknown size"
+    return f"{size_bytes / (1024*1024):.1f} MB"
+
+
+def _render_emoji_icon(glyph, size=16):
+    """Rasterize an emoji once into a QIcon so buttons blit it instead of shaping the colour glyph"""
+    dpr = QApplication.instance().devicePixelRatio()
+    pixmap = QPixmap(int(size * dpr), int(size * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    font = QFont()
+    font.setFamilies(["Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji"])
+    font.setPixelSize(size - 2)
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, size, size), Qt.AlignCenter, glyph)
+    painter.end()
+    return QIcon(pixmap)
+
+
+def _add_form_rows(form, rows):
+    """Add (label text, widget or layout) pairs as rows of a QFormLayout"""
+    form.setLabelAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+    for label, field in rows:
+        form.addRow(label, field)
+        # Let the label span the row height so its text centres on the field like a grid cell
+        form.labelForField(field).setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+
+
+def _fast_parse_scum_ts(s: str) -> datetime:
+    """Parse a SCUM log timestamp ('YYYY.MM.DD-HH.MM.SS[:mmm]') without strptime"""
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+@dataclass(frozen=True)
+class AdvancedSetup:
+    """Advanced Setup tab values as written to scum_setup.json"""
+    __slots__ = ('logs_dir', 'config_dir', 'auto_restart', 'auto_backup')  # dataclass(slots=) needs 3.10
+    logs_dir: str
+    config_dir: str
+    auto_restart: bool
+    auto_backup: bool
+
+
+class SetupTabStyle(QProxyStyle):
+    """Flat dark tabs with a green underline on the selected one, for the Setup tab bar.
+
+    Painting the tab shape here replaces QTabBar::tab stylesheet rules, which make
+    Qt run every tab through its stylesheet box model on each repaint.
+    """
+
+    C_TAB = QColor('#1a1d23')
+    C_TAB_SELECTED = QColor('#2b2f36')
+    C_BORDER = QColor('#2b2f36')
+    C_ACCENT = QColor('#1e8b57')
+    TAB_GAP = 2
+    TAB_PADDING = QSize(32, 16)  # 16px left/right, 8px top/bottom
+
+    def drawControl(self, element, option, painter, widget=None):
+        if element == QStyle.CE_TabBarTabShape:
+            rect = option.rect.adjusted(0, 0, -self.TAB_GAP, 0)
+            selected = bool(option.state & QStyle.State_Selected)
+            painter.fillRect(rect, self.C_TAB_SELECTED if selected else self.C_TAB)
+            painter.setPen(self.C_BORDER)
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            if selected:
+                painter.fillRect(rect.x(), rect.bottom() - 1, rect.width(), 2, self.C_ACCENT)
+            return
+        super().drawControl(element, option, painter, widget)
+
+    def sizeFromContents(self, ctype, option, size, widget=None):
+        size = super().sizeFromContents(ctype, option, size, widget)
+        if ctype == QStyle.CT_TabBarTab:
+            size += self.TAB_PADDING + QSize(self.TAB_GAP, 0)
+        return size
+
+
+class _IntEdit(QLineEdit):
+    """Plain line edit for a bounded integer, with the value()/setValue() of the QSpinBox it replaces.
+
+    A QSpinBox carries two arrow buttons and an auto-repeat timer that nobody uses for
+    ports and limits; a validated QLineEdit is a single widget.
+    """
+
+    def __init__(self, lo, hi, default, parent=None):
+        super().__init__(str(default), parent)
+        self._lo = lo
+        self._hi = hi
+        self._default = default
+        self.setValidator(QIntValidator(lo, hi, self))
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+    def value(self):
+        """Current number clamped into range; the default while the text is not a number.
+
+        Callers that store the number check hasAcceptableInput() first, since the field
+        can still hold intermediate text ("", or "80" for a 1024+ port) while it has focus.
+        """
+        try:
+            return min(max(int(self.text()), self._lo), self._hi)
+        except ValueError:
+            return self._default
+
+    def setValue(self, value):
+        self.setText(str(value))
+
+    def default_value(self):
+        return self._default
+
+    def _normalize(self):
+        text = str(self.value())
+        if self.text() != text:
+            self.setText(text)
+
+    # QLineEdit only emits editingFinished for text the validator accepts, so intermediate
+    # input is clamped here, before the base class decides whether editing finished
+    def focusOutEvent(self, event):
+        self._normalize()
+        super().focusOutEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            self._normalize()
+        super().keyPressEvent(event)
+
+
+class _FastProgressBar(QProgressBar):
+    """Progress bar whose gradient chunk is rendered once per size and blitted on each tick.
+
+    A QSS ::chunk gradient is re-rasterized on every setValue, which during a SteamCMD
+    download means dozens of times a second. With styling off it paints natively.
+    """
+
+    C_BACKGROUND = QColor('#0d1016')
+    C_BORDER = QColor('#2b2f36')
+
+    def __init__(self, top='#4ade80', bottom='#22c55e', parent=None):
+        super().__init__(parent)
+        self._top = QColor(top)
+        self._bottom = QColor(bottom)
+        self._chunk_pix = None
+
+    def resizeEvent(self, event):
+        self._chunk_pix = None
+        super().resizeEvent(event)
+
+    def _chunk_pixmap(self, size):
+        dpr = self.devicePixelRatioF()
+        if self._chunk_pix is None or self._chunk_pix.devicePixelRatioF() != dpr:
+            pix = QPixmap(size * dpr)
+            pix.setDevicePixelRatio(dpr)
+            gradient = QLinearGradient(0, 0, 0, size.height())
+            gradient.setColorAt(0, self._top)
+            gradient.setColorAt(1, self._bottom)
+            painter = QPainter(pix)
+            painter.fillRect(QRect(QPoint(0, 0), size), gradient)
+            painter.end()
+            self._chunk_pix = pix
+        return self._chunk_pix
+
+    def paintEvent(self, event):
+        span = self.maximum() - self.minimum()
+        if not STYLED or span <= 0:
+            # Busy (0..0) bars animate natively
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.C_BORDER, 2))
+        painter.setBrush(self.C_BACKGROUND)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 5, 5)
+        inner = self.rect().adjusted(2, 2, -2, -2)
+        width = round(inner.width() * (self.value() - self.minimum()) / span)
+        if width > 0:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QBrush(self._chunk_pixmap(inner.size())))
+            painter.setBrushOrigin(inner.topLeft())
+            painter.drawRoundedRect(QRectF(inner.x(), inner.y(), width, inner.height()), 3, 3)
+        if self.isTextVisible():
+            painter.setPen(self.palette().color(self.foregroundRole()))
+            painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+        painter.end()
+
+
+class _CachedLogEdit(QTextEdit):
+    """Read-only log view that repaints its viewport from a cached pixmap.
+
+    The pixmap is re-rendered only when the text, selection, scroll position,
+    size or focus changes; other repaints (window moves, sibling progress bars)
+    just blit it instead of laying out and rasterizing the document again.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache = None
+        self.setReadOnly(True)
+        self.viewport().setAttribute(Qt.WA_OpaquePaintEvent)
+        self.document().contentsChanged.connect(self._invalidate)
+        self.selectionChanged.connect(self._invalidate)
+        self.cursorPositionChanged.connect(self._invalidate)
+        self.verticalScrollBar().valueChanged.connect(self._invalidate)
+        self.horizontalScrollBar().valueChanged.connect(self._invalidate)
+
+    def _invalidate(self, *_):
+        self._cache = None
+        self.viewport().update()
+
+    def _render_cache(self):
+        viewport = self.viewport()
+        dpr = viewport.devicePixelRatioF()
+        cache = QPixmap(viewport.size() * dpr)
+        cache.setDevicePixelRatio(dpr)
+        palette = viewport.palette()
+        cache.fill(palette.color(viewport.backgroundRole()))
+        painter = QPainter(cache)
+        doc = self.document()
+        if doc.isEmpty() and self.placeholderText():
+            margin = int(doc.documentMargin())
+            painter.setFont(doc.defaultFont())
+            painter.setPen(palette.color(QPalette.PlaceholderText))
+            painter.drawText(viewport.rect().adjusted(margin, margin, -margin, -margin),
+                             Qt.AlignTop | Qt.TextWordWrap, self.placeholderText())
+        else:
+            # Same pass QTextEdit's own paintEvent makes: scrolled document plus selection
+            ctx = QAbstractTextDocumentLayout.PaintContext()
+            ctx.palette = palette
+            ctx.clip = QRectF(self.horizontalScrollBar().value(), self.verticalScrollBar().value(),
+                              viewport.width(), viewport.height())
+            cursor = self.textCursor()
+            if cursor.hasSelection():
+                sel = QAbstractTextDocumentLayout.Selection()
+                sel.cursor = cursor
+                fmt = QTextCharFormat()
+                fmt.setBackground(palette.highlight())
+                fmt.setForeground(palette.highlightedText())
+                sel.format = fmt
+                ctx.selections = [sel]
+            painter.translate(-ctx.clip.x(), -ctx.clip.y())
+            doc.documentLayout().draw(painter, ctx)
+        painter.end()
+        return cache
+
+    def paintEvent(self, event):
+        viewport = self.viewport()
+        if self._cache is None or self._cache.devicePixelRatioF() != viewport.devicePixelRatioF():
+            self._cache = self._render_cache()
+        painter = QPainter(viewport)
+        painter.drawPixmap(0, 0, self._cache)
+        painter.end()
+
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
+
+    def focusInEvent(self, event):
+        self._cache = None
+        super().focusInEvent(event)
+
+    def focusOutEvent(self, event):
+        self._cache = None
+        super().focusOutEvent(event)
+
+    def changeEvent(self, event):
+        # Palette/font/stylesheet changes alter how the text is drawn
+        self._cache = None
+        super().changeEvent(event)
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """Paints Kick/Ban buttons for online players and dispatches clicks.
+
+    The cell's Qt.UserRole holds (display_name, steam_id) for online rows and
+    None otherwise, so offline rows paint as an empty cell.
+    """
+
+    BUTTONS = (("👢 Kick", "kick_player"), ("🚫 Ban", "ban_player"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._brushes = []
+        for top, bottom in (("#ff5555", "#cc4444"), ("#ff6e67", "#cc5555")):
+            gradient = QLinearGradient(0, 0, 0, 1)
+            gradient.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+            gradient.setColorAt(0, QColor(top))
+            gradient.setColorAt(1, QColor(bottom))
+            self._brushes.append(QBrush(gradient))
+        self._font = QFont('Segoe UI', 11, QFont.Bold)
+        self._text_color = QColor('#ffffff')
+
+    def _button_rects(self, cell):
+        """Split the cell into two side-by-side button rectangles."""
+        r = cell.adjusted(2, 2, -2, -2)
+        half = (r.width() - 4) // 2
+        return (QRect(r.left(), r.top(), half, r.height()),
+                QRect(r.left() + half + 4, r.top(), half, r.height()))
+
+    def paint(self, painter, option, index):
+        player = index.data(Qt.UserRole)
+        if not player:
+            super().paint(painter, option, index)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setFont(self._font)
+        for rect, brush, (label, _) in zip(self._button_rects(option.rect), self._brushes, self.BUTTONS):
+            painter.setBrush(brush)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(self._text_color)
+            painter.drawText(rect, Qt.AlignCenter, label)
+            painter.setPen(Qt.NoPen)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease:
+            return super().editorEvent(event, model, option, index)
+        player = index.data(Qt.UserRole)
+        if not player:
+            return False
+        pos = event.position().toPoint()
+        for rect, (_, handler) in zip(self._button_rects(option.rect), self.BUTTONS):
+            if rect.contains(pos):
+                display_name, steam_id = player
+                getattr(self.parent(), handler)(display_name, steam_id)
+                return True
+        return False
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints the Players Status cell as a coloured dot and ONLINE/OFFLINE label.
+
+    The cell's Qt.UserRole holds the row's is_online flag; cells without it (the
+    message row) fall back to the default painting.
+    """
+
+    DOT = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont('Segoe UI', 10, QFont.Bold)
+
+    def paint(self, painter, option, index):
+        is_online = index.data(Qt.UserRole)
+        if is_online is None:
+            super().paint(painter, option, index)
+            return
+        # Background, selection and hover from the style, without the text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        color = index.data(Qt.ForegroundRole)
+        label = index.data(Qt.DisplayRole)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        text_w = painter.fontMetrics().horizontalAdvance(label)
+        r = option.rect
+        left = r.left() + (r.width() - (self.DOT + 6 + text_w)) // 2
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawEllipse(left, r.center().y() - self.DOT // 2, self.DOT, self.DOT)
+        painter.setPen(color)
+        painter.drawText(QRect(left + self.DOT + 6, r.top(), text_w + 2, r.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, label)
+        painter.restore()
+
+
+class BanListModel(QAbstractTableModel):
+    """Single-column model over a list of ban entries.
+
+    The view only asks for the rows it is painting, so resetting the model is
+    O(1) regardless of how many bans there are.
+    """
+
+    HEADER = "Banned Entry"
+
+    def __init__(self, entries=None, parent=None):
+        super().__init__(parent)
+        self._entries = entries if entries is not None else []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._entries[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADER
+        return section + 1
+
+    def set_entries(self, entries):
+        """Replace the backing list (the model keeps a reference, not a copy)."""
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def append_entry(self, entry):
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self.endInsertRows()
+
+    def remove_entry(self, entry):
+        try:
+            row = self._entries.index(entry)
+        except ValueError:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        self.endRemoveRows()
+
+
+class StatsTableModel(QAbstractTableModel):
+    """Player Stats table model: one (metric, value, change, trend) tuple per row."""
+
+    HEADERS = ("Metric", "Value", "Change", "Trend")
+
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows if rows is not None else []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def set_rows(self, rows):
+        """Replace every row with one model reset (the model keeps a reference, not a copy)."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class PlayersModel(QAbstractTableModel):
+    """Players tab model: one plain tuple per row, rendered on demand by the view.
+
+    Rows are (is_online, display_name, steam_id, char_name, connected_at,
+    play_time, ip_addr), so tuple index N is also the text of column N for
+    columns 1-6. When there is nothing to list, a single message row (server
+    offline / no players yet) replaces them.
+    """
+
+    HEADERS = ("Status", "Player Name", "Steam ID", "Character", "Connected", "Play Time", "IP Address", "Actions")
+
+    C_ONLINE = QColor('#50fa7b')
+    C_OFFLINE = QColor('#666666')
+    C_NAME = QColor('#8be9fd')
+    C_STEAM = QColor('#f1fa8c')
+    C_CHAR = QColor('#ffb86b')
+    C_TIME_PURPLE = QColor('#bd93f9')
+    # Foregrounds that don't depend on online status
+    _COLUMN_COLORS = {2: C_STEAM, 3: C_CHAR, 4: C_TIME_PURPLE, 6: C_CHAR}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._message = None  # (text, QColor, QFont or None) while a message row is shown
+        self._font_name_bold = QFont('Segoe UI', 14, QFont.Bold)
+        self._font_name_norm = QFont('Segoe UI', 14, QFont.Normal)
+        self.font_notice = QFont('Segoe UI', 12, QFont.Bold)
+
+    @property
+    def showing_message(self):
+        return self._message is not None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if self._message is not None:
+            if col != 0:
+                return None
+            text, color, font = self._message
+            if role == Qt.DisplayRole:
+                return text
+            if role == Qt.ForegroundRole:
+                return color
+            if role == Qt.FontRole:
+                return font
+            return None
+
+        row = self._rows[index.row()]
+        is_online = row[0]
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return "ONLINE" if is_online else "OFFLINE"  # StatusDelegate draws the dot
+            return row[col] if col < 7 else None
+        if role == Qt.ForegroundRole:
+            if col == 0 or col == 5:
+                return self.C_ONLINE if is_online else self.C_OFFLINE
+            if col == 1:
+                return self.C_NAME if is_online else self.C_OFFLINE
+            return self._COLUMN_COLORS.get(col)
+        if role == Qt.FontRole and col == 1:
+            return self._font_name_bold if is_online else self._font_name_norm
+        if col == 0:
+            if role == Qt.UserRole:
+                return is_online
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+        if col == 7 and is_online:
+            # ActionDelegate paints Kick/Ban buttons for cells carrying this
+            if role == Qt.UserRole:
+                return (row[1], row[2])
+            if role == Qt.ToolTipRole:
+                return f"Kick or permanently ban {row[1]}"
+        return None
+
+    def row_at(self, row):
+        """Return the row tuple at `row`, or None for the message row / an invalid row."""
+        if self._message is not None or not 0 <= row < len(self._rows):
+            return None
+        return self._rows[row]
+
+    def set_message(self, text, color, font=None):
+        """Replace all rows with a single notice row."""
+        self.beginResetModel()
+        self._rows = []
+        self._message = (text, color, font)
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Replace the rows, matching them up by Steam ID so selection and scroll survive.
+
+        Departed players are removed, arrivals inserted, survivors moved with a layout
+        change when the sort order shifts, and only rows whose values differ emit
+        dataChanged. Rows without unique Steam IDs fall back to a positional patch.
+        """
+        if self._message is not None:
+            self.beginResetModel()
+            self._message = None
+            self._rows = list(rows)
+            self.endResetModel()
+            return
+
+        keys = [row[2] for row in rows]
+        new_keys = set(keys)
+        if len(new_keys) != len(keys) or len({row[2] for row in self._rows}) != len(self._rows):
+            self._set_rows_by_position(rows)
+            return
+
+        old = self._rows
+        # Drop departed rows bottom-up, one signal per contiguous run
+        r = len(old) - 1
+        while r >= 0:
+            if old[r][2] in new_keys:
+                r -= 1
+                continue
+            end = r
+            while r >= 0 and old[r][2] not in new_keys:
+                r -= 1
+            self.beginRemoveRows(QModelIndex(), r + 1, end)
+            del old[r + 1:end + 1]
+            self.endRemoveRows()
+
+        # Re-sort survivors into the new order, carrying persistent indexes (selection) along
+        kept = set(row[2] for row in old)
+        order = [k for k in keys if k in kept]
+        if [row[2] for row in old] != order:
+            self.layoutAboutToBeChanged.emit()
+            new_pos = {k: i for i, k in enumerate(order)}
+            persistent = self.persistentIndexList()
+            moved = [self.index(new_pos[old[i.row()][2]], i.column()) for i in persistent]
+            old.sort(key=lambda row: new_pos[row[2]])
+            self.changePersistentIndexList(persistent, moved)
+            self.layoutChanged.emit()
+
+        # Walk the new rows: patch survivors in place, insert runs of arrivals
+        last_col = len(self.HEADERS) - 1
+        i, n = 0, len(rows)
+        while i < n:
+            if i < len(old) and old[i][2] == keys[i]:
+                if old[i] != rows[i]:
+                    old[i] = rows[i]
+                    self.dataChanged.emit(self.index(i, 0), self.index(i, last_col))
+                i += 1
+                continue
+            j = i
+            while j < n and keys[j] not in kept:
+                j += 1
+            self.beginInsertRows(QModelIndex(), i, j - 1)
+            old[i:i] = rows[i:j]
+            self.endInsertRows()
+            i = j
+
+    def _set_rows_by_position(self, rows):
+        """Patch rows by index: trim or extend the tail, then signal rows that differ."""
+        old = self._rows
+        n_old, n_new = len(old), len(rows)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del old[n_new:]
+            self.endRemoveRows()
+        elif n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            old.extend(rows[n_old:])
+            self.endInsertRows()
+
+        last_col = len(self.HEADERS) - 1
+        for r in range(min(n_old, n_new)):
+            if old[r] != rows[r]:
+                old[r] = rows[r]
+                self.dataChanged.emit(self.index(r, 0), self.index(r, last_col))
+
+
+class LogTailer(QObject):
+    """Polls log files on a worker thread and emits the complete lines appended since the last poll.
+
+    linesReady carries (name, start offset, end offset, lines) so the GUI can tell
+    whether a batch continues exactly where its view left off; start is None when
+    the file shrank (truncated or replaced) since the last poll.
+    """
+
+    linesReady = Signal(str, object, object, list)
+
+    def __init__(self, paths, positions=None, interval=1000):
+        super().__init__()
+        self._paths = dict(paths)  # name -> Path
+        self._pos = dict(positions or {})  # name -> offset already shown by the GUI
+        self._interval = interval
+        self._timer = None
+
+    @Slot()
+    def start(self):
+        # Created here so the timer belongs to, and fires on, the worker thread
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.poll)
+        self._timer.start(self._interval)
+
+    @Slot()
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+
+    @Slot()
+    def poll(self):
+        for name, path in self._paths.items():
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            pos = self._pos.get(name)
+            if pos is None:
+                # Not loaded by a viewer yet; it reads the file itself when built, so follow from here
+                self._pos[name] = size
+                continue
+            start = pos
+            if size < pos:
+                start, pos = None, 0  # Truncated or replaced
+            if size == pos:
+                continue
+            try:
+                with path.open("rb") as f:
+                    f.seek(pos)
+                    data = f.read(size - pos)
+            except OSError:
+                continue
+            end = data.rfind(b"\n") + 1
+            if not end:
+                continue  # Only a partial line so far
+            self._pos[name] = pos + end
+            lines = data[:end].decode("utf-8", errors="ignore").splitlines()
+            self.linesReady.emit(name, start, pos + end, lines)
+
 
 class SCUMManager(QMainWindow):
+    # scum_setup.json contents read on a worker thread by build_setup, applied on the GUI thread
+    setupConfigLoaded = Signal(dict)
+    # (steamcmd.exe present, SCUMServer.exe present), checked on a worker thread by the Download tab
+    installationsDetected = Signal(bool, bool)
+    # (cancel event, scanned dir, [(SCUMServer.exe path, size)], error text) from auto_detect_server's worker
+    installScanFinished = Signal(object, str, list, str)
+    # (settings dict, file mtime, snapshot number) written by _flush_settings_save's worker
+    settingsWritten = Signal(object, float, int)
+    # error text when that worker could not write scum_settings.json
+    settingsWriteFailed = Signal(str)
+
+    # Top-level scum_settings.json sections written by _gather_settings and read by load_settings
+    _SETTINGS_KEYS = ('scum_path', 'steamcmd_dir', 'scum_server_dir', 'config_base_path', 'rcon', 'setup_config')
+
+    # (min, max) accepted by the numeric Setup/Settings fields
+    _PORT_RANGE = (1024, 65535)
+    _MAX_PLAYERS_RANGE = (1, 100)
+    _RESTART_DELAY_RANGE = (5, 300)
+    _BACKUP_INTERVAL_RANGE = (15, 1440)
+    _MEMORY_RANGE = (1024, 16384)
+
+    # Shown in the Player Stats "Top Players" list until there is player data
+    _TOP_PLAYERS_PLACEHOLDER = (
+        "🥇 No players yet - start your server!",
+        "🥈 Server activity will appear here",
+        "🥉 Player statistics loading...",
+    )
+
+    # Player DB statements, kept as constants so sqlite3's statement cache reuses them
+    _SQL_CLOSE_SESSION = '''
+        UPDATE player_sessions SET 
+            session_end = ?, 
+            duration = CAST((julianday(?) - julianday(session_start)) * 86400 AS INTEGER)
+        WHERE steam_id = ? AND session_end IS NULL
+    '''
+    # Status label stylesheets, toggled by reference via _apply_style_once
+    _SS_RUNNING = "font-size: 24px; font-weight: bold; color: #50fa7b; text-align: center;"
+    _SS_OFFLINE = "font-size: 24px; font-weight: bold; color: #ff5555; text-align: center;"
+    _SS_ACTIVITY_ON = "font-size: 11px; color: #50fa7b; text-align: center;"
+    _SS_ACTIVITY_OFF = "font-size: 11px; color: #666666; text-align: center;"
+    _SS_READY = "font-size: 12px; padding: 5px; color: #50fa7b; font-weight: bold;"
+    _SS_LOADING = "font-size: 12px; padding: 5px; color: #ffb86b;"
+    _SS_RUNNING_SMALL = "font-size: 12px; padding: 5px; color: #8be9fd;"
+    _SS_STOPPED = "font-size: 12px; padding: 5px; color: #666;"
+    # Setup page "server configured" caption
+    _SS_INSTALL_OK = "color: #50fa7b; font-size: 11px;"
+    _SS_INSTALL_MISSING = "color: #ff6b6b; font-size: 11px;"
+    # Dashboard server-memory label, by share of system RAM
+    _SS_PROC_MEM_HIGH = "font-size: 11px; color: #ff6b6b; padding: 3px; background: #2b1a1a; border-radius: 3px; margin-top: 2px; font-weight: bold;"
+    _SS_PROC_MEM_MID = "font-size: 11px; color: #ffb86b; padding: 3px; background: #2b2f36; border-radius: 3px; margin-top: 2px; font-weight: bold;"
+    _SS_PROC_MEM_LOW = "font-size: 11px; color: #50fa7b; padding: 3px; background: #1a2b1a; border-radius: 3px; margin-top: 2px; font-weight: bold;"
+
+    _SQL_MARK_OFFLINE = "UPDATE players SET status = 'offline', last_seen = ?, total_playtime = ? WHERE steam_id = ?"
+
+    # Logs-tab viewers followed by LogTailer: name -> (file, view attribute, colour rules, full loader)
+    _LOG_VIEWS = {
+        'server': ('server.log', 'text_logs', _LOG_RULES_SERVER, 'tail_logs'),
+        'players': ('players.log', 'text_player_logs', _LOG_RULES_PLAYERS, 'load_player_logs'),
+        'errors': ('errors.log', 'text_error_logs', _LOG_RULES_ERRORS, 'load_error_logs'),
+        'admin': ('admin.log', 'text_admin_logs', _LOG_RULES_ADMIN, 'load_admin_logs'),
+        'events': ('events.log', 'text_events_logs', _LOG_RULES_EVENTS, 'load_events_logs'),
+    }
+
+    # Toolbar button icons, built once by _icon() and shared (Qt caches their pixmaps per size)
+    _BUTTON_ICONS = {
+        'refresh': QStyle.SP_BrowserReload,
+        'kick': QStyle.SP_MessageBoxWarning,
+        'help': QStyle.SP_MessageBoxQuestion,
+        'send': QStyle.SP_ArrowRight,
+        'folder': QStyle.SP_DirOpenIcon,
+        'detect': QStyle.SP_FileDialogContentsView,
+        'save': QStyle.SP_DialogSaveButton,
+        'backup': QStyle.SP_DriveFDIcon,
+        'visual': QStyle.SP_FileDialogDetailedView,
+        'database': QStyle.SP_DriveHDIcon,
+        'clear': QStyle.SP_DialogResetButton,
+        'export': QStyle.SP_DialogSaveButton,
+    }
+    # Setup page buttons keep their emoji look, pre-rendered once by _render_emoji_icon
+    _EMOJI_ICONS = {
+        'rocket': '🚀',
+        'download': '📥',
+        'upload': '📤',
+        'verify': '✅',
+        'search': '🔍',
+        'magnify': '🔎',
+        'test': '🧪',
+        'disk': '💾',
+        'document': '📄',
+        'game': '🎮',
+        'update': '🔄',
+        'open_folder': '📁',
+    }
+
     def __init__(self):
         super().__init__()
+        self._db_conn = None  # Shared scum_manager.db connection, see _get_db_conn()
+        # Authenticated RCON socket and the (host, port, password) it was opened with, see _get_rcon_conn()
+        self._rcon_conn = None
+        self._rcon_conn_key = None
+        # (host, port, password) used for RCON; read from the server config on first use and
+        # replaced when the Settings tab RCON fields are edited, see _get_rcon_target()
+        self._rcon_target = None
+        # Last resolved host IP for the dashboard network card, see update_network_info()
+        self._cached_ip = None
+        self._ip_resolved_at = 0.0
+        self._ip_lookup_running = False
+        self._last_styles = {}  # widget -> stylesheet last applied by _apply_style_once
+        self._last_texts = {}  # widget -> text (or bar value/format) last set by _set_text_once/_set_bar_once
+        # Parsed scum_settings.json and the mtime it was read at, reused while the file is unchanged
+        self._settings_cache = None
+        self._settings_mtime = 0
+        # ((st_mtime_ns, st_size), parsed dict) of scum_setup.json; one tuple so the
+        # build_setup worker thread and the GUI thread always see a matching pair
+        self._setup_cfg_cache = None
+        # JSON files under APP_ROOT, joined once; settings_file()/setup_config_file() hand these out
+        self._settings_path = APP_ROOT / 'scum_settings.json'
+        self._setup_cfg_path = APP_ROOT / 'scum_setup.json'
+        # Names of lazily built widgets that settings load/save may touch; each build_* adds its own
+        self._widgets_ready = set()
+        # Auto-saves are coalesced here and written off the GUI thread, see _schedule_settings_save()
+        self._save_timer = QTimer(self)
+        self._last_saved_settings = None  # what the last explicit save_settings() wrote
+        self._settings_write_lock = threading.Lock()  # serializes the GUI-thread and worker writes
+        # Each gathered snapshot gets a number: the file only ever moves to a newer one
+        # (checked under the lock) and the cache only ever takes a newer one (GUI thread)
+        self._settings_gen = 0
+        self._settings_written_gen = 0
+        self._settings_cache_gen = 0
+        # write_log keeps one buffered append handle per Logs/<type>.log and flushes them once a second;
+        # the lock covers every write, flush and close, and writes after the close are dropped
+        self._log_handles = {}
+        self._log_handles_lock = threading.Lock()
+        self._logs_closed = False
+        self._log_dirty = False
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.timeout.connect(self._flush_log_handles)
+        self._log_flush_timer.start(1000)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings_save)
+        # RCON output is buffered and appended at most once per 50 ms (see _queue_rcon_output)
+        self._rcon_buf = []
+        self._rcon_flush_timer = QTimer(self)
+        self._rcon_flush_timer.setSingleShot(True)
+        self._rcon_flush_timer.setInterval(50)
+        self._rcon_flush_timer.timeout.connect(self._flush_rcon)
+        # Setup field edits restart this timer, so a burst of keystrokes rescores the page once
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(150)
+        self._status_timer.timeout.connect(self._recompute_setup_status)
+        self._icons = {}
+        # One monospace font shared by the RCON, log and config editors; their stylesheets
+        # only set the size, so the family is resolved once here instead of per widget
+        self._mono = QFont("Consolas", 10)
+        self._mono.setStyleHint(QFont.Monospace)
+
+        # Players-tab widgets are built lazily; None until build_players runs so the
+        # refresh paths can test them directly instead of probing with hasattr
+        self.table_players = None
+        self._players_model = None
+        self.label_online_count = None
+        self.label_total_tracked = None
+        self.label_server_status = None
+        self.label_uptime_display = None
+        self.label_peak_today = None
+        self.online_activity = None
+        self.server_start_time = None
+        # In-memory mirror of the ban list: the model backs the Bans view, the set answers
+        # "is this entry banned?" in O(1). Filled from disk by populate_bans()
+        self._bans_model = BanListModel(parent=self)
+        self._bans_set = set()
+        # Dashboard Performance/Disk card widgets, built just after first paint
+        self.pb_cpu = None
+        self.pb_ram = None
+        self.pb_disk = None
+        self.label_cpu_detail = None
+        self.label_ram_detail = None
+        self.label_process_mem = None
+        self.label_disk_detail = None
+        # Logs-tab viewers other than the server log are built when their sub-tab is first shown
+        self.log_search = None
+        self.log_time_filter = None
+        self.log_level_filter = None
+        self.text_logs = None
+        self.text_player_logs = None
+        self.text_error_logs = None
+        self.text_admin_logs = None
+        self.text_events_logs = None
+        self._log_tab_builders = {}
+        self._setup_tab_builders = {}
+        self.setup_tabs = None
+        # Created on the first download/update by _ensure_download_widgets
+        self.connection_progress_bar = None
+        self.connection_status_label = None
+        self.scum_download_progress = None
+        self.setupConfigLoaded.connect(self._apply_setup_config)
+        self.installationsDetected.connect(self._apply_installation_status)
+        self.installScanFinished.connect(self._on_scan_complete)
+        self.settingsWritten.connect(self._apply_settings_written)
+        self.settingsWriteFailed.connect(self._on_settings_write_failed)
+        self._scan_cancel = None  # threading.Event of the running Auto-Detect scan
+        self._scan_done = None  # on_done callback of that scan, see auto_detect_server()
+        self._scan_progress = None
+        # Started by build_logs: LogTailer on its own thread feeds new lines to the viewers.
+        # _log_view_pos is the byte offset each viewer shows up to; appends are buffered
+        # per viewer and flushed every 100 ms
+        self._log_tail_thread = None
+        self._log_tailer = None
+        self._log_view_pos = {}
+        self._log_append_bufs = {}
+        # Parsed lines behind each log viewer as parallel lists (level, timestamp, text,
+        # lowercase text), so search/level/time filters re-render without re-reading files
+        self._log_store = {}
+        self._filter_text = None
+        self._filter_plain = ""
+        self._filter_re = None
+        self._log_append_timer = QTimer(self)
+        self._log_append_timer.setSingleShot(True)
+        self._log_append_timer.setInterval(100)
+        self._log_append_timer.timeout.connect(self._flush_log_appends)
+        self._peak_today = 0
         self.setWindowTitle("SCUM Server Manager (PySide6)")
         self.resize(1000, 700)
         self.setWindowIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
@@ -61,7 +1971,7 @@ class SCUMManager(QMainWindow):
         # Header
         self.header = QLabel("SCUM Server Manager")
         self.header.setAlignment(Qt.AlignCenter)
-        self.header.setStyleSheet("font-size: 20px; font-weight: bold; padding: 15px; background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #2b5a3a, stop:1 #0f1117); color: #e6eef6; border-bottom: 2px solid #1e8b57;")
+        _set_qss(self.header, "font-size: 20px; font-weight: bold; padding: 15px; background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #2b5a3a, stop:1 #0f1117); color: #e6eef6; border-bottom: 2px solid #1e8b57;")
 
         # Left navigation + stacked pages
         self.nav = QListWidget()
@@ -129,6 +2039,15 @@ class SCUMManager(QMainWindow):
 
         # Track which tabs have been loaded to enable lazy loading
         self._tabs_initialized = set()
+
+        # Per-row (is_online, lowercase search text) for filter_players, parallel to table_players
+        self._player_rows = []
+        # Throttle for populate_players: leading edge runs at once, later calls inside
+        # the 900 ms window collapse into one trailing run (see _schedule_populate)
+        self._last_populate = 0.0
+        self._populate_timer = QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.timeout.connect(self._do_populate)
         
         # Build ONLY dashboard initially for instant startup
         self.build_dashboard()
@@ -140,15 +2059,13 @@ class SCUMManager(QMainWindow):
         self.nav.currentRowChanged.connect(self.on_tab_changed)
         self.nav.setCurrentRow(0)
 
-        # Timer for updates & log tailing (optimized interval)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_all)
-        self.timer.start(500)  # Optimized: 500ms (2x/sec) for responsive updates
-
-        # Timer for players tab auto-refresh (optimized with event-driven updates)
-        self.players_timer = QTimer(self)
-        self.players_timer.timeout.connect(self.monitor_scum_server_logs)  # Changed: Now monitors logs instead of refreshing players
-        self.players_timer.start(1000)  # Optimized: 1 second intervals for log monitoring
+        # Single 1s tick drives both the dashboard refresh and the player log monitor,
+        # so the event loop wakes once per period; dashboard values are human-timescale
+        self._dashboard_refresh_on = True
+        self._players_refresh_on = True
+        self._master_timer = QTimer(self)
+        self._master_timer.timeout.connect(self._on_master_tick)
+        self._master_timer.start(1000)
 
         # Try auto-detect scum exe
         p = find_scum_exe()
@@ -172,6 +2089,26 @@ class SCUMManager(QMainWindow):
         # Trigger initial player detection after UI is built (for dashboard display)
         # Initial player scan will be triggered in showEvent method
 
+    def closeEvent(self, event):
+        """Release long-lived resources before the window closes"""
+        # Write out a pending debounced save now rather than dropping it
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._store_settings(self._gather_settings())
+        if self._db_conn is not None:
+            try:
+                self._db_conn.close()
+            except Exception:
+                pass
+            self._db_conn = None
+        self._drop_rcon_conn()
+        self._close_log_handles()
+        if self._log_tail_thread is not None:
+            QMetaObject.invokeMethod(self._log_tailer, "stop", Qt.BlockingQueuedConnection)
+            self._log_tail_thread.quit()
+            self._log_tail_thread.wait()
+        super().closeEvent(event)
+
     def initialize_logs(self):
         """Initialize log files with welcome messages and sample data"""
         from datetime import datetime
@@ -436,33 +2373,7 @@ class SCUMManager(QMainWindow):
             
             # Mark players as offline if they're not in current session
             online_steam_ids = set(data.get('steam_id') for data in players_dict.values())
-            cursor.execute("SELECT steam_id FROM players WHERE status = 'online'")
-            db_online = cursor.fetchall()
-            
-            for (db_steam_id,) in db_online:
-                if db_steam_id not in online_steam_ids:
-                    # Player went offline - update session end time
-                    cursor.execute('''
-                        UPDATE player_sessions SET 
-                            session_end = ?, 
-                            duration = CAST((julianday(?) - julianday(session_start)) * 86400 AS INTEGER)
-                        WHERE steam_id = ? AND session_end IS NULL
-                    ''', (current_time, current_time, db_steam_id))
-                    
-                    # Update player status and playtime
-                    cursor.execute('''
-                        SELECT SUM(duration) FROM player_sessions 
-                        WHERE steam_id = ? AND duration IS NOT NULL
-                    ''', (db_steam_id,))
-                    total_duration = cursor.fetchone()[0] or 0
-                    
-                    cursor.execute('''
-                        UPDATE players SET 
-                            status = 'offline', 
-                            last_seen = ?,
-                            total_playtime = ?
-                        WHERE steam_id = ?
-                    ''', (current_time, total_duration, db_steam_id))
+            self._mark_players_offline(cursor, online_steam_ids, current_time)
             
             conn.commit()
             conn.close()
@@ -470,6 +2381,85 @@ class SCUMManager(QMainWindow):
         except Exception as e:
             self.write_log('error', f'Failed to save player data to database: {e}', 'ERROR')
 
+    def _icon(self, name):
+        """Shared QIcon for a _BUTTON_ICONS or _EMOJI_ICONS entry"""
+        icon = self._icons.get(name)
+        if icon is None:
+            if name in self._EMOJI_ICONS:
+                icon = _render_emoji_icon(self._EMOJI_ICONS[name])
+            else:
+                icon = self.style().standardIcon(self._BUTTON_ICONS[name])
+            self._icons[name] = icon
+        return icon
+
+    def _set_status_state(self, label, state):
+        """Recolour a statusPill label by switching its "state" property (rules live in APP_QSS)"""
+        if label.property("state") == state:
+            return
+        label.setProperty("state", state)
+        # Property selectors are only re-evaluated on a re-polish
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    def _apply_style_once(self, widget, stylesheet):
+        """setStyleSheet only when it differs from the last one applied, skipping Qt's re-parse"""
+        if self._last_styles.get(widget) is not stylesheet:
+            _set_qss(widget, stylesheet)
+            self._last_styles[widget] = stylesheet
+
+    def _set_text_once(self, widget, text):
+        """setText only when the text changed since the last refresh tick"""
+        if self._last_texts.get(widget) != text:
+            widget.setText(text)
+            self._last_texts[widget] = text
+
+    def _set_bar_once(self, bar, value, fmt):
+        """Update a progress bar's value/format only when either changed"""
+        state = (value, fmt)
+        if self._last_texts.get(bar) != state:
+            bar.setValue(value)
+            bar.setFormat(fmt)
+            self._last_texts[bar] = state
+
+    def _get_db_conn(self):
+        """Return the shared scum_manager.db connection, opening it on first use.
+
+        WAL mode lets the Player Stats/DB viewer read while we write, and
+        synchronous=NORMAL drops the per-commit fsync on the refresh path.
+        """
+        if self._db_conn is None:
+            conn = sqlite3.connect(str(APP_ROOT / 'scum_manager.db'), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            self._db_conn = conn
+        return self._db_conn
+
+    def _mark_players_offline(self, cursor, online_steam_ids, current_time):
+        """Close sessions and update playtime for players no longer online.
+
+        Runs one aggregate SUM for all departed players and batches the
+        updates with executemany instead of two queries per player.
+        """
+        cursor.execute("SELECT steam_id FROM players WHERE status = 'online'")
+        went_offline = [sid for (sid,) in cursor.fetchall() if sid not in online_steam_ids]
+        if not went_offline:
+            return
+        
+        # Player went offline - update session end time
+        cursor.executemany(self._SQL_CLOSE_SESSION, [(current_time, current_time, sid) for sid in went_offline])
+        
+        # Total playtime for every departed player in a single query
+        placeholders = ','.join('?' * len(went_offline))
+        cursor.execute(f'''
+            SELECT steam_id, COALESCE(SUM(duration), 0) FROM player_sessions 
+            WHERE steam_id IN ({placeholders}) AND duration IS NOT NULL
+            GROUP BY steam_id
+        ''', went_offline)
+        totals = dict(cursor.fetchall())
+        
+        cursor.executemany(self._SQL_MARK_OFFLINE, [(current_time, totals.get(sid, 0), sid) for sid in went_offline])
+
     def _update_dashboard_counts(self):
         """Update dashboard player counts from database"""
         try:
@@ -480,8 +2470,7 @@ class SCUMManager(QMainWindow):
                 self.write_log('info', f'📊 Database not found, skipping dashboard update', 'INFO')
                 return
             
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
+            cursor = self._get_db_conn().cursor()
             
             # Get online count
             cursor.execute("SELECT COUNT(*) FROM players WHERE status = 'online'")
@@ -491,31 +2480,29 @@ class SCUMManager(QMainWindow):
             cursor.execute("SELECT COUNT(*) FROM players")
             total_count = cursor.fetchone()[0]
             
-            conn.close()
-            
             self.write_log('info', f'📊 Database counts: {online_count} online, {total_count} total', 'INFO')
             
             # Update dashboard labels if they exist
-            if hasattr(self, 'label_online_count'):
+            if self.label_online_count is not None:
                 self.label_online_count.setText(str(online_count))
                 self.write_log('info', f'📊 Updated label_online_count to: {online_count}', 'INFO')
             else:
                 self.write_log('info', f'📊 label_online_count does not exist yet (lazy loading)', 'INFO')
             
-            if hasattr(self, 'label_total_tracked'):
+            if self.label_total_tracked is not None:
                 self.label_total_tracked.setText(f"Total Tracked: {total_count}")
                 self.write_log('info', f'📊 Updated label_total_tracked to: {total_count}', 'INFO')
             else:
                 self.write_log('info', f'📊 label_total_tracked does not exist yet (lazy loading)', 'INFO')
             
             # Update activity indicator
-            if hasattr(self, 'online_activity'):
+            if self.online_activity is not None:
                 if online_count > 0:
                     self.online_activity.setText("⚡ Real-time updates active")
-                    self.online_activity.setStyleSheet("font-size: 11px; color: #50fa7b; text-align: center;")
+                    self._apply_style_once(self.online_activity, self._SS_ACTIVITY_ON)
                 else:
                     self.online_activity.setText("⏸️ Waiting for players")
-                    self.online_activity.setStyleSheet("font-size: 11px; color: #666666; text-align: center;")
+                    self._apply_style_once(self.online_activity, self._SS_ACTIVITY_OFF)
                 self.write_log('info', f'📊 Updated online_activity indicator', 'INFO')
             else:
                 self.write_log('info', f'📊 online_activity does not exist yet (lazy loading)', 'INFO')
@@ -524,145 +2511,13 @@ class SCUMManager(QMainWindow):
             self.write_log('error', f'Failed to update dashboard counts: {e}', 'ERROR')
 
     def apply_style(self):
-        qss = """
-        QWidget {
-            background: #0f1117;
-            color: #e6eef6;
-            font-family: 'Segoe UI', Tahoma, Arial;
-        }
-        QListWidget {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #0b0d12, stop:1 #1a1d23);
-            border-right: 2px solid #23252b;
-            border-radius: 0px;
-            selection-background-color: transparent;
-        }
-        QListWidget::item {
-            padding: 15px;
-            border-bottom: 1px solid #23252b;
-            border-left: 3px solid transparent;
-        }
-        QListWidget::item:selected {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e8b57, stop:1 #35c06f);
-            color: #ffffff;
-            border-left: 4px solid #ffffff;
-            border-radius: 0px;
-            font-weight: bold;
-        }
-        QListWidget::item:selected:active {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #4ade80);
-        }
-        QListWidget::item:hover {
-            background: #2b2f36;
-            border-left: 3px solid #ffb86b;
-        }
-        QListWidget::item:selected:hover {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #6ef08b);
-            border-left: 4px solid #ffb86b;
-        }
-        QListWidget::item:focus {
-            border-left: 3px solid #bd93f9;
-        }
-        QGroupBox {
-            border: 2px solid #2b2f36;
-            margin-top: 6px;
-            padding: 15px;
-            border-radius: 10px;
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a1d23, stop:1 #0f1117);
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            color: #e6eef6;
-            font-weight: bold;
-        }
-        QPushButton {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
-            color: #072018;
-            padding: 10px 16px;
-            border-radius: 8px;
-            border: 1px solid #2b2f36;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
-        }
-        QPushButton:pressed {
-            background: #1e8b57;
-        }
-        QPushButton:disabled {
-            background: #666;
-            color: #ddd;
-        }
-        QTableWidget {
-            background: #0d1016;
-            border: 1px solid #2b2f36;
-            border-radius: 5px;
-            gridline-color: #23252b;
-            selection-background-color: transparent;
-        }
-        QTableWidget::item {
-            padding: 8px;
-            border-bottom: 1px solid #23252b;
-            border-right: 1px solid #23252b;
-            background: transparent;
-        }
-        QTableWidget::item:selected {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e8b57, stop:1 #35c06f);
-            color: #ffffff;
-            border: 2px solid #4ade80;
-            border-radius: 3px;
-            font-weight: bold;
-        }
-        QTableWidget::item:selected:active {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #4ade80);
-        }
-        QTableWidget::item:hover {
-            background: #2b2f36;
-            border: 1px solid #ffb86b;
-        }
-        QTableWidget::item:selected:hover {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #6ef08b);
-            border: 2px solid #ffb86b;
-        }
-        QTableWidget::item:focus {
-            border: 2px solid #bd93f9;
-        }
-        QTableWidget QHeaderView::section {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a1d23, stop:1 #2b2f36);
-            color: #e6eef6;
-            padding: 8px;
-            border: 1px solid #23252b;
-            font-weight: bold;
-            border-radius: 0px;
-        }
-        QTableWidget QHeaderView::section:hover {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #2b2f36, stop:1 #3b3f46);
-            border: 1px solid #ffb86b;
-        }
-        QProgressBar {
-            background: #081018;
-            border: 2px solid #1f2a2a;
-            border-radius: 8px;
-            text-align: center;
-            color: #e6eef6;
-        }
-        QProgressBar::chunk {
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6ef08b, stop:1 #2fbf57);
-            border-radius: 6px;
-        }
-        QLineEdit {
-            background: #0d1016;
-            border: 1px solid #2b2f36;
-            border-radius: 5px;
-            padding: 5px;
-            color: #e6eef6;
-        }
-        QLineEdit:focus {
-            border: 1px solid #1e8b57;
-        }
-        """
-        self.setStyleSheet(qss)
+        # One window-wide sheet; every child inherits it, so per-widget rules live here too.
+        # The UI family is a window font rather than a QWidget rule so that widgets given
+        # self._mono keep it (a sheet font-family would override setFont on every child)
+        ui_font = self.font()
+        ui_font.setFamilies(["Segoe UI", "Tahoma", "Arial"])
+        self.setFont(ui_font)
+        _set_qss(self, APP_QSS)
 
     # --- page builders ---
     def pick_scum(self):
@@ -677,7 +2532,7 @@ class SCUMManager(QMainWindow):
                 self.setup_label_path.setText(f"✅ {Path(fn).name}")
             if hasattr(self, 'install_status'):
                 self.install_status.setText("✅ Server configured")
-                self.install_status.setStyleSheet("color: #50fa7b; font-size: 11px;")
+                _set_qss(self.install_status, self._SS_INSTALL_OK)
             # Update setup status
             if hasattr(self, 'update_setup_status'):
                 self.update_setup_status()
@@ -701,7 +2556,7 @@ class SCUMManager(QMainWindow):
             self.last_log_position = 0
             
             # Update status to show starting
-            self.label_status.setText("Status: Starting... ⏳")
+            self._set_text_once(self.label_status, "Status: Starting... ⏳")
             self.status_bar.showMessage("🚀 Server starting - monitoring for ready state...")
             
             self.refresh_all()
@@ -817,37 +2672,203 @@ class SCUMManager(QMainWindow):
     def set_logs_text(self, data: str, auto_scroll=True):
         # simple colorization for ERROR/WARNING/INFO
         # Guard: Check if logs UI has been built yet (lazy loading)
-        if not hasattr(self, 'text_logs') or self.text_logs is None:
+        if self.text_logs is None:
             return
-        
-        import html
-        lines = []
-        for L in data.splitlines():
-            esc = html.escape(L)
-            color = None
-            if "error" in L.lower():
-                color = "#ff6b6b"
-            elif "warn" in L.lower():
-                color = "#ffb86b"
-            elif "info" in L.lower():
-                color = "#8be9fd"
-            if color:
-                lines.append(f"<span style='color:{color}'>{esc}</span>")
+        # Read without an offset, so the next tailed batch triggers a tail_logs reload instead
+        self._log_view_pos.pop('server', None)
+        self._load_log_view('server', data.splitlines(), auto_scroll)
+
+    def _store_log_lines(self, name, lines, replace):
+        """Record lines behind a log viewer and return the ones the active filters let through"""
+        store = None if replace else self._log_store.get(name)
+        if store is None:
+            store = self._log_store[name] = ([], [], [], [])
+        levels, stamps, texts, lowered = store
+        for line in lines:
+            m = _LOG_LINE_RE.match(line)
+            if m:
+                levels.append(_LOG_LEVEL_NAMES.get((m.group(2) or m.group(3)).upper(), ''))
+                stamps.append(m.group(1))
             else:
-                lines.append(esc)
-        html_text = "<pre style='font-family: Consolas, monospace; font-size: 11px; line-height: 1.4;'>{}</pre>".format("\n".join(lines))
-        
-        # Check if user is at the bottom BEFORE updating content
-        scrollbar = self.text_logs.verticalScrollBar()
-        # Only consider "at bottom" if scrollbar is at the VERY end (within 1 pixel)
-        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 1
-        
-        self.text_logs.setHtml(html_text)
-        
+                levels.append('')
+                stamps.append('')
+            texts.append(line)
+            lowered.append(line.lower())
+        if len(texts) > LOG_VIEW_MAX_LINES:
+            for column in store:
+                del column[:-LOG_VIEW_MAX_LINES]
+        start = len(texts) - len(lines) if not replace else 0
+        return self._filtered_log_lines(store, max(start, 0))
+
+    def _filtered_log_lines(self, store, start=0):
+        """Lines of a log store from `start` that pass the search, level and time filters"""
+        levels, stamps, texts, lowered = store
+        plain, pattern = self._log_search_matcher()
+        level = self.log_level_filter.currentText() if self.log_level_filter is not None else "All"
+        cutoff = self._log_time_cutoff()
+        if not plain and pattern is None and level == "All" and cutoff is None:
+            return texts[start:]
+        out = []
+        for i in range(start, len(texts)):
+            if level != "All" and levels[i] != level:
+                continue
+            if cutoff is not None and stamps[i] < cutoff:
+                continue  # Timestamps are "YYYY-MM-DD HH:MM:SS", so string order is time order
+            if plain and plain not in lowered[i]:
+                continue
+            if pattern is not None and not pattern.search(texts[i]):
+                continue
+            out.append(texts[i])
+        return out
+
+    def _log_search_matcher(self):
+        """(plain lowercase needle, compiled pattern) for the search box, rebuilt only when the text changes"""
+        text = self.log_search.text() if self.log_search is not None else ""
+        if text != self._filter_text:
+            self._filter_text = text
+            self._filter_plain, self._filter_re = text.lower(), None
+            if _REGEX_META.intersection(text):
+                try:
+                    self._filter_plain, self._filter_re = "", re.compile(text, re.IGNORECASE)
+                except re.error:
+                    pass  # Not a valid pattern; search for it literally
+        return self._filter_plain, self._filter_re
+
+    def _log_time_cutoff(self):
+        """Oldest timestamp string the time-range filter keeps, or None for All Time"""
+        if self.log_time_filter is None:
+            return None
+        time_range = self.log_time_filter.currentText()
+        now = datetime.now()
+        if time_range == "Today":
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        else:
+            hours = {"Last Hour": 1, "Last 6 Hours": 6, "Last 24 Hours": 24, "Last 7 Days": 168}.get(time_range)
+            if hours is None:
+                return None
+            start = datetime.fromtimestamp(now.timestamp() - hours * 3600)
+        return start.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _load_log_view(self, name, lines, auto_scroll=True):
+        """Replace a log viewer's lines, showing those that pass the active filters"""
+        _, attr, rules, _ = self._LOG_VIEWS[name]
+        self._fill_log_view(getattr(self, attr), self._store_log_lines(name, lines, replace=True), rules, auto_scroll)
+
+    def _apply_log_filters(self):
+        """Re-render every built log viewer from its stored lines"""
+        for name, store in self._log_store.items():
+            _, attr, rules, _ = self._LOG_VIEWS[name]
+            view = getattr(self, attr)
+            if view is not None:
+                self._fill_log_view(view, self._filtered_log_lines(store), rules)
+
+    def _fill_log_view(self, view, lines, rules, auto_scroll=True):
+        """Replace a log view's contents with coloured lines in a single edit block"""
+        self._write_log_view(view, lines, rules, auto_scroll, replace=True)
+
+    def _append_log_view(self, view, lines, rules):
+        """Append coloured lines to the end of a log view in a single edit block"""
+        self._write_log_view(view, lines, rules, True, replace=False)
+
+    def _write_log_view(self, view, lines, rules, auto_scroll, replace):
+        """Insert coloured lines into a log view.
+
+        Consecutive lines sharing a format are inserted as one chunk, so a write
+        costs one layout pass instead of one per line as with setHtml.
+        """
+        rule_list, (default_color, default_prefix, default_bold) = rules
+
+        # Check if user is at the bottom BEFORE updating content (plain text scrolls by line)
+        scrollbar = view.verticalScrollBar()
+        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 2
+
+        chunks = []  # [((colour, bold), [lines])]
+        for line in lines[-LOG_VIEW_MAX_LINES:]:
+            low = line.lower()
+            color, prefix, bold = default_color, default_prefix, default_bold
+            for keywords, rule_color, rule_prefix, rule_bold in rule_list:
+                if any(k in low for k in keywords):
+                    color, prefix, bold = rule_color, rule_prefix, rule_bold
+                    break
+            if chunks and chunks[-1][0] == (color, bold):
+                chunks[-1][1].append(prefix + line)
+            else:
+                chunks.append(((color, bold), [prefix + line]))
+
+        formats = {}
+        # No repaints between clearing and the last insert
+        view.setUpdatesEnabled(False)
+        try:
+            if replace:
+                view.clear()
+            need_break = not view.document().isEmpty()
+            cursor = QTextCursor(view.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.beginEditBlock()
+            for key, chunk in chunks:
+                fmt = formats.get(key)
+                if fmt is None:
+                    fmt = QTextCharFormat()
+                    if key[0]:
+                        fmt.setForeground(QColor(key[0]))
+                    if key[1]:
+                        fmt.setFontWeight(QFont.Bold)
+                    formats[key] = fmt
+                cursor.insertText(("\n" if need_break else "") + "\n".join(chunk), fmt)
+                need_break = True
+            cursor.endEditBlock()
+        finally:
+            view.setUpdatesEnabled(True)
+
         # ONLY auto-scroll if user was truly at the bottom
         if auto_scroll and was_at_bottom:
             QTimer.singleShot(50, lambda: scrollbar.setValue(scrollbar.maximum()))
 
+    def _start_log_tailer(self):
+        """Follow the Logs/ files on a worker thread; new lines arrive via _on_log_lines_ready"""
+        if self._log_tail_thread is not None:
+            return
+        logs_dir = APP_ROOT / "Logs"
+        self._log_tailer = LogTailer({name: logs_dir / spec[0] for name, spec in self._LOG_VIEWS.items()},
+                                     self._log_view_pos)
+        self._log_tail_thread = QThread(self)
+        self._log_tailer.moveToThread(self._log_tail_thread)
+        self._log_tail_thread.started.connect(self._log_tailer.start)
+        self._log_tail_thread.finished.connect(self._log_tailer.deleteLater)
+        # Cross-thread, so delivered queued on the GUI thread
+        self._log_tailer.linesReady.connect(self._on_log_lines_ready)
+        self._log_tail_thread.start()
+
+    @Slot(str, object, object, list)
+    def _on_log_lines_ready(self, name, start, end, lines):
+        _, attr, _, loader = self._LOG_VIEWS[name]
+        if getattr(self, attr) is None:
+            return  # Viewer not built yet; it reads the whole file when it is
+        pos = self._log_view_pos.get(name)
+        if start is not None and pos is not None and end <= pos:
+            return  # Already part of the last full load
+        if start is None or pos != start:
+            # The batch doesn't continue the view (file truncated, view reloaded mid-line,
+            # or an empty placeholder is showing), so reload the tail from disk
+            self.log_mtimes[name] = 0
+            self._log_append_bufs.pop(name, None)
+            getattr(self, loader)()
+            return
+        self._log_view_pos[name] = end
+        self._log_append_bufs.setdefault(name, []).extend(lines)
+        if not self._log_append_timer.isActive():
+            self._log_append_timer.start()
+
+    def _flush_log_appends(self):
+        bufs, self._log_append_bufs = self._log_append_bufs, {}
+        for name, lines in bufs.items():
+            _, attr, rules, _ = self._LOG_VIEWS[name]
+            view = getattr(self, attr)
+            if view is not None and lines:
+                lines = self._store_log_lines(name, lines, replace=False)
+                if lines:
+                    self._append_log_view(view, lines, rules)
+
     def tail_logs(self, max_lines=1000):
         logs = APP_ROOT / "Logs" / "server.log"
         if not logs.exists():
@@ -863,10 +2884,8 @@ class SCUMManager(QMainWindow):
             pass
         
         try:
-            with logs.open("r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-            last = "".join(lines[-max_lines:])
-            self.set_logs_text(last)
+            lines, self._log_view_pos['server'] = _read_log_tail(logs, max_lines)
+            self._load_log_view('server', lines)
         except Exception:
             pass
     
@@ -974,10 +2993,7 @@ class SCUMManager(QMainWindow):
                         
                         # Save to database immediately
                         try:
-                            import sqlite3
-                            from datetime import datetime
-                            db_path = APP_ROOT / 'scum_manager.db'
-                            conn = sqlite3.connect(str(db_path))
+                            conn = self._get_db_conn()
                             cursor = conn.cursor()
                             
                             # Use real Steam ID if available, otherwise generate pseudo ID
@@ -991,7 +3007,6 @@ class SCUMManager(QMainWindow):
                             ''', (steam_id, player_name, player_name, ip_address, timestamp, timestamp))
                             
                             conn.commit()
-                            conn.close()
                             
                             self.write_log('info', f'💾 Player saved to database successfully', 'INFO')
                             
@@ -1017,10 +3032,7 @@ class SCUMManager(QMainWindow):
                         
                         # Update database status to offline
                         try:
-                            import sqlite3
-                            from datetime import datetime
-                            db_path = APP_ROOT / 'scum_manager.db'
-                            conn = sqlite3.connect(str(db_path))
+                            conn = self._get_db_conn()
                             cursor = conn.cursor()
                             
                             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -1031,7 +3043,6 @@ class SCUMManager(QMainWindow):
                             ''', (timestamp, player_name))
                             
                             conn.commit()
-                            conn.close()
                             
                             # Update dashboard
                             self._update_dashboard_counts()
@@ -1059,8 +3070,8 @@ class SCUMManager(QMainWindow):
 
             # If player state changed and we're on the players tab, refresh immediately
             if player_state_changed and self.stack.currentIndex() == 1:  # Players tab index
-                # Use QTimer to refresh on the main thread (avoid threading issues)
-                QTimer.singleShot(100, self.populate_players)
+                # Coalesce bursts of log events into one refresh on the main thread
+                self._schedule_populate()
 
         except Exception as e:
             # Silently handle errors to avoid spam
@@ -1133,7 +3144,7 @@ class SCUMManager(QMainWindow):
                     self.write_log('events', 'Server fully loaded and accepting player connections', 'INFO')
 
                     # Update UI
-                    self.label_status.setText(f"Status: Online ✅ (PID {self.server_pid})")
+                    self._set_text_once(self.label_status, f"Status: Online ✅ (PID {self.server_pid})")
                     self.status_bar.showMessage("✅ Server is READY! Players can now join.")
 
                     # Show notification with auto-launch option (only once)
@@ -1180,28 +3191,28 @@ class SCUMManager(QMainWindow):
         if pid:
             self.server_pid = pid
             if self.server_ready:
-                self.label_status.setText(f"🟢 Online (PID {pid})")
+                self._set_text_once(self.label_status, f"🟢 Online (PID {pid})")
                 if hasattr(self, 'label_ready_status'):
-                    self.label_ready_status.setText("✅ Ready: Players can join!")
-                    self.label_ready_status.setStyleSheet("font-size: 12px; padding: 5px; color: #50fa7b; font-weight: bold;")
+                    self._set_text_once(self.label_ready_status, "✅ Ready: Players can join!")
+                    self._apply_style_once(self.label_ready_status, self._SS_READY)
             elif self.server_starting:
-                self.label_status.setText(f"🟡 Starting... (PID {pid})")
+                self._set_text_once(self.label_status, f"🟡 Starting... (PID {pid})")
                 if hasattr(self, 'label_ready_status'):
-                    self.label_ready_status.setText("⏳ Loading: Please wait...")
-                    self.label_ready_status.setStyleSheet("font-size: 12px; padding: 5px; color: #ffb86b;")
+                    self._set_text_once(self.label_ready_status, "⏳ Loading: Please wait...")
+                    self._apply_style_once(self.label_ready_status, self._SS_LOADING)
             else:
-                self.label_status.setText(f"🟢 Running (PID {pid})")
+                self._set_text_once(self.label_status, f"🟢 Running (PID {pid})")
                 if hasattr(self, 'label_ready_status'):
-                    self.label_ready_status.setText("🔄 Status: Running")
-                    self.label_ready_status.setStyleSheet("font-size: 12px; padding: 5px; color: #8be9fd;")
+                    self._set_text_once(self.label_ready_status, "🔄 Status: Running")
+                    self._apply_style_once(self.label_ready_status, self._SS_RUNNING_SMALL)
         else:
             self.server_pid = None
             self.server_ready = False
             self.server_starting = False
-            self.label_status.setText("🔴 Offline")
+            self._set_text_once(self.label_status, "🔴 Offline")
             if hasattr(self, 'label_ready_status'):
-                self.label_ready_status.setText("⭕ Offline: Server not running")
-                self.label_ready_status.setStyleSheet("font-size: 12px; padding: 5px; color: #666;")
+                self._set_text_once(self.label_ready_status, "⭕ Offline: Server not running")
+                self._apply_style_once(self.label_ready_status, self._SS_STOPPED)
 
         # Check server readiness if starting
         if self.server_starting and not self.server_ready:
@@ -1224,7 +3235,7 @@ class SCUMManager(QMainWindow):
         # Process uptime if running
         if self.server_pid:
             up = get_process_uptime(self.server_pid)
-            self.label_uptime.setText(f"⏱️ {up}")
+            self._set_text_once(self.label_uptime, f"⏱️ {up}")
             
             # Server memory monitoring (only if server running)
             try:
@@ -1232,66 +3243,58 @@ class SCUMManager(QMainWindow):
                 proc_mem_gb = proc.memory_info().rss / (1024**3)
                 proc_mem_percent = (proc_mem_gb / mem_total_gb * 100) if mem_total_gb > 0 else 0
                 
-                if hasattr(self, 'label_process_mem'):
-                    self.label_process_mem.setText(f"Server: {proc_mem_gb:.2f} GB ({proc_mem_percent:.1f}%)")
+                if self.label_process_mem is not None:
+                    self._set_text_once(self.label_process_mem, f"Server: {proc_mem_gb:.2f} GB ({proc_mem_percent:.1f}%)")
                     # Color code based on usage
                     if proc_mem_percent > 50:
-                        self.label_process_mem.setStyleSheet("font-size: 11px; color: #ff6b6b; padding: 3px; background: #2b1a1a; border-radius: 3px; margin-top: 2px; font-weight: bold;")
+                        self._apply_style_once(self.label_process_mem, self._SS_PROC_MEM_HIGH)
                     elif proc_mem_percent > 25:
-                        self.label_process_mem.setStyleSheet("font-size: 11px; color: #ffb86b; padding: 3px; background: #2b2f36; border-radius: 3px; margin-top: 2px; font-weight: bold;")
+                        self._apply_style_once(self.label_process_mem, self._SS_PROC_MEM_MID)
                     else:
-                        self.label_process_mem.setStyleSheet("font-size: 11px; color: #50fa7b; padding: 3px; background: #1a2b1a; border-radius: 3px; margin-top: 2px; font-weight: bold;")
+                        self._apply_style_once(self.label_process_mem, self._SS_PROC_MEM_LOW)
             except:
-                if hasattr(self, 'label_process_mem'):
-                    self.label_process_mem.setText("Server Memory: N/A")
+                if self.label_process_mem is not None:
+                    self._set_text_once(self.label_process_mem, "Server Memory: N/A")
         else:
-            self.label_uptime.setText("⏱️ Not running")
-            if hasattr(self, 'label_process_mem'):
-                self.label_process_mem.setText("Server Memory: N/A")
+            self._set_text_once(self.label_uptime, "⏱️ Not running")
+            if self.label_process_mem is not None:
+                self._set_text_once(self.label_process_mem, "Server Memory: N/A")
 
-        # Update progress bars (fast operations)
-        self.pb_cpu.setValue(int(cpu))
-        self.pb_cpu.setFormat(f"{cpu:.1f}%")
-        
-        # Update CPU details with simplified structure
-        if hasattr(self, 'label_cpu_detail'):
+        # Update progress bars (fast operations); the cards may not be built yet on the first tick
+        if self.pb_cpu is not None:
+            self._set_bar_once(self.pb_cpu, int(cpu), f"{cpu:.1f}%")
+            
+            # Update CPU details with simplified structure
             cpu_info = f"CPU: {cpu:.1f}% ({cpu_count} cores)"
             if cpu_freq > 0:
                 cpu_info += f" | Speed: {cpu_freq:.0f} MHz"
-            self.label_cpu_detail.setText(cpu_info)
-        
-        # Update RAM
-        self.pb_ram.setValue(int(ram))
-        self.pb_ram.setFormat(f"{mem_used_gb:.1f}/{mem_total_gb:.1f} GB ({ram:.0f}%)")
-        
-        if hasattr(self, 'label_ram_detail'):
-            self.label_ram_detail.setText(f"Available: {mem_available_gb:.1f} GB | In Use: {mem_used_gb:.1f} GB")
+            self._set_text_once(self.label_cpu_detail, cpu_info)
+            
+            # Update RAM
+            self._set_bar_once(self.pb_ram, int(ram), f"{mem_used_gb:.1f}/{mem_total_gb:.1f} GB ({ram:.0f}%)")
+            self._set_text_once(self.label_ram_detail, f"Available: {mem_available_gb:.1f} GB | In Use: {mem_used_gb:.1f} GB")
         
         # Update Disk
-        self.pb_disk.setValue(int(disk))
-        disk_free_gb = metrics.get('disk_free_gb', 0)
-        disk_total_gb = metrics.get('disk_total_gb', 0)
-        disk_used_gb = disk_total_gb - disk_free_gb
-        self.pb_disk.setFormat(f"{disk_used_gb:.0f}/{disk_total_gb:.0f} GB ({disk:.0f}%)")
-        
-        if hasattr(self, 'label_disk_detail'):
-            self.label_disk_detail.setText(f"Free: {disk_free_gb:.0f} GB | Total: {disk_total_gb:.0f} GB")
+        if self.pb_disk is not None:
+            disk_free_gb = metrics.get('disk_free_gb', 0)
+            disk_total_gb = metrics.get('disk_total_gb', 0)
+            disk_used_gb = disk_total_gb - disk_free_gb
+            self._set_bar_once(self.pb_disk, int(disk), f"{disk_used_gb:.0f}/{disk_total_gb:.0f} GB ({disk:.0f}%)")
+            self._set_text_once(self.label_disk_detail, f"Free: {disk_free_gb:.0f} GB | Total: {disk_total_gb:.0f} GB")
 
         # Update players count - lightweight (event-driven updates handle this)
         if hasattr(self, 'label_players'):
             # Player count will be updated by populate_players when triggered by events
             pass
 
-        # Update player counts on dashboard refresh (every 500ms)
+        # Update player counts on dashboard refresh (every second)
         # This ensures dashboard shows current player data even without log events
-        if hasattr(self, 'label_online_count') and hasattr(self, 'label_total_tracked'):
+        if self.label_online_count is not None and self.label_total_tracked is not None:
             try:
                 # Quick player count update without full table refresh
                 db_path = APP_ROOT / "scum_manager.db"
                 if db_path.exists():
-                    import sqlite3
-                    conn = sqlite3.connect(str(db_path))
-                    cursor = conn.cursor()
+                    cursor = self._get_db_conn().cursor()
                     
                     # Get online count
                     cursor.execute("SELECT COUNT(*) FROM players WHERE status = 'online'")
@@ -1301,46 +3304,56 @@ class SCUMManager(QMainWindow):
                     cursor.execute("SELECT COUNT(*) FROM players")
                     total_count = cursor.fetchone()[0]
                     
-                    conn.close()
-                    
                     self.label_online_count.setText(str(online_count))
                     self.label_total_tracked.setText(f"Total Tracked: {total_count}")
                     
                     # Update peak players today
-                    if hasattr(self, 'label_peak_today'):
-                        if not hasattr(self, '_peak_today'):
-                            self._peak_today = 0
+                    if self.label_peak_today is not None:
                         self._peak_today = max(self._peak_today, online_count)
                         self.label_peak_today.setText(f"Peak Today: {self._peak_today}")
                     
                     # Update online activity indicator
-                    if hasattr(self, 'online_activity'):
+                    if self.online_activity is not None:
                         if online_count > 0:
                             self.online_activity.setText("⚡ Real-time updates active")
-                            self.online_activity.setStyleSheet("font-size: 11px; color: #50fa7b; text-align: center;")
+                            self._apply_style_once(self.online_activity, self._SS_ACTIVITY_ON)
                         else:
                             self.online_activity.setText("⏸️ Waiting for players")
-                            self.online_activity.setStyleSheet("font-size: 11px; color: #666666; text-align: center;")
+                            self._apply_style_once(self.online_activity, self._SS_ACTIVITY_OFF)
                 else:
                     # No database yet, show zeros
                     self.label_online_count.setText("0")
                     self.label_total_tracked.setText("Total Tracked: 0")
-                    if hasattr(self, 'label_peak_today'):
+                    if self.label_peak_today is not None:
                         self.label_peak_today.setText("Peak Today: 0")
-                    if hasattr(self, 'online_activity'):
+                    if self.online_activity is not None:
                         self.online_activity.setText("⏸️ Waiting for players")
-                        self.online_activity.setStyleSheet("font-size: 11px; color: #666666; text-align: center;")
+                        self._apply_style_once(self.online_activity, self._SS_ACTIVITY_OFF)
                         
             except Exception as e:
                 # Silently handle database errors
                 pass
 
     # --- players ---
+    def _schedule_populate(self):
+        """Throttled populate_players: run now if idle for 900 ms, else once at the end of the window"""
+        if self._populate_timer.isActive():
+            return
+        wait_ms = int(900 - (time.monotonic() - self._last_populate) * 1000)
+        if wait_ms <= 0:
+            self._do_populate()
+        else:
+            self._populate_timer.start(wait_ms)
+
+    def _do_populate(self):
+        self._last_populate = time.monotonic()
+        self.populate_players()
+
     def populate_players(self):
         """Parse actual SCUM server logs to track player join/disconnect events with detailed info and database persistence"""
         
         # CRITICAL: Skip if players tab UI hasn't been built yet (lazy loading)
-        if not hasattr(self, 'table_players'):
+        if self.table_players is None:
             return
         
         players = {}
@@ -1378,9 +3391,7 @@ class SCUMManager(QMainWindow):
             current_time = time.time()
             if not hasattr(self, '_offline_players_cache') or (current_time - self._offline_players_cache.get('time', 0)) > 30:  # Cache for 30 seconds
                 try:
-                    import sqlite3
-                    conn = sqlite3.connect(str(db_path))
-                    cursor = conn.cursor()
+                    cursor = self._get_db_conn().cursor()
                     
                     cursor.execute('''
                         SELECT steam_id, display_name, char_name, ip_address, first_seen, last_seen, 
@@ -1407,8 +3418,6 @@ class SCUMManager(QMainWindow):
                             'ban_reason': ban_reason
                         }
                     
-                    conn.close()
-                    
                     # Cache the results
                     self._offline_players_cache = {'time': current_time, 'data': offline_players}
                     
@@ -1418,25 +3427,16 @@ class SCUMManager(QMainWindow):
             
             players = self._offline_players_cache['data'].copy()
             
-            self.table_players.setRowCount(0)
-            self.table_players.insertRow(0)
-            no_server_msg = QTableWidgetItem("⭕ Server is OFFLINE - Showing saved player data")
-            no_server_msg.setForeground(QColor('#ffb86b'))
-            no_server_msg.setFont(QFont('Segoe UI', 12, QFont.Bold))
-            self.table_players.setItem(0, 0, no_server_msg)
-            self.table_players.setSpan(0, 0, 1, 7)
+            self._show_players_message("⭕ Server is OFFLINE - Showing saved player data",
+                                       PlayersModel.C_CHAR, self._players_model.font_notice, span=7)
             # Update counts to 0 for online
-            if hasattr(self, 'label_online_count'):
+            if self.label_online_count is not None:
                 self.label_online_count.setText("0")
             return
         
         if not self.scum_path:
-            self.table_players.setRowCount(0)
-            self.table_players.insertRow(0)
-            no_server_msg = QTableWidgetItem("⚠️ Server path not configured - please set up SCUM server first")
-            no_server_msg.setForeground(QColor('#ffb86b'))
-            self.table_players.setItem(0, 0, no_server_msg)
-            self.table_players.setSpan(0, 0, 1, 7)
+            self._show_players_message("⚠️ Server path not configured - please set up SCUM server first",
+                                       PlayersModel.C_CHAR, span=7)
             return
         
         # Find SCUM server log directory - CACHE THIS PATH
@@ -1480,7 +3480,6 @@ class SCUMManager(QMainWindow):
                         full_content = f.read()
                         
                         import re
-                        from datetime import datetime
                         
                         # Parse the entire log file to find all player events
                         all_lines = full_content.splitlines()
@@ -1594,7 +3593,6 @@ class SCUMManager(QMainWindow):
                     content = f.read()
                     
                     import re
-                    from datetime import datetime
                     
                     # OPTIMIZED: Process only the most recent 1000 lines
                     # This ensures we get the latest player activity
@@ -1708,8 +3706,8 @@ class SCUMManager(QMainWindow):
                         players[display_name] = data
                     
                     # Save current online players to database
+                    conn = self._get_db_conn()
                     try:
-                        conn = sqlite3.connect(str(db_path))
                         cursor = conn.cursor()
                         
                         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -1752,196 +3750,114 @@ class SCUMManager(QMainWindow):
                         
                         # Mark players as offline if they're not in current session
                         online_steam_ids = set(steam_to_player.keys())
-                        cursor.execute("SELECT steam_id FROM players WHERE status = 'online'")
-                        db_online = cursor.fetchall()
-                        
-                        for (db_steam_id,) in db_online:
-                            if db_steam_id not in online_steam_ids:
-                                # Player went offline - update session end time
-                                cursor.execute('''
-                                    UPDATE player_sessions SET 
-                                        session_end = ?, 
-                                        duration = CAST((julianday(?) - julianday(session_start)) * 86400 AS INTEGER)
-                                    WHERE steam_id = ? AND session_end IS NULL
-                                ''', (current_time, current_time, db_steam_id))
-                                
-                                # Update player status and playtime
-                                cursor.execute('''
-                                    SELECT SUM(duration) FROM player_sessions 
-                                    WHERE steam_id = ? AND duration IS NOT NULL
-                                ''', (db_steam_id,))
-                                total_duration = cursor.fetchone()[0] or 0
-                                
-                                cursor.execute('''
-                                    UPDATE players SET 
-                                        status = 'offline', 
-                                        last_seen = ?,
-                                        total_playtime = ?
-                                    WHERE steam_id = ?
-                                ''', (current_time, total_duration, db_steam_id))
+                        self._mark_players_offline(cursor, online_steam_ids, current_time)
                         
                         conn.commit()
-                        conn.close()
                         
                     except Exception as e:
+                        # Don't leave a half-applied flush open on the shared connection
+                        conn.rollback()
                         self.write_log('error', f'Failed to save player data to database: {e}', 'ERROR')
                 
             except Exception as e:
                 self.write_log('error', f'Error parsing SCUM server logs: {e}', 'ERROR')
         
         # Update table with player data
-        self.table_players.setRowCount(0)
+        now = datetime.now()  # One clock read shared by every row and the uptime display
+        self._player_rows = []
+        online_count = 0  # Counted while building rows instead of a second pass over players
 
         if not players:
-            self.table_players.insertRow(0)
-            no_players_msg = QTableWidgetItem("👥 No players detected yet - waiting for players to join...")
-            no_players_msg.setForeground(QColor('#8be9fd'))
-            self.table_players.setItem(0, 0, no_players_msg)
-            self.table_players.setSpan(0, 0, 1, 8)
+            self._show_players_message("👥 No players detected yet - waiting for players to join...",
+                                       PlayersModel.C_NAME, span=8)
             # Update counts
-            if hasattr(self, 'label_online_count'):
+            if self.label_online_count is not None:
                 self.label_online_count.setText("0")
-            if hasattr(self, 'label_total_tracked'):
+            if self.label_total_tracked is not None:
                 self.label_total_tracked.setText("Total Tracked: 0")
         else:
-            # Sort by status (online first) then by name
-            sorted_players = sorted(players.items(), key=lambda x: (x[1].get('status') != 'online', x[0].lower()))
+            # Sort by status (online first) then by name - lowercase each name once, not per compare
+            entries = [(info.get('status') != 'online', name.lower(), name, info) for name, info in players.items()]
+            entries.sort(key=lambda e: e[:2])
+            sorted_players = [(name, info) for _, _, name, info in entries]
 
-            for display_name, info in sorted_players:
-                r = self.table_players.rowCount()
-                self.table_players.insertRow(r)
+            # Rows are plain tuples; the model signals only the rows whose values changed
+            new_rows = []
 
+            for display_name, info in sorted_players:
                 status = info.get('status', 'unknown')
                 is_online = status == 'online'
-
-                # Column 0: Status with icon
-                status_item = QTableWidgetItem("🟢 ONLINE" if is_online else "⚫ OFFLINE")
-                status_item.setForeground(QColor('#50fa7b') if is_online else QColor('#666666'))
-                status_item.setTextAlignment(Qt.AlignCenter)
-                self.table_players.setItem(r, 0, status_item)
-
-                # Column 1: Player Name (display name from BattlEye) - LARGER FONT
-                name_item = QTableWidgetItem(display_name)
-                name_item.setForeground(QColor('#8be9fd') if is_online else QColor('#666666'))
-                name_item.setFont(QFont('Segoe UI', 14, QFont.Bold if is_online else QFont.Normal))
-                self.table_players.setItem(r, 1, name_item)
-
-                # Column 2: Steam ID
+                if is_online:
+                    online_count += 1
+                status_text = "🟢 ONLINE" if is_online else "⚫ OFFLINE"
                 steam_id = info.get('steam_id', '-')
-                steam_item = QTableWidgetItem(steam_id)
-                steam_item.setForeground(QColor('#f1fa8c'))
-                self.table_players.setItem(r, 2, steam_item)
-
-                # Column 3: Character Name
                 char_name = info.get('char_name', '-')
-                char_item = QTableWidgetItem(char_name)
-                char_item.setForeground(QColor('#ffb86b'))
-                self.table_players.setItem(r, 3, char_item)
 
-                # Column 4: Connected At
+                # Format: 2025.11.02-23.08.40 -> Nov 02, 23:08:40
                 connected_at = info.get('connected_at', '-')
                 if connected_at != '-':
-                    # Format: 2025.11.02-23.08.40 -> Nov 02, 23:08:40
                     try:
-                        dt = datetime.strptime(connected_at.split(':')[0], '%Y.%m.%d-%H.%M.%S')
+                        dt = _fast_parse_scum_ts(connected_at)
                         connected_at = dt.strftime('%b %d, %H:%M:%S')
                     except:
                         pass
-                connected_item = QTableWidgetItem(connected_at)
-                connected_item.setForeground(QColor('#bd93f9'))
-                self.table_players.setItem(r, 4, connected_item)
 
-                # Column 5: Play Time (calculate duration if online)
+                # Play time (calculate duration if online)
                 play_time = "-"
                 if is_online and info.get('connected_at') != '-':
                     try:
                         conn_time = info.get('connected_at', '')
-                        dt_conn = datetime.strptime(conn_time.split(':')[0], '%Y.%m.%d-%H.%M.%S')
-                        duration = datetime.now() - dt_conn
-                        hours = int(duration.total_seconds() // 3600)
-                        minutes = int((duration.total_seconds() % 3600) // 60)
-                        play_time = f"{hours}h {minutes}m"
+                        dt_conn = _fast_parse_scum_ts(conn_time)
+                        duration = now - dt_conn
+                        hours, rem = divmod(duration.days * 86400 + duration.seconds, 3600)
+                        play_time = f"{hours}h {rem // 60}m"
                     except:
                         play_time = "Active"
-                time_item = QTableWidgetItem(play_time)
-                time_item.setForeground(QColor('#50fa7b') if is_online else QColor('#666666'))
-                self.table_players.setItem(r, 5, time_item)
 
-                # Column 6: IP Address
                 ip_addr = info.get('ip', '-')
-                ip_item = QTableWidgetItem(ip_addr)
-                ip_item.setForeground(QColor('#ffb86b'))
-                self.table_players.setItem(r, 6, ip_item)
 
-                # Column 7: Actions (buttons for online players)
-                if is_online:
-                    action_widget = QWidget()
-                    action_layout = QHBoxLayout()
-                    action_layout.setContentsMargins(2, 2, 2, 2)
-                    action_layout.setSpacing(4)
-
-                    kick_btn = QPushButton('👢 Kick')
-                    kick_btn.setStyleSheet("""
-                        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ff5555, stop:1 #cc4444);
-                        color: white;
-                        padding: 6px 10px;
-                        font-size: 11px;
-                        font-weight: bold;
-                        border: none;
-                        border-radius: 4px;
-                        min-width: 50px;
-                    """)
-                    kick_btn.clicked.connect(lambda _, n=display_name, sid=steam_id: self.kick_player(n, sid))
-                    kick_btn.setToolTip(f"Kick {display_name} from server")
-
-                    ban_btn = QPushButton('🚫 Ban')
-                    ban_btn.setStyleSheet("""
-                        background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ff6e67, stop:1 #cc5555);
-                        color: white;
-                        padding: 6px 10px;
-                        font-size: 11px;
-                        font-weight: bold;
-                        border: none;
-                        border-radius: 4px;
-                        min-width: 50px;
-                    """)
-                    ban_btn.clicked.connect(lambda _, n=display_name, sid=steam_id: self.ban_player(n, sid))
-                    ban_btn.setToolTip(f"Permanently ban {display_name}")
-
-                    action_layout.addWidget(kick_btn)
-                    action_layout.addWidget(ban_btn)
-                    action_widget.setLayout(action_layout)
-                    self.table_players.setCellWidget(r, 7, action_widget)
-                else:
-                    self.table_players.setItem(r, 7, QTableWidgetItem(""))
+                new_rows.append((is_online, display_name, steam_id, char_name, connected_at, play_time, ip_addr))
+                # Newline-joined so a search term can't match across two columns
+                self._player_rows.append((is_online, "\n".join((
+                    status_text, display_name, steam_id, char_name,
+                    connected_at, play_time, ip_addr)).lower()))
+
+            # Row changes, span reset and re-filtering land as one repaint
+            self.table_players.setUpdatesEnabled(False)
+            try:
+                if self._players_model.showing_message:
+                    self.table_players.clearSpans()
+                self._players_model.set_rows(new_rows)
+                # Row visibility is view state keyed by row number, so re-apply the active search/filter
+                self.filter_players()
+            finally:
+                self.table_players.setUpdatesEnabled(True)
 
         # Update summary counts and server status
-        online_count = sum(1 for info in players.values() if info.get('status') == 'online')
         offline_count = len(players) - online_count
 
-        if hasattr(self, 'label_online_count'):
+        if self.label_online_count is not None:
             self.label_online_count.setText(str(online_count))
 
-        if hasattr(self, 'label_total_tracked'):
+        if self.label_total_tracked is not None:
             self.label_total_tracked.setText(f"Total Tracked: {len(players)}")
 
         # Update server status
-        if hasattr(self, 'label_server_status'):
+        if self.label_server_status is not None:
             if self.server_pid:
                 self.label_server_status.setText("🟢 RUNNING")
-                self.label_server_status.setStyleSheet("font-size: 24px; font-weight: bold; color: #50fa7b; text-align: center;")
+                self._apply_style_once(self.label_server_status, self._SS_RUNNING)
             else:
                 self.label_server_status.setText("🔴 OFFLINE")
-                self.label_server_status.setStyleSheet("font-size: 24px; font-weight: bold; color: #ff5555; text-align: center;")
+                self._apply_style_once(self.label_server_status, self._SS_OFFLINE)
 
         # Update uptime display
-        if hasattr(self, 'label_uptime_display'):
-            if self.server_pid and hasattr(self, 'server_start_time'):
+        if self.label_uptime_display is not None:
+            if self.server_pid and self.server_start_time is not None:
                 try:
-                    uptime = datetime.now() - self.server_start_time
-                    hours = int(uptime.total_seconds() // 3600)
-                    minutes = int((uptime.total_seconds() % 3600) // 60)
-                    seconds = int(uptime.total_seconds() % 60)
+                    uptime = now - self.server_start_time
+                    hours, rem = divmod(uptime.days * 86400 + uptime.seconds, 3600)
+                    minutes, seconds = divmod(rem, 60)
                     self.label_uptime_display.setText(f"Uptime: {hours:02d}:{minutes:02d}:{seconds:02d}")
                 except:
                     self.label_uptime_display.setText("Uptime: --:--:--")
@@ -1949,42 +3865,37 @@ class SCUMManager(QMainWindow):
                 self.label_uptime_display.setText("Uptime: --:--:--")
 
         # Update peak players today
-        if hasattr(self, 'label_peak_today'):
+        if self.label_peak_today is not None:
             try:
                 # Track peak players in current session
-                if not hasattr(self, '_peak_today'):
-                    self._peak_today = 0
                 self._peak_today = max(self._peak_today, online_count)
                 self.label_peak_today.setText(f"Peak Today: {self._peak_today}")
             except:
                 self.label_peak_today.setText("Peak Today: 0")
 
         # Update online activity indicator
-        if hasattr(self, 'online_activity'):
+        if self.online_activity is not None:
             if online_count > 0:
                 self.online_activity.setText("⚡ Real-time updates active")
-                self.online_activity.setStyleSheet("font-size: 11px; color: #50fa7b; text-align: center;")
+                self._apply_style_once(self.online_activity, self._SS_ACTIVITY_ON)
             else:
                 self.online_activity.setText("⏸️ Waiting for players")
-                self.online_activity.setStyleSheet("font-size: 11px; color: #666666; text-align: center;")
+                self._apply_style_once(self.online_activity, self._SS_ACTIVITY_OFF)
+
+    def _show_players_message(self, text, color, font=None, span=8):
+        """Replace the players table contents with a single spanning notice row"""
+        self._player_rows = []
+        self._players_model.set_message(text, color, font)
+        self.table_players.clearSpans()
+        self.table_players.setSpan(0, 0, 1, span)
 
     def filter_players(self):
         """Filter player table based on search text and filter combo"""
         search_text = self.player_search.text().lower()
         filter_type = self.filter_combo.currentText()
 
-        for row in range(self.table_players.rowCount()):
-            # Skip empty rows or message rows
-            if row >= self.table_players.rowCount():
-                continue
-
-            status_item = self.table_players.item(row, 0)
-            if not status_item:
-                continue
-
-            # Get player status
-            is_online = "ONLINE" in status_item.text()
-
+        # Message rows (offline/no players) have no entry in _player_rows and stay visible
+        for row, (is_online, haystack) in enumerate(self._player_rows):
             # Apply filter type
             show_by_filter = True
             if filter_type == "Online Only":
@@ -1999,14 +3910,8 @@ class SCUMManager(QMainWindow):
                 show_by_filter = False  # Placeholder
             # "All Players" shows everything
 
-            # Apply search filter
-            show_by_search = not search_text  # Show all if no search
-            if search_text:
-                for col in range(self.table_players.columnCount() - 1):  # Exclude action column
-                    item = self.table_players.item(row, col)
-                    if item and search_text in item.text().lower():
-                        show_by_search = True
-                        break
+            # Apply search filter against the precomputed row text
+            show_by_search = not search_text or search_text in haystack
 
             # Show/hide row based on both filters
             self.table_players.setRowHidden(row, not (show_by_filter and show_by_search))
@@ -2055,7 +3960,7 @@ class SCUMManager(QMainWindow):
                 self.write_log('admin', f'✅ Player kicked: {player_name} (SteamID: {steam_id} Reason: {reason})', 'INFO')
                 self.write_log('player', f'Player {player_name} was kicked from the server', 'INFO')
                 QMessageBox.information(self, "Success", f"✅ Kick command sent for '{player_name}'!\n\nThe server will process this command shortly.")
-                self.populate_players()
+                self._schedule_populate()
             else:
                 QMessageBox.warning(
                     self,
@@ -2118,7 +4023,7 @@ class SCUMManager(QMainWindow):
                     f"Reason: {reason}\n\n"
                     f"They have been kicked and cannot rejoin."
                 )
-                self.populate_players()
+                self._schedule_populate()
             else:
                 QMessageBox.warning(
                     self, 
@@ -2129,13 +4034,8 @@ class SCUMManager(QMainWindow):
         except Exception as ban_error:
             # Fallback to old method if needed
             try:
-                from scum_core import send_rcon_command, get_rcon_config
-                
-                # Get RCON settings from server.cfg
-                rcon_config = get_rcon_config()
-                rcon_host = rcon_config.get('host', '127.0.0.1')
-                rcon_port = rcon_config.get('port', 27015)
-                rcon_password = rcon_config.get('password', '')
+                # Get RCON settings (cached from server config / Settings tab)
+                rcon_host, rcon_port, rcon_password = self._get_rcon_target()
                 
                 response = send_rcon_command(
                     host=rcon_host,
@@ -2148,7 +4048,7 @@ class SCUMManager(QMainWindow):
                     self.write_log('admin', f'🚫 Player BANNED: {player_name} (Steam ID: {steam_id})', 'WARNING')
                     self.write_log('player', f'Player {player_name} was permanently banned', 'WARNING')
                     QMessageBox.information(self, "Ban Successful", f"🚫 Player '{player_name}' has been permanently banned!\n\nSteam ID: {steam_id}")
-                    self.populate_players()
+                    self._schedule_populate()
                     return
             except Exception as rcon_error:
                 self.write_log('error', f'RCON ban failed: {str(rcon_error)}', 'ERROR')
@@ -2219,14 +4119,13 @@ class SCUMManager(QMainWindow):
     def add_admin(self):
         """Add a player as admin via AdminUsers.ini (from selected table row)"""
         # Get selected player from table
-        current_row = self.table_players.currentRow()
-        if current_row < 0:
+        row = self._players_model.row_at(self.table_players.currentIndex().row()) if self._players_model else None
+        if row is None:
             QMessageBox.warning(self, "No Selection", "Please select a player from the table first.")
             return
         
         # Get player info
-        player_name = self.table_players.item(current_row, 1).text()
-        steam_id = self.table_players.item(current_row, 2).text()
+        player_name, steam_id = row[1], row[2]
         
         # Call the direct function
         self.add_admin_direct(player_name, steam_id)
@@ -2345,8 +4244,6 @@ class SCUMManager(QMainWindow):
         """Show admin password and usage instructions"""
         try:
             from scum_core import find_scum_config_dir
-            from pathlib import Path
-            import re
             
             # Read current admins from file
             config_dir = find_scum_config_dir()
@@ -2355,8 +4252,9 @@ class SCUMManager(QMainWindow):
             if config_dir:
                 admin_file = config_dir / "AdminUsers.ini"
                 if admin_file.exists():
-                    content = admin_file.read_text(encoding='utf-8', errors='ignore')
-                    steam_ids = re.findall(r'SteamID="(\d+)"', content)
+                    # Stream the file so only one line is held in memory at a time
+                    with admin_file.open('r', encoding='utf-8', errors='ignore') as fh:
+                        steam_ids = [sid for line in fh for sid in _STEAMID_RE.findall(line)]
                     if steam_ids:
                         admin_list = "\n   ".join([f"• Steam ID: {sid}" for sid in steam_ids])
             
@@ -2435,6 +4333,79 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not load admin help: {str(e)}")
     
+    def _get_rcon_target(self):
+        """Return the cached (host, port, password) RCON target, reading the server config once"""
+        if self._rcon_target is None:
+            rcon_config = get_rcon_config()
+            self._rcon_target = (
+                rcon_config.get('host', '127.0.0.1'),
+                rcon_config.get('port', 27015),
+                rcon_config.get('password', '')
+            )
+        return self._rcon_target
+
+    def _on_rcon_fields_edited(self):
+        """Use the Settings tab RCON fields as the target after the user edits them"""
+        self._rcon_target = (self.rcon_host.text(), self.rcon_port.value(), self.rcon_password.text())
+
+    def _get_rcon_conn(self, host, port, password):
+        """Return the cached authenticated RCON socket, reconnecting if the target changed"""
+        key = (host, port, password)
+        if self._rcon_conn is not None and self._rcon_conn_key != key:
+            self._drop_rcon_conn()
+        if self._rcon_conn is None:
+            self._rcon_conn = open_rcon_connection(host, port, password)
+            self._rcon_conn_key = key
+        return self._rcon_conn
+
+    def _drop_rcon_conn(self):
+        """Close and forget the cached RCON socket"""
+        if self._rcon_conn is not None:
+            try:
+                self._rcon_conn.close()
+            except OSError:
+                pass
+        self._rcon_conn = None
+        self._rcon_conn_key = None
+
+    def _send_rcon(self, command):
+        """Send a command over the persistent RCON connection, reconnecting once if it dropped"""
+        target = self._get_rcon_target()
+        reused = self._rcon_conn is not None and self._rcon_conn_key == target
+        try:
+            return rcon_exec(self._get_rcon_conn(*target), command)
+        except OSError as e:
+            # Whatever failed, the socket can't be trusted (a late reply would be read as
+            # the next command's), so it is always dropped
+            self._drop_rcon_conn()
+            # Only a reused socket the server had already closed (restart, idle timeout) is
+            # retried: the command never reached it. A timeout may mean the server ran it
+            # and is slow to answer, and a fresh connection failing would just fail again
+            if reused and isinstance(e, (BrokenPipeError, ConnectionResetError, ConnectionAbortedError)):
+                return rcon_exec(self._get_rcon_conn(*target), command)
+            raise
+
+    def _queue_rcon_output(self, text):
+        """Buffer text for the RCON console; bursts of commands share one append"""
+        self._rcon_buf.append(text)
+        if not self._rcon_flush_timer.isActive():
+            self._rcon_flush_timer.start()
+
+    def _flush_rcon(self):
+        if not self._rcon_buf:
+            return
+        lines = "\n".join(self._rcon_buf).splitlines()
+        self._rcon_buf.clear()
+        model = self._rcon_model
+        row = model.rowCount()
+        model.insertRows(row, len(lines))
+        for i, line in enumerate(lines, row):
+            model.setData(model.index(i), line)
+        overflow = model.rowCount() - RCON_MAX_LINES
+        if overflow > 0:
+            model.removeRows(0, overflow)
+        self.rcon_response_display.scrollToBottom()
+
     def send_custom_rcon_command(self):
         """Send custom RCON command entered by user"""
         command = self.rcon_command_input.text().strip()
@@ -2443,137 +4414,135 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
             return
             
         try:
-            from scum_core import send_rcon_command, get_rcon_config
-            rcon_config = get_rcon_config()
-            response = send_rcon_command(
-                command,
-                rcon_config.get('host', '127.0.0.1'), 
-                rcon_config.get('port', 27015), 
-                rcon_config.get('password', '')
-            )
-            self.rcon_response_display.append(f"> {command}")
-            self.rcon_response_display.append(f"< {response}")
-            self.rcon_response_display.append("")  # Empty line for separation
+            response = self._send_rcon(command)
+            # The trailing newline leaves an empty separator line
+            self._queue_rcon_output(f"> {command}\n< {response}\n")
             self.rcon_command_input.clear()
         except Exception as e:
             error_msg = f"Failed to send RCON command: {str(e)}"
-            self.rcon_response_display.append(f"ERROR: {error_msg}")
-            self.rcon_response_display.append("")
+            self._queue_rcon_output(f"ERROR: {error_msg}\n")
             QMessageBox.critical(self, "RCON Error", error_msg)
 
     def send_quick_rcon_command(self, command):
         """Send quick RCON command from button"""
         try:
-            from scum_core import send_rcon_command, get_rcon_config
-            rcon_config = get_rcon_config()
-            response = send_rcon_command(
-                command,
-                rcon_config.get('host', '127.0.0.1'), 
-                rcon_config.get('port', 27015), 
-                rcon_config.get('password', '')
-            )
-            self.rcon_response_display.append(f"> {command}")
-            self.rcon_response_display.append(f"< {response}")
-            self.rcon_response_display.append("")
+            response = self._send_rcon(command)
+            self._queue_rcon_output(f"> {command}\n< {response}\n")
         except Exception as e:
             error_msg = f"Failed to send RCON command: {str(e)}"
-            self.rcon_response_display.append(f"ERROR: {error_msg}")
-            self.rcon_response_display.append("")
+            self._queue_rcon_output(f"ERROR: {error_msg}\n")
             QMessageBox.critical(self, "RCON Error", error_msg)
 
     # --- bans ---
     def populate_bans(self):
-        items = load_bans()
-        self.table_bans.setRowCount(0)
-        for e in items:
-            r = self.table_bans.rowCount()
-            self.table_bans.insertRow(r)
-            self.table_bans.setItem(r, 0, QTableWidgetItem(e))
+        """Reload the ban list from disk into the set and the Bans view model"""
+        items = list(load_bans())
+        self._bans_set = set(items)
+        # Model reset only; the view fetches the rows it actually paints
+        self._bans_model.set_entries(items)
 
     def on_add_ban(self):
         entry = self.input_ban.text().strip()
         if not entry:
             return
+        if entry in self._bans_set:
+            self.status_bar.showMessage(f"'{entry}' is already banned")
+            return
         if add_ban(entry):
-            self.write_log('admin', f'Player banned: {entry}', 'INFO')
-            self.write_log('player', f'Player {entry} has been banned from the server', 'INFO')
-            self.write_log('events', f'Ban added for: {entry}', 'INFO')
-            self.populate_bans()
+            self._bans_set.add(entry)
+            self._bans_model.append_entry(entry)
+            self.write_logs_batched([
+                ('admin', f'Player banned: {entry}', 'INFO'),
+                ('player', f'Player {entry} has been banned from the server', 'INFO'),
+                ('events', f'Ban added for: {entry}', 'INFO'),
+            ])
             self.input_ban.clear()
 
     def on_remove_ban(self):
         entry = self.input_ban.text().strip()
         if not entry:
             return
+        if entry not in self._bans_set:
+            self.status_bar.showMessage(f"'{entry}' is not in the ban list")
+            return
         if remove_ban(entry):
-            self.write_log('admin', f'Player unbanned: {entry}', 'INFO')
-            self.write_log('player', f'Ban removed for player: {entry}', 'INFO')
-            self.write_log('events', f'Ban removed for: {entry}', 'INFO')
-            self.populate_bans()
+            self._bans_set.discard(entry)
+            self._bans_model.remove_entry(entry)
+            self.write_logs_batched([
+                ('admin', f'Player unbanned: {entry}', 'INFO'),
+                ('player', f'Ban removed for player: {entry}', 'INFO'),
+                ('events', f'Ban removed for: {entry}', 'INFO'),
+            ])
             self.input_ban.clear()
 
     # --- settings persistence ---
     def settings_file(self) -> Path:
-        return APP_ROOT / 'scum_settings.json'
+        return self._settings_path
 
     def load_settings(self):
         """Load all saved settings including paths and configurations"""
         sf = self.settings_file()
+        ready = self._widgets_ready
         if sf.exists():
             try:
-                data = json.loads(sf.read_text(encoding='utf-8'))
+                mtime = sf.stat().st_mtime
+                if self._settings_cache is not None and mtime == self._settings_mtime:
+                    data = self._settings_cache
+                else:
+                    data = _load_json_sections(sf, self._SETTINGS_KEYS)
+                    self._settings_cache = data
+                    self._settings_mtime = mtime
                 
                 # Load SCUMServer.exe path
                 p = data.get('scum_path')
                 if p:
                     self.scum_path = p
                     # Update UI elements only if they exist (lazy loading compatible)
-                    if hasattr(self, 'label_path'):
+                    if 'label_path' in ready:
                         self.label_path.setText(p)
-                    if hasattr(self, 'setup_label_path'):
+                    if 'setup_label_path' in ready:
                         self.setup_label_path.setText(f"✅ {Path(p).name}")
-                    if hasattr(self, 'install_status'):
+                    if 'install_status' in ready:
                         self.install_status.setText("✅ Server configured")
-                        self.install_status.setStyleSheet("color: #50fa7b; font-size: 11px;")
-                
-                # Load SteamCMD directory
-                steamcmd = data.get('steamcmd_dir')
-                if steamcmd and hasattr(self, 'steamcmd_dir'):
-                    self.steamcmd_dir.setText(steamcmd)
+                        _set_qss(self.install_status, self._SS_INSTALL_OK)
                 
-                # Load SCUM Server download directory
-                scum_dir = data.get('scum_server_dir')
-                if scum_dir and hasattr(self, 'scum_server_dir'):
-                    self.scum_server_dir.setText(scum_dir)
+                # Load SteamCMD and SCUM Server download directories
+                if 'steamcmd_dir' in ready:
+                    self._apply_download_dirs(data)
                 
                 # Load config folder path
                 config_path = data.get('config_base_path')
                 if config_path and Path(config_path).exists():
                     self.config_base_path = Path(config_path)
-                    if hasattr(self, 'config_path_display'):
+                    if 'config_path_display' in ready:
                         self.config_path_display.setText(str(config_path))
                     # Auto-load the config directory if it exists and UI is ready
-                    if hasattr(self, 'config_tree'):
+                    if 'config_tree' in ready:
                         self.load_config_directory(self.config_base_path)
                 
                 # Load RCON settings
                 rcon_config = data.get('rcon', {})
-                if hasattr(self, 'rcon_host'):
+                if 'rcon_host' in ready:
                     self.rcon_host.setText(rcon_config.get('host', '127.0.0.1'))
-                if hasattr(self, 'rcon_port'):
+                if 'rcon_port' in ready:
                     self.rcon_port.setValue(rcon_config.get('port', 27015))
-                if hasattr(self, 'rcon_password'):
+                if 'rcon_password' in ready:
                     self.rcon_password.setText(rcon_config.get('password', ''))
                 
                 # Load setup configuration
                 setup_config = data.get('setup_config', {})
-                if setup_config and hasattr(self, 'setup_server_name'):
-                    self.setup_server_name.setText(setup_config.get('server_name', 'My SCUM Server'))
-                    self.setup_max_players.setValue(setup_config.get('max_players', 50))
-                    self.setup_port.setValue(setup_config.get('port', 27015))
+                if setup_config and 'setup_server_name' in ready:
+                    # Each of these fields triggers update_setup_status (which restyles the
+                    # status label); restore them silently and recompute the score once
+                    with QSignalBlocker(self.setup_server_name), QSignalBlocker(self.setup_max_players), \
+                            QSignalBlocker(self.setup_port):
+                        self.setup_server_name.setText(setup_config.get('server_name', 'My SCUM Server'))
+                        self.setup_max_players.setValue(setup_config.get('max_players', 50))
+                        self.setup_port.setValue(setup_config.get('port', 27015))
                     self.setup_password.setText(setup_config.get('password', ''))
                     difficulty_index = setup_config.get('difficulty', 2)
                     self.setup_difficulty.setCurrentIndex(difficulty_index)
+                    self.update_setup_status()
                     
             except Exception as e:
                 print(f"Error loading settings: {e}")
@@ -2583,20 +4552,106 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         
         Args:
             show_message: If True, show success message popup
+
+        Returns:
+            True if the saved values differ from the previous explicit save
+        """
+        # An explicit save supersedes any pending debounced one
+        self._save_timer.stop()
+        try:
+            data = self._gather_settings()
+            self._store_settings(data)
+            changed = data != self._last_saved_settings
+            self._last_saved_settings = data
+            if show_message:
+                QMessageBox.information(self, '✅ Saved', 'All settings saved successfully!\n\nYour configuration will be loaded automatically next time.')
+            return changed
+        except Exception as e:
+            QMessageBox.warning(self, 'Error', f'Could not save settings: {e}')
+            return False
+
+    def _schedule_settings_save(self):
+        """Debounced auto-save: restart the timer so a burst of changes is written once"""
+        self._save_timer.start()
+
+    def _flush_settings_save(self):
+        """Snapshot settings on the GUI thread and write them from a worker thread"""
+        data = self._gather_settings()
+        self._settings_gen += 1
+        gen = self._settings_gen
+
+        def write():
+            try:
+                mtime = self._write_settings(data, gen)
+            except Exception as e:
+                self.settingsWriteFailed.emit(str(e))
+                return
+            if mtime is not None:
+                # The cache belongs to the GUI thread; hand the result back to it
+                self.settingsWritten.emit(data, mtime, gen)
+
+        threading.Thread(target=write, daemon=True).start()
+
+    def _on_settings_write_failed(self, error):
+        """Report a failed background settings write (GUI thread)"""
+        QMessageBox.warning(self, 'Error', f'Could not save settings: {error}')
+
+    def _store_settings(self, data):
+        """Write settings now and refresh the in-memory cache (GUI thread)"""
+        self._settings_gen += 1
+        gen = self._settings_gen
+        mtime = self._write_settings(data, gen)
+        if mtime is not None:
+            self._apply_settings_written(data, mtime, gen)
+
+    def _write_settings(self, data, gen):
+        """Write settings data to disk (any thread).
+
+        Returns the new file mtime, or None when a newer snapshot was already written.
         """
         sf = self.settings_file()
-        
-        # Gather all settings
-        data = {
-            'scum_path': self.scum_path,
-        }
+        payload = _dump_json_bytes(data)
+        # Write a sibling temp file and rename it over the original, so a crash
+        # mid-write can never leave a truncated scum_settings.json behind
+        tmp = sf.with_suffix('.json.tmp')
+        with self._settings_write_lock:
+            if gen < self._settings_written_gen:
+                return None  # a debounced save that lost the race to a newer explicit one
+            tmp.write_bytes(payload)
+            os.replace(tmp, sf)
+            self._settings_written_gen = gen
+            return sf.stat().st_mtime
+
+    def _apply_settings_written(self, data, mtime, gen):
+        """Keep the in-memory copy current so the next load_settings skips the parse (GUI thread)"""
+        if gen < self._settings_cache_gen:
+            return
+        self._settings_cache = data
+        self._settings_mtime = mtime
+        self._settings_cache_gen = gen
+
+    def _apply_download_dirs(self, data):
+        """Fill the Download tab's directory fields from saved settings (tab must be built)"""
+        if data.get('steamcmd_dir'):
+            self.steamcmd_dir.setText(data['steamcmd_dir'])
+        if data.get('scum_server_dir'):
+            self.scum_server_dir.setText(data['scum_server_dir'])
+
+    def _gather_settings(self):
+        """Collect current settings from the UI into a dict (GUI thread only)"""
+        ready = self._widgets_ready
+        # Sections whose page has not been built yet keep their last saved value;
+        # _write_settings replaces the whole file, so dropping them would erase them
+        saved = self._settings_cache or {}
+        data = {k: saved[k] for k in self._SETTINGS_KEYS if k in saved}
+        data['scum_path'] = self.scum_path
         
         # Save SteamCMD directory if it exists
-        if hasattr(self, 'steamcmd_dir'):
+        if 'steamcmd_dir' in ready:
             data['steamcmd_dir'] = self.steamcmd_dir.text()
         
         # Save SCUM Server directory if it exists
-        if hasattr(self, 'scum_server_dir'):
+        if 'scum_server_dir' in ready:
             data['scum_server_dir'] = self.scum_server_dir.text()
         
         # Save config folder path if it exists
@@ -2604,7 +4659,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
             data['config_base_path'] = str(self.config_base_path)
         
         # Save RCON settings if they exist
-        if hasattr(self, 'rcon_host') and hasattr(self, 'rcon_port') and hasattr(self, 'rcon_password'):
+        if 'rcon_host' in ready and 'rcon_port' in ready and 'rcon_password' in ready:
             data['rcon'] = {
                 'host': self.rcon_host.text(),
                 'port': self.rcon_port.value(),
@@ -2612,24 +4667,30 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
             }
         
         # Save setup configuration if it exists
-        if hasattr(self, 'setup_server_name'):
+        if 'setup_server_name' in ready:
+            # A number field still holding intermediate text keeps its saved value (or default)
+            saved_setup = saved.get('setup_config') or {}
+
+            def number(edit, key):
+                if edit.hasAcceptableInput():
+                    return edit.value()
+                return saved_setup.get(key, edit.default_value())
+
             data['setup_config'] = {
                 'server_name': self.setup_server_name.text(),
-                'max_players': self.setup_max_players.value(),
-                'port': self.setup_port.value(),
+                'max_players': number(self.setup_max_players, 'max_players'),
+                'port': number(self.setup_port, 'port'),
                 'password': self.setup_password.text(),
                 'difficulty': self.setup_difficulty.currentIndex()
             }
         
-        try:
-            sf.write_text(json.dumps(data, indent=2), encoding='utf-8')
-            if show_message:
-                QMessageBox.information(self, '✅ Saved', 'All settings saved successfully!\n\nYour configuration will be loaded automatically next time.')
-        except Exception as e:
-            QMessageBox.warning(self, 'Error', f'Could not save settings: {e}')
+        return data
 
     def on_tab_changed(self, index):
         """Handle tab changes with lazy loading for performance optimization"""
+        # Already showing this (built) page - nothing to switch or build
+        if self.stack.currentIndex() == index and index in self._tabs_initialized:
+            return
         # Switch to the new tab
         self.stack.setCurrentIndex(index)
         
@@ -2651,8 +4712,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
                 self.build_logs()
                 # load_logs() is now called asynchronously within build_logs()
             elif index == 6:  # Bans tab
-                self.build_bans()
-                self.populate_bans()
+                self.build_bans()  # also loads the ban list via populate_bans()
             elif index == 7:  # Performance tab
                 self.build_performance()
             elif index == 8:  # Settings tab
@@ -2661,27 +4721,61 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
                 self.build_setup()
     
     def change_page(self, index):
-        self.stack.setCurrentIndex(index)
+        if self.stack.currentIndex() != index:
+            self.stack.setCurrentIndex(index)
+
+    def _on_master_tick(self):
+        """Shared 1s tick: dashboard refresh and player log monitoring"""
+        if self._dashboard_refresh_on:
+            self.refresh_all()
+        if self._players_refresh_on:
+            self.monitor_scum_server_logs()
+
+    def _sync_master_timer(self):
+        """Run the shared tick only while at least one auto-refresh is enabled"""
+        if self._dashboard_refresh_on or self._players_refresh_on:
+            if not self._master_timer.isActive():
+                self._master_timer.start(1000)
+        else:
+            self._master_timer.stop()
 
-    def toggle_auto_refresh(self, state):
-        if state == 2:  # Checked
-            self.timer.start(500)  # Optimized: 500ms refresh (2x/sec) - smooth and responsive
-        else:  # Unchecked
-            self.timer.stop()
+    def toggle_auto_refresh(self, checked):
+        self._dashboard_refresh_on = checked
+        self._sync_master_timer()
 
-    def toggle_players_auto_refresh(self, state):
-        if state == 2:  # Checked
-            self.players_timer.start(1000)  # Log monitoring: 1 second intervals
-        else:  # Unchecked
-            self.players_timer.stop()
+    def toggle_players_auto_refresh(self, checked):
+        self._players_refresh_on = checked
+        self._sync_master_timer()
 
     def update_network_info(self):
-        try:
-            hostname = socket.gethostname()
-            ip = socket.gethostbyname(hostname)
-            self.label_ip.setText(f"🌐 IP: {ip}")
-        except Exception:
-            self.label_ip.setText("🌐 IP: Unknown")
+        """Show the host IP, resolving it on a worker thread at most once per minute"""
+        if self._cached_ip is not None:
+            self.label_ip.setText(f"🌐 IP: {self._cached_ip}")
+        # Failed lookups are stamped too, so a broken resolver is retried once a minute, not every tick
+        if self._ip_resolved_at and time.monotonic() - self._ip_resolved_at < 60:
+            return
+        if self._ip_lookup_running:
+            return
+        self._ip_lookup_running = True
+
+        def resolve():
+            # Name resolution can block for seconds on a misconfigured host, keep it off the GUI thread
+            try:
+                ip = socket.gethostbyname(socket.gethostname())
+            except Exception:
+                ip = ""
+            QMetaObject.invokeMethod(self, "_apply_network_ip", Qt.QueuedConnection, Q_ARG(str, ip))
+
+        threading.Thread(target=resolve, daemon=True).start()
+
+    @Slot(str)
+    def _apply_network_ip(self, ip):
+        """Receive a lookup result from update_network_info; keeps the last good IP on failure"""
+        self._ip_lookup_running = False
+        self._ip_resolved_at = time.monotonic()
+        if ip:
+            self._cached_ip = ip
+        self.label_ip.setText(f"🌐 IP: {self._cached_ip or 'Unknown'}")
 
     # --- page builders ---
     def build_dashboard(self):
@@ -2689,12 +4783,12 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Title with refresh button and auto-refresh indicator
         title_layout = QHBoxLayout()
         title = QLabel("Dashboard")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #e6eef6;")
+        _set_qss(title, "font-size: 18px; font-weight: bold; color: #e6eef6;")
         
         # Auto-refresh indicator
-        self.label_auto_refresh = QLabel("🔄 Real-time (2x/sec)")
-        self.label_auto_refresh.setStyleSheet("font-size: 12px; color: #50fa7b; padding: 5px;")
-        self.label_auto_refresh.setToolTip("Dashboard updates 2 times per second - optimized for performance")
+        self.label_auto_refresh = QLabel("🔄 Real-time (1x/sec)")
+        _set_qss(self.label_auto_refresh, "font-size: 12px; color: #50fa7b; padding: 5px;")
+        self.label_auto_refresh.setToolTip("Dashboard updates once per second; labels are only redrawn when their values change")
         
         btn_refresh = QPushButton("🔄 Refresh Now")
         btn_refresh.clicked.connect(self.refresh_all)
@@ -2712,15 +4806,15 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         status_card = QGroupBox("🖥️ Server Status")
         status_layout = QVBoxLayout()
         self.label_status = QLabel("� Offline")
-        self.label_status.setStyleSheet("font-size: 16px; padding: 5px; font-weight: bold;")
+        _set_qss(self.label_status, "font-size: 16px; padding: 5px; font-weight: bold;")
         self.label_status.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.label_uptime = QLabel("⏱️ Not running")
-        self.label_uptime.setStyleSheet("font-size: 13px; padding: 5px; color: #aaa;")
+        _set_qss(self.label_uptime, "font-size: 13px; padding: 5px; color: #aaa;")
         self.label_uptime.setTextInteractionFlags(Qt.TextSelectableByMouse)
         
         # Server readiness indicator
         self.label_ready_status = QLabel("⭕ Offline: Server not running")
-        self.label_ready_status.setStyleSheet("font-size: 11px; padding: 5px; color: #666;")
+        _set_qss(self.label_ready_status, "font-size: 11px; padding: 5px; color: #666;")
         self.label_ready_status.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.label_ready_status.setToolTip("Shows when server is ready for players to join")
         
@@ -2735,104 +4829,13 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         players_card = QGroupBox("Players")
         players_layout = QVBoxLayout()
         self.label_players = QLabel("👥 Online: -")
-        self.label_players.setStyleSheet("font-size: 14px; padding: 5px;")
+        _set_qss(self.label_players, "font-size: 14px; padding: 5px;")
         self.label_players.setTextInteractionFlags(Qt.TextSelectableByMouse)
         players_layout.addWidget(self.label_players)
         players_layout.addStretch()
         players_card.setLayout(players_layout)
         cards_layout.addWidget(players_card, 0, 1)
 
-        # System Resources Card - Task Manager style with enhanced details
-        system_card = QGroupBox("Performance")
-        system_card.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #0078d4;
-                border-radius: 8px;
-                margin-top: 6px;
-                font-weight: bold;
-                font-size: 14px;
-                color: #e6eef6;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e1e1e, stop:1 #2b2f36);
-            }
-            QGroupBox::title {
-                color: #0078d4;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 5px 10px;
-                left: 10px;
-                top: -8px;
-            }
-        """)
-        system_layout = QVBoxLayout()
-        system_layout.setSpacing(8)
-        system_layout.setContentsMargins(15, 20, 15, 15)
-        
-        # CPU Section - Enhanced Task Manager style
-        cpu_header = QLabel("💻 CPU")
-        cpu_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #8be9fd; margin-bottom: 5px;")
-        system_layout.addWidget(cpu_header)
-        
-        self.pb_cpu = QProgressBar()
-        self.pb_cpu.setMaximum(100)
-        self.pb_cpu.setMinimumHeight(30)
-        self.pb_cpu.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 4px;
-                text-align: center;
-                background: #0d1016;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0078d4, stop:1 #00bcf2);
-                border-radius: 2px;
-            }
-        """)
-        self.label_cpu_detail = QLabel("CPU: 0.0% (0 cores) | Speed: 0 MHz")
-        self.label_cpu_detail.setStyleSheet("font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
-        system_layout.addWidget(self.pb_cpu)
-        system_layout.addWidget(self.label_cpu_detail)
-        
-        # RAM Section - Enhanced Task Manager style
-        ram_header = QLabel("🧠 Memory")
-        ram_header.setStyleSheet("font-size: 14px; font-weight: bold; color: #50fa7b; margin-top: 10px; margin-bottom: 5px;")
-        system_layout.addWidget(ram_header)
-        
-        self.pb_ram = QProgressBar()
-        self.pb_ram.setMaximum(100)
-        self.pb_ram.setMinimumHeight(30)
-        self.pb_ram.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 4px;
-                text-align: center;
-                background: #0d1016;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #10b981, stop:1 #50fa7b);
-                border-radius: 2px;
-            }
-        """)
-        self.label_ram_detail = QLabel("Available: 0.0 GB | In Use: 0.0 GB")
-        self.label_ram_detail.setStyleSheet("font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
-        self.label_process_mem = QLabel("Server Memory: N/A")
-        self.label_process_mem.setStyleSheet("font-size: 11px; color: #ffb86b; padding: 3px; background: #2b1a1a; border-radius: 3px; margin-top: 2px; font-weight: bold;")
-        system_layout.addWidget(self.pb_ram)
-        system_layout.addWidget(self.label_ram_detail)
-        system_layout.addWidget(self.label_process_mem)
-        
-        system_card.setLayout(system_layout)
-        cards_layout.addWidget(system_card, 0, 2)
-
         # Quick Actions Card
         actions_card = QGroupBox("Quick Actions")
         actions_layout = QVBoxLayout()
@@ -2855,10 +4858,10 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         network_card = QGroupBox("Network")
         network_layout = QVBoxLayout()
         self.label_ip = QLabel("🌐 IP: Loading...")
-        self.label_ip.setStyleSheet("font-size: 14px; padding: 5px;")
+        _set_qss(self.label_ip, "font-size: 14px; padding: 5px;")
         self.label_ip.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.label_port = QLabel("🔌 Port: 27015")
-        self.label_port.setStyleSheet("font-size: 14px; padding: 5px;")
+        _set_qss(self.label_port, "font-size: 14px; padding: 5px;")
         self.label_port.setTextInteractionFlags(Qt.TextSelectableByMouse)
         network_layout.addWidget(self.label_ip)
         network_layout.addWidget(self.label_port)
@@ -2866,65 +4869,12 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         network_card.setLayout(network_layout)
         cards_layout.addWidget(network_card, 1, 1)
 
-        # Disk Usage Card - Enhanced Task Manager style
-        disk_card = QGroupBox("💾 Disk (C:)")
-        disk_card.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #f59e0b;
-                border-radius: 8px;
-                margin-top: 6px;
-                font-weight: bold;
-                font-size: 14px;
-                color: #e6eef6;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e1e1e, stop:1 #2b2f36);
-            }
-            QGroupBox::title {
-                color: #f59e0b;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 5px 10px;
-                left: 10px;
-                top: -8px;
-            }
-        """)
-        disk_layout = QVBoxLayout()
-        disk_layout.setSpacing(8)
-        disk_layout.setContentsMargins(15, 20, 15, 15)
-        
-        self.pb_disk = QProgressBar()
-        self.pb_disk.setMaximum(100)
-        self.pb_disk.setMinimumHeight(30)
-        self.pb_disk.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 4px;
-                text-align: center;
-                background: #0d1016;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-                padding: 2px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #f59e0b, stop:1 #fbbf24);
-                border-radius: 2px;
-            }
-        """)
-        self.label_disk_detail = QLabel("Free: 0 GB | Total: 0 GB")
-        self.label_disk_detail.setStyleSheet("font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
-        
-        disk_layout.addWidget(self.pb_disk)
-        disk_layout.addWidget(self.label_disk_detail)
-        disk_card.setLayout(disk_layout)
-        cards_layout.addWidget(disk_card, 1, 2)
-
         # Settings Card
         settings_card = QGroupBox("Dashboard Settings")
         settings_layout = QVBoxLayout()
         self.cb_auto_refresh = QCheckBox("Auto Refresh")
         self.cb_auto_refresh.setChecked(True)
-        self.cb_auto_refresh.stateChanged.connect(self.toggle_auto_refresh)
+        self.cb_auto_refresh.toggled.connect(self.toggle_auto_refresh)
         self.cb_auto_refresh.setToolTip("Enable/disable automatic dashboard refresh")
         settings_layout.addWidget(self.cb_auto_refresh)
         settings_layout.addStretch()
@@ -2934,9 +4884,83 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         layout.addLayout(cards_layout)
         self.page_dashboard.setLayout(layout)
 
+        # The Performance and Disk cards are the heaviest widgets on the page (styled
+        # progress bars); build them right after the first paint instead of before it
+        self._dashboard_cards = cards_layout
+        QTimer.singleShot(0, self._build_deferred_dashboard_cards)
+
         # Initial network info
         self.update_network_info()
 
+    def _build_deferred_dashboard_cards(self):
+        """Add the Performance and Disk cards once the dashboard has been shown"""
+        self.build_dashboard_performance_card()
+        self.build_dashboard_disk_card()
+
+    def build_dashboard_performance_card(self):
+        """Build the CPU/RAM card into column 2, row 0 of the dashboard grid"""
+        # System Resources Card - Task Manager style with enhanced details
+        system_card = QGroupBox("Performance")
+        _set_qss(system_card, _STYLE_CARD_PERFORMANCE)
+        system_layout = QVBoxLayout()
+        system_layout.setSpacing(8)
+        system_layout.setContentsMargins(15, 20, 15, 15)
+        
+        # CPU Section - Enhanced Task Manager style
+        cpu_header = QLabel("💻 CPU")
+        _set_qss(cpu_header, "font-size: 14px; font-weight: bold; color: #8be9fd; margin-bottom: 5px;")
+        system_layout.addWidget(cpu_header)
+        
+        self.pb_cpu = QProgressBar()
+        self.pb_cpu.setMaximum(100)
+        self.pb_cpu.setMinimumHeight(30)
+        _set_qss(self.pb_cpu, _STYLE_PROGRESSBAR_CPU)
+        self.label_cpu_detail = QLabel("CPU: 0.0% (0 cores) | Speed: 0 MHz")
+        _set_qss(self.label_cpu_detail, "font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
+        system_layout.addWidget(self.pb_cpu)
+        system_layout.addWidget(self.label_cpu_detail)
+        
+        # RAM Section - Enhanced Task Manager style
+        ram_header = QLabel("🧠 Memory")
+        _set_qss(ram_header, "font-size: 14px; font-weight: bold; color: #50fa7b; margin-top: 10px; margin-bottom: 5px;")
+        system_layout.addWidget(ram_header)
+        
+        self.pb_ram = QProgressBar()
+        self.pb_ram.setMaximum(100)
+        self.pb_ram.setMinimumHeight(30)
+        _set_qss(self.pb_ram, _STYLE_PROGRESSBAR_RAM)
+        self.label_ram_detail = QLabel("Available: 0.0 GB | In Use: 0.0 GB")
+        _set_qss(self.label_ram_detail, "font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
+        self.label_process_mem = QLabel("Server Memory: N/A")
+        _set_qss(self.label_process_mem, "font-size: 11px; color: #ffb86b; padding: 3px; background: #2b1a1a; border-radius: 3px; margin-top: 2px; font-weight: bold;")
+        system_layout.addWidget(self.pb_ram)
+        system_layout.addWidget(self.label_ram_detail)
+        system_layout.addWidget(self.label_process_mem)
+        
+        system_card.setLayout(system_layout)
+        self._dashboard_cards.addWidget(system_card, 0, 2)
+
+    def build_dashboard_disk_card(self):
+        """Build the disk usage card into column 2, row 1 of the dashboard grid"""
+        # Disk Usage Card - Enhanced Task Manager style
+        disk_card = QGroupBox("💾 Disk (C:)")
+        _set_qss(disk_card, _STYLE_CARD_DISK)
+        disk_layout = QVBoxLayout()
+        disk_layout.setSpacing(8)
+        disk_layout.setContentsMargins(15, 20, 15, 15)
+        
+        self.pb_disk = QProgressBar()
+        self.pb_disk.setMaximum(100)
+        self.pb_disk.setMinimumHeight(30)
+        _set_qss(self.pb_disk, _STYLE_PROGRESSBAR_DISK)
+        self.label_disk_detail = QLabel("Free: 0 GB | Total: 0 GB")
+        _set_qss(self.label_disk_detail, "font-size: 11px; color: #aaa; padding: 3px; background: #1a1d23; border-radius: 3px; margin-top: 2px;")
+        
+        disk_layout.addWidget(self.pb_disk)
+        disk_layout.addWidget(self.label_disk_detail)
+        disk_card.setLayout(disk_layout)
+        self._dashboard_cards.addWidget(disk_card, 1, 2)
+
     def build_players(self):
         """Build an enhanced, modern player management interface"""
         layout = QVBoxLayout()
@@ -2946,39 +4970,16 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Online Players Card - Enhanced
         online_card = QGroupBox("🟢 ONLINE PLAYERS")
-        online_card.setStyleSheet("""
-            QGroupBox {
-                border: 3px solid #50fa7b;
-                border-radius: 12px;
-                padding: 15px;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a5f1a, stop:1 #0f3f0f);
-                margin: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                color: #50fa7b;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 5px 10px;
-                background: rgba(80, 250, 123, 0.1);
-                border-radius: 6px;
-            }
-        """)
+        _set_qss(online_card, _STYLE_GROUPBOX_ONLINE)
         online_layout = QVBoxLayout()
         self.label_online_count = QLabel("0")
-        self.label_online_count.setStyleSheet("""
-            font-size: 48px;
-            font-weight: bold;
-            color: #50fa7b;
-            text-align: center;
-        """)
+        _set_qss(self.label_online_count, _STYLE_LABEL_ONLINE_COUNT)
         self.label_online_count.setAlignment(Qt.AlignCenter)
         online_layout.addWidget(self.label_online_count)
 
         # Online player activity indicator
         self.online_activity = QLabel("📋 Log-based monitoring active")
-        self.online_activity.setStyleSheet("font-size: 11px; color: #50fa7b; text-align: center;")
+        _set_qss(self.online_activity, "font-size: 11px; color: #50fa7b; text-align: center;")
         self.online_activity.setAlignment(Qt.AlignCenter)
         online_layout.addWidget(self.online_activity)
 
@@ -2987,38 +4988,15 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Server Status Card - New
         status_card = QGroupBox("🖥️ SERVER STATUS")
-        status_card.setStyleSheet("""
-            QGroupBox {
-                border: 3px solid #8be9fd;
-                border-radius: 12px;
-                padding: 15px;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a3f5f, stop:1 #0f2f4f);
-                margin: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                color: #8be9fd;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 5px 10px;
-                background: rgba(139, 233, 253, 0.1);
-                border-radius: 6px;
-            }
-        """)
+        _set_qss(status_card, _STYLE_GROUPBOX_SERVER_STATUS)
         status_layout = QVBoxLayout()
         self.label_server_status = QLabel("🔴 OFFLINE")
-        self.label_server_status.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #ff5555;
-            text-align: center;
-        """)
+        _set_qss(self.label_server_status, _STYLE_LABEL_SERVER_STATUS)
         self.label_server_status.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.label_server_status)
 
         self.label_uptime_display = QLabel("Uptime: --:--:--")
-        self.label_uptime_display.setStyleSheet("font-size: 12px; color: #8be9fd; text-align: center;")
+        _set_qss(self.label_uptime_display, "font-size: 12px; color: #8be9fd; text-align: center;")
         self.label_uptime_display.setAlignment(Qt.AlignCenter)
         status_layout.addWidget(self.label_uptime_display)
 
@@ -3027,36 +5005,18 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Player Statistics Card - New
         stats_card = QGroupBox("📊 STATISTICS")
-        stats_card.setStyleSheet("""
-            QGroupBox {
-                border: 3px solid #ffb86b;
-                border-radius: 12px;
-                padding: 15px;
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #5f3f1a, stop:1 #3f2f0f);
-                margin: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                color: #ffb86b;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 5px 10px;
-                background: rgba(255, 184, 107, 0.1);
-                border-radius: 6px;
-            }
-        """)
+        _set_qss(stats_card, _STYLE_GROUPBOX_STATS)
         stats_layout = QVBoxLayout()
 
         # Total tracked players
         self.label_total_tracked = QLabel("Total Tracked: 0")
-        self.label_total_tracked.setStyleSheet("font-size: 16px; font-weight: bold; color: #ffb86b; text-align: center;")
+        _set_qss(self.label_total_tracked, "font-size: 16px; font-weight: bold; color: #ffb86b; text-align: center;")
         self.label_total_tracked.setAlignment(Qt.AlignCenter)
         stats_layout.addWidget(self.label_total_tracked)
 
         # Peak players today
         self.label_peak_today = QLabel("Peak Today: 0")
-        self.label_peak_today.setStyleSheet("font-size: 14px; color: #ffb86b; text-align: center;")
+        _set_qss(self.label_peak_today, "font-size: 14px; color: #ffb86b; text-align: center;")
         self.label_peak_today.setAlignment(Qt.AlignCenter)
         stats_layout.addWidget(self.label_peak_today)
 
@@ -3069,48 +5029,19 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Search Section
         search_group = QGroupBox("🔍 SEARCH & FILTER")
-        search_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #6272a4;
-                border-radius: 8px;
-                padding: 10px;
-                background: #2b2f36;
-                margin: 0px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                color: #6272a4;
-                font-size: 13px;
-                padding: 0 8px;
-            }
-        """)
+        _set_qss(search_group, _STYLE_GROUPBOX_SEARCH)
         search_layout = QHBoxLayout()
 
         self.player_search = QLineEdit()
         self.player_search.setPlaceholderText("Search by name, Steam ID, IP...")
-        self.player_search.setStyleSheet("""
-            padding: 8px 12px;
-            font-size: 13px;
-            min-width: 250px;
-            border: 2px solid #44475a;
-            border-radius: 6px;
-            background: #1a1d23;
-            color: #e6eef6;
-        """)
+        _set_qss(self.player_search, _STYLE_PLAYER_SEARCH)
         self.player_search.textChanged.connect(self.filter_players)
         search_layout.addWidget(self.player_search)
 
         # Filter dropdown
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["All Players", "Online Only", "Offline Only", "Admins", "Banned"])
-        self.filter_combo.setStyleSheet("""
-            padding: 8px;
-            font-size: 13px;
-            border: 2px solid #44475a;
-            border-radius: 6px;
-            background: #1a1d23;
-            color: #e6eef6;
-        """)
+        self.filter_combo.addItems(_PLAYER_FILTERS)
+        _set_qss(self.filter_combo, _STYLE_FILTER_COMBO)
         self.filter_combo.currentTextChanged.connect(self.filter_players)
         search_layout.addWidget(self.filter_combo)
 
@@ -3119,62 +5050,27 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Quick Actions
         actions_group = QGroupBox("⚡ QUICK ACTIONS")
-        actions_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #50fa7b;
-                border-radius: 8px;
-                padding: 10px;
-                background: #2b2f36;
-                margin: 0px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                color: #50fa7b;
-                font-size: 13px;
-                padding: 0 8px;
-            }
-        """)
+        _set_qss(actions_group, _STYLE_GROUPBOX_ACTIONS)
         actions_layout = QHBoxLayout()
 
-        self.btn_refresh_players = QPushButton("🔄 Refresh")
+        self.btn_refresh_players = QPushButton("Refresh")
+        self.btn_refresh_players.setIcon(self._icon("refresh"))
         self.btn_refresh_players.clicked.connect(self.populate_players)
-        self.btn_refresh_players.setStyleSheet("""
-            padding: 8px 16px;
-            font-size: 13px;
-            font-weight: bold;
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #50fa7b, stop:1 #3fa56b);
-            border: none;
-            border-radius: 6px;
-            color: #0f1117;
-        """)
+        self.btn_refresh_players.setObjectName("btnRefreshPlayers")
         self.btn_refresh_players.setToolTip("Refresh player list")
         actions_layout.addWidget(self.btn_refresh_players)
 
-        self.btn_kick_all = QPushButton("👢 Kick All")
-        self.btn_kick_all.clicked.connect(lambda: self.send_quick_rcon_command("#kickall"))
-        self.btn_kick_all.setStyleSheet("""
-            padding: 8px 16px;
-            font-size: 13px;
-            font-weight: bold;
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ff5555, stop:1 #cc4444);
-            border: none;
-            border-radius: 6px;
-            color: white;
-        """)
+        self.btn_kick_all = QPushButton("Kick All")
+        self.btn_kick_all.setIcon(self._icon("kick"))
+        self.btn_kick_all.clicked.connect(partial(self.send_quick_rcon_command, "#kickall"))
+        self.btn_kick_all.setObjectName("btnKickAll")
         self.btn_kick_all.setToolTip("Kick all players from server")
         actions_layout.addWidget(self.btn_kick_all)
 
-        self.btn_admin_help = QPushButton("❓ Admin Help")
+        self.btn_admin_help = QPushButton("Admin Help")
+        self.btn_admin_help.setIcon(self._icon("help"))
         self.btn_admin_help.clicked.connect(self.show_admin_help)
-        self.btn_admin_help.setStyleSheet("""
-            padding: 8px 16px;
-            font-size: 13px;
-            font-weight: bold;
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffb86b, stop:1 #cc9544);
-            border: none;
-            border-radius: 6px;
-            color: #0f1117;
-        """)
+        self.btn_admin_help.setObjectName("btnAdminHelp")
         self.btn_admin_help.setToolTip("Show admin password and instructions")
         actions_layout.addWidget(self.btn_admin_help)
 
@@ -3183,31 +5079,13 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Auto-refresh toggle
         refresh_group = QGroupBox("🔄 AUTO-REFRESH")
-        refresh_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #bd93f9;
-                border-radius: 8px;
-                padding: 10px;
-                background: #2b2f36;
-                margin: 0px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                color: #bd93f9;
-                font-size: 13px;
-                padding: 0 8px;
-            }
-        """)
+        refresh_group.setObjectName("grpPlayersRefresh")
         refresh_layout = QVBoxLayout()
 
         self.cb_players_auto_refresh = QCheckBox("Enable Log Monitoring (1s)")
         self.cb_players_auto_refresh.setChecked(True)
-        self.cb_players_auto_refresh.stateChanged.connect(self.toggle_players_auto_refresh)
-        self.cb_players_auto_refresh.setStyleSheet("""
-            font-size: 12px;
-            color: #bd93f9;
-            font-weight: bold;
-        """)
+        self.cb_players_auto_refresh.toggled.connect(self.toggle_players_auto_refresh)
+        _set_qss(self.cb_players_auto_refresh, _STYLE_CB_PLAYERS_AUTO_REFRESH)
         refresh_layout.addWidget(self.cb_players_auto_refresh)
 
         refresh_group.setLayout(refresh_layout)
@@ -3218,31 +5096,12 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # === PLAYERS TABLE ===
         table_group = QGroupBox("👥 PLAYER MANAGEMENT")
-        table_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #6272a4;
-                border-radius: 8px;
-                padding: 10px;
-                background: #1a1d23;
-                margin: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                color: #6272a4;
-                font-size: 16px;
-                padding: 5px 10px;
-                background: rgba(98, 114, 164, 0.1);
-                border-radius: 6px;
-            }
-        """)
+        _set_qss(table_group, _STYLE_GROUPBOX_TABLE)
         table_layout = QVBoxLayout()
 
-        self.table_players = QTableWidget()
-        self.table_players.setColumnCount(8)
-        self.table_players.setHorizontalHeaderLabels([
-            "Status", "Player Name", "Steam ID", "Character", "Connected", "Play Time", "IP Address", "Actions"
-        ])
+        self._players_model = PlayersModel(self)
+        self.table_players = QTableView()
+        self.table_players.setModel(self._players_model)
 
         # Enhanced column widths for better readability
         self.table_players.setColumnWidth(0, 100)   # Status
@@ -3253,69 +5112,28 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         self.table_players.setColumnWidth(5, 100)   # Play Time
         self.table_players.setColumnWidth(6, 130)   # IP Address
         self.table_players.setColumnWidth(7, 220)   # Actions
+        self.table_players.setItemDelegateForColumn(0, StatusDelegate(self))
+        self.table_players.setItemDelegateForColumn(7, ActionDelegate(self))
 
         # Enhanced styling
         self.table_players.setAlternatingRowColors(True)
         self.table_players.verticalHeader().setVisible(False)
-        self.table_players.setSelectionMode(QTableWidget.SingleSelection)
-        self.table_players.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table_players.setSelectionMode(QTableView.SingleSelection)
+        self.table_players.setSelectionBehavior(QTableView.SelectRows)
         self.table_players.verticalHeader().setDefaultSectionSize(50)
+        # Fixed row heights and user-sized columns: the header never has to measure cell
+        # contents, so large row counts lay out in constant time per row
+        self.table_players.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_players.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 
-        self.table_players.setStyleSheet("""
-            QTableWidget {
-                gridline-color: #44475a;
-                selection-background-color: #6272a4;
-                background: #1a1d23;
-                border: 1px solid #44475a;
-                border-radius: 6px;
-                font-size: 13px;
-            }
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #2b2f36;
-                color: #e6eef6;
-            }
-            QTableWidget::item:selected {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6272a4, stop:1 #4c5c8a);
-                color: #ffffff;
-            }
-            QHeaderView::section {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #44475a, stop:1 #363949);
-                color: #f8f8f2;
-                padding: 12px 8px;
-                border: none;
-                font-weight: bold;
-                font-size: 14px;
-                border-right: 1px solid #2b2f36;
-            }
-            QTableWidget::item:hover {
-                background: #2b2f36;
-            }
-        """)
+        _set_qss(self.table_players, _STYLE_TABLE_PLAYERS)
 
         table_layout.addWidget(self.table_players)
         table_group.setLayout(table_layout)
         layout.addWidget(table_group)
         # === RCON CONSOLE ===
         rcon_group = QGroupBox("🔧 RCON COMMAND CONSOLE")
-        rcon_group.setStyleSheet("""
-            QGroupBox {
-                border: 2px solid #bd93f9;
-                border-radius: 8px;
-                padding: 10px;
-                background: #1a1d23;
-                margin: 5px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                color: #bd93f9;
-                font-size: 16px;
-                padding: 5px 10px;
-                background: rgba(189, 147, 249, 0.1);
-                border-radius: 6px;
-            }
-        """)
+        rcon_group.setObjectName("grpPlayersRcon")
         rcon_layout = QVBoxLayout()
 
         # Command input section
@@ -3323,29 +5141,14 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         command_layout.addWidget(QLabel("Command:"))
         self.rcon_command_input = QLineEdit()
         self.rcon_command_input.setPlaceholderText("Enter RCON command (e.g., #kick player_name, #ban steam_id)")
-        self.rcon_command_input.setStyleSheet("""
-            padding: 8px 12px;
-            font-size: 13px;
-            min-width: 400px;
-            border: 2px solid #44475a;
-            border-radius: 6px;
-            background: #0d1016;
-            color: #e6eef6;
-            font-family: 'Consolas', monospace;
-        """)
+        self.rcon_command_input.setFont(self._mono)
+        _set_qss(self.rcon_command_input, _STYLE_RCON_INPUT)
         command_layout.addWidget(self.rcon_command_input)
 
-        self.btn_send_rcon = QPushButton("📤 Send Command")
+        self.btn_send_rcon = QPushButton("Send Command")
+        self.btn_send_rcon.setIcon(self._icon("send"))
         self.btn_send_rcon.clicked.connect(self.send_custom_rcon_command)
-        self.btn_send_rcon.setStyleSheet("""
-            padding: 8px 16px;
-            font-size: 13px;
-            font-weight: bold;
-            background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #bd93f9, stop:1 #9b73d9);
-            border: none;
-            border-radius: 6px;
-            color: white;
-        """)
+        self.btn_send_rcon.setObjectName("btnSendRcon")
         self.btn_send_rcon.setToolTip("Send custom RCON command to server")
         command_layout.addWidget(self.btn_send_rcon)
         rcon_layout.addLayout(command_layout)
@@ -3365,17 +5168,9 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         for name, cmd, tooltip in quick_commands:
             btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, c=cmd: self.send_quick_rcon_command(c))
+            btn.clicked.connect(partial(self.send_quick_rcon_command, cmd))
             btn.setToolTip(tooltip)
-            btn.setStyleSheet("""
-                padding: 6px 12px;
-                font-size: 11px;
-                background: #2b2f36;
-                border: 1px solid #44475a;
-                border-radius: 4px;
-                color: #e6eef6;
-                margin: 2px;
-            """)
+            btn.setProperty("variant", "quick")
             btn.setCursor(Qt.PointingHandCursor)
             quick_layout.addWidget(btn)
 
@@ -3385,21 +5180,18 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Response display
         response_layout = QVBoxLayout()
         response_layout.addWidget(QLabel("Response:"))
-        self.rcon_response_display = QTextEdit()
-        self.rcon_response_display.setReadOnly(True)
+        # One row per reply line: only visible rows are laid out, appends are insertRows and
+        # the scrollback is capped at RCON_MAX_LINES (see _flush_rcon)
+        self._rcon_model = QStringListModel(self)
+        self.rcon_response_display = QListView()
+        self.rcon_response_display.setModel(self._rcon_model)
+        self.rcon_response_display.setUniformItemSizes(True)
+        self.rcon_response_display.setEditTriggers(QListView.NoEditTriggers)
+        self.rcon_response_display.setSelectionMode(QListView.ExtendedSelection)
         self.rcon_response_display.setMaximumHeight(120)
-        self.rcon_response_display.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 2px solid #2b2f36;
-                border-radius: 6px;
-                color: #50fa7b;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-                padding: 8px;
-            }
-        """)
-        self.rcon_response_display.setPlaceholderText("RCON command responses will appear here...")
+        self.rcon_response_display.setFont(self._mono)
+        _set_qss(self.rcon_response_display, _STYLE_RCON_RESPONSE)
+        self.rcon_response_display.setToolTip("RCON command responses will appear here")
         response_layout.addWidget(self.rcon_response_display)
         rcon_layout.addLayout(response_layout)
 
@@ -3432,12 +5224,13 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Header
         header = QHBoxLayout()
         title = QLabel("⚙️ Server Configuration Editor")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #e6eef6;")
+        _set_qss(title, "font-size: 18px; font-weight: bold; color: #e6eef6;")
         header.addWidget(title)
         
         # Config file status
         self.config_status = QLabel("📄 No config loaded")
-        self.config_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self.config_status.setObjectName("statusPill")
+        self.config_status.setProperty("state", "warn")
         header.addWidget(self.config_status)
         
         header.addStretch()
@@ -3447,140 +5240,70 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         toolbar = QHBoxLayout()
         
         # Add Folder button (primary action)
-        self.btn_add_config_folder = QPushButton("� Add Config Folder")
+        self.btn_add_config_folder = QPushButton("Add Config Folder")
+        self.btn_add_config_folder.setIcon(self._icon("folder"))
         self.btn_add_config_folder.clicked.connect(self.add_config_folder)
         self.btn_add_config_folder.setToolTip("Browse and add a folder containing .ini files")
-        self.btn_add_config_folder.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
-                color: #072018;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6ef08b, stop:1 #35c06f);
-            }
-        """)
+        self.btn_add_config_folder.setObjectName("btnAddConfigFolder")
         toolbar.addWidget(self.btn_add_config_folder)
         
         # Auto-detect button
-        self.btn_auto_detect_config = QPushButton("� Auto-Detect")
+        self.btn_auto_detect_config = QPushButton("Auto-Detect")
+        self.btn_auto_detect_config.setIcon(self._icon("detect"))
         self.btn_auto_detect_config.clicked.connect(self.auto_detect_configs)
         self.btn_auto_detect_config.setToolTip("Automatically find server configuration folder")
         toolbar.addWidget(self.btn_auto_detect_config)
         
         # Save All
-        self.btn_save_all_configs = QPushButton("💾 Save All")
+        self.btn_save_all_configs = QPushButton("Save All")
+        self.btn_save_all_configs.setIcon(self._icon("save"))
         self.btn_save_all_configs.clicked.connect(self.save_all_configs)
         self.btn_save_all_configs.setToolTip("Save all configuration files")
         toolbar.addWidget(self.btn_save_all_configs)
         
         # Backup/Restore
-        self.btn_backup_config = QPushButton("📦 Backup")
+        self.btn_backup_config = QPushButton("Backup")
+        self.btn_backup_config.setIcon(self._icon("backup"))
         self.btn_backup_config.clicked.connect(self.backup_all_configs)
         self.btn_backup_config.setToolTip("Create backup of all configuration files")
         toolbar.addWidget(self.btn_backup_config)
         
         # Visual Editor
-        self.btn_visual_editor = QPushButton("🎨 Visual Editor")
+        self.btn_visual_editor = QPushButton("Visual Editor")
+        self.btn_visual_editor.setIcon(self._icon("visual"))
         self.btn_visual_editor.clicked.connect(self.open_visual_config_editor)
         self.btn_visual_editor.setToolTip("Open easy-to-use visual configuration editor")
-        self.btn_visual_editor.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #bd93f9, stop:1 #9b59b6);
-                color: #ffffff;
-                font-weight: bold;
-                padding: 10px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #d4b3ff, stop:1 #bb79d6);
-            }
-        """)
+        self.btn_visual_editor.setObjectName("btnVisualEditor")
         toolbar.addWidget(self.btn_visual_editor)
         
         # SQLiteStudio
-        self.btn_sqlite_studio = QPushButton("🗄️ SQLiteStudio")
+        self.btn_sqlite_studio = QPushButton("SQLiteStudio")
+        self.btn_sqlite_studio.setIcon(self._icon("database"))
         self.btn_sqlite_studio.clicked.connect(self.open_sqlite_studio)
         self.btn_sqlite_studio.setToolTip("Open database in SQLiteStudio for advanced management")
-        self.btn_sqlite_studio.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #f59e0b, stop:1 #d97706);
-                color: #ffffff;
-                font-weight: bold;
-                padding: 10px 16px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #fbbf24, stop:1 #f59e0b);
-            }
-        """)
+        self.btn_sqlite_studio.setObjectName("btnSqliteStudio")
         toolbar.addWidget(self.btn_sqlite_studio)
         
         toolbar.addStretch()
         layout.addLayout(toolbar)
         
-        # Dynamic config tabs (will be populated when folder is loaded)
-        self.config_tabs = QTabWidget()
-        self.config_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #2b2f36;
-                background: #0f1117;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1a1d23, stop:1 #0d1016);
-                border: 1px solid #2b2f36;
-                padding: 10px 18px;
-                margin-right: 2px;
-                color: #e6eef6;
-                font-weight: bold;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            QTabBar::tab:selected {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #2b2f36, stop:1 #1e8b57);
-                border-bottom: 3px solid #50fa7b;
-                color: #50fa7b;
-            }
-            QTabBar::tab:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #2b2f36, stop:1 #1a1d23);
-                color: #8be9fd;
-            }
-        """)
-        
         # Store config file editors in a dictionary
         self.config_editors = {}
-        self.config_file_paths = {}
-        
-        # Placeholder message
-        placeholder_widget = QWidget()
-        placeholder_layout = QVBoxLayout()
-        placeholder_layout.addStretch()
-        
-        placeholder_label = QLabel("📁 No Configuration Files Loaded")
-        placeholder_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #8be9fd;")
-        placeholder_label.setAlignment(Qt.AlignCenter)
-        placeholder_layout.addWidget(placeholder_label)
-        
-        placeholder_hint = QLabel("Click '📁 Add Config Folder' or '🔎 Auto-Detect' to load INI files")
-        placeholder_hint.setStyleSheet("font-size: 12px; color: #ffb86b;")
-        placeholder_hint.setAlignment(Qt.AlignCenter)
-        placeholder_layout.addWidget(placeholder_hint)
-        
-        placeholder_layout.addStretch()
-        placeholder_widget.setLayout(placeholder_layout)
-        
-        self.config_tabs.addTab(placeholder_widget, "🏠 Start Here")
-        
-        # Remove auto-save on tab change to avoid spam
-        # User can explicitly save with Save All button
+        self.config_file_paths = {}
         
-        # Replace tabs with improved split view: tree on left, editor on right
+        # Split view: tree on left, editor on right (editors are created per file on selection)
         config_splitter = QSplitter(Qt.Horizontal)
         
-        # Left: File tree (simple tree widget)
-        self.config_tree = QTreeWidget()
-        self.config_tree.setHeaderLabel("Config Files")
-        self.config_tree.itemClicked.connect(lambda item: self.load_selected_config_file(item.data(0, Qt.UserRole)))
+        # Left: File list backed by QFileSystemModel, which scans the folder on its own
+        # worker thread and only creates rows for what the view shows
+        self._config_fs_model = QFileSystemModel(self)
+        self._config_fs_model.setFilter(QDir.Files | QDir.NoDotAndDotDot)
+        # The model is attached by load_config_directory, so the view stays empty
+        # until a folder is chosen instead of listing the filesystem roots
+        self.config_tree = QTreeView()
+        self.config_tree.setHeaderHidden(True)
+        self.config_tree.setRootIsDecorated(False)
+        self.config_tree.clicked.connect(self._on_config_tree_clicked)
         config_splitter.addWidget(self.config_tree)
         
         # Right: Editor stack (text, visual INI, visual JSON)
@@ -3592,12 +5315,12 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         placeholder_layout.addStretch()
         
         placeholder_label = QLabel("📁 No File Selected")
-        placeholder_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #8be9fd;")
+        _set_qss(placeholder_label, "font-size: 16px; font-weight: bold; color: #8be9fd;")
         placeholder_label.setAlignment(Qt.AlignCenter)
         placeholder_layout.addWidget(placeholder_label)
         
         placeholder_hint = QLabel("Select a file from the tree on the left")
-        placeholder_hint.setStyleSheet("font-size: 12px; color: #ffb86b;")
+        _set_qss(placeholder_hint, "font-size: 12px; color: #ffb86b;")
         placeholder_hint.setAlignment(Qt.AlignCenter)
         placeholder_layout.addWidget(placeholder_hint)
         
@@ -3619,7 +5342,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Config path display
         path_label = QLabel("📁 Config Location:")
         self.config_path_display = QLabel("Not detected")
-        self.config_path_display.setStyleSheet("color: #8be9fd; font-size: 10px; padding: 5px;")
+        self.config_path_display.setProperty("variant", "caption")
         path_layout = QHBoxLayout()
         path_layout.addWidget(path_label)
         path_layout.addWidget(self.config_path_display)
@@ -3627,6 +5350,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         layout.addLayout(path_layout)
         
         self.page_config_editor.setLayout(layout)
+        self._widgets_ready.update(('config_tree', 'config_path_display'))
 
     def build_logs(self):
         """Build enhanced logging system with multiple log types"""
@@ -3635,24 +5359,27 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Header with controls
         header = QHBoxLayout()
         title = QLabel("📋 Server Logs")
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #e6eef6;")
+        _set_qss(title, "font-size: 18px; font-weight: bold; color: #e6eef6;")
         header.addWidget(title)
         header.addStretch()
         
         # Refresh button
-        self.btn_refresh_logs = QPushButton("🔄 Refresh")
+        self.btn_refresh_logs = QPushButton("Refresh")
+        self.btn_refresh_logs.setIcon(self._icon("refresh"))
         self.btn_refresh_logs.clicked.connect(self.refresh_logs)
         self.btn_refresh_logs.setToolTip("Refresh all log viewers")
         header.addWidget(self.btn_refresh_logs)
         
         # Clear logs button
-        self.btn_clear_logs = QPushButton("🗑️ Clear Display")
+        self.btn_clear_logs = QPushButton("Clear Display")
+        self.btn_clear_logs.setIcon(self._icon("clear"))
         self.btn_clear_logs.clicked.connect(self.clear_log_displays)
         self.btn_clear_logs.setToolTip("Clear log displays (doesn't delete files)")
         header.addWidget(self.btn_clear_logs)
         
         # Export logs button
-        self.btn_export_logs = QPushButton("📤 Export")
+        self.btn_export_logs = QPushButton("Export")
+        self.btn_export_logs.setIcon(self._icon("export"))
         self.btn_export_logs.clicked.connect(self.export_logs)
         self.btn_export_logs.setToolTip("Export logs to file")
         header.addWidget(self.btn_export_logs)
@@ -3665,18 +5392,25 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         
         self.log_search = QLineEdit()
         self.log_search.setPlaceholderText("Search in logs...")
-        self.log_search.textChanged.connect(self.filter_logs)
+        # Debounced: filter once typing pauses for 200 ms rather than on every keystroke
+        self._log_search_timer = QTimer(self)
+        self._log_search_timer.setSingleShot(True)
+        self._log_search_timer.setInterval(200)
+        self._log_search_timer.timeout.connect(self.filter_logs)
+        self.log_search.textChanged.connect(lambda _text: self._log_search_timer.start())
         search_layout.addWidget(self.log_search)
         
         search_layout.addWidget(QLabel("📅 Time Range:"))
         self.log_time_filter = QComboBox()
-        self.log_time_filter.addItems(["All Time", "Last Hour", "Last 6 Hours", "Last 24 Hours", "Today", "Last 7 Days"])
+        # Items are added before the slot is connected, so building the combo never
+        # runs a filter pass; keep that order when adding entries
+        self.log_time_filter.addItems(_LOG_TIME_RANGES)
         self.log_time_filter.currentTextChanged.connect(self.filter_logs_by_time)
         search_layout.addWidget(self.log_time_filter)
         
         search_layout.addWidget(QLabel("🎯 Level:"))
         self.log_level_filter = QComboBox()
-        self.log_level_filter.addItems(["All", "Info", "Warning", "Error", "Critical"])
+        self.log_level_filter.addItems(_LOG_LEVELS)
         self.log_level_filter.currentTextChanged.connect(self.filter_logs_by_level)
         search_layout.addWidget(self.log_level_filter)
         
@@ -3685,7 +5419,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         
         # Log tabs for different log types
         log_tabs = QTabWidget()
-        log_tabs.setStyleSheet("""
+        _set_qss(log_tabs, """
             QTabWidget::pane {
                 border: 1px solid #2b2f36;
                 background: #0f1117;
@@ -3703,107 +5437,31 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
             }
         """)
         
-        # Server Log
+        # Server Log (the visible sub-tab, so built now)
         server_log_tab = QWidget()
         server_log_layout = QVBoxLayout()
-        self.text_logs = QTextEdit()
-        self.text_logs.setReadOnly(True)
-        self.text_logs.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.text_logs.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                color: #e6eef6;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
+        self.text_logs = self._make_log_view("#e6eef6")
         server_log_layout.addWidget(self.text_logs)
         server_log_tab.setLayout(server_log_layout)
         log_tabs.addTab(server_log_tab, "🖥️ Server Log")
         
-        # Player Connections Log
-        player_log_tab = QWidget()
-        player_log_layout = QVBoxLayout()
-        self.text_player_logs = QTextEdit()
-        self.text_player_logs.setReadOnly(True)
-        self.text_player_logs.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.text_player_logs.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                color: #e6eef6;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
-        player_log_layout.addWidget(self.text_player_logs)
-        player_log_tab.setLayout(player_log_layout)
-        log_tabs.addTab(player_log_tab, "👥 Player Activity")
-        
-        # Error Log
-        error_log_tab = QWidget()
-        error_log_layout = QVBoxLayout()
-        self.text_error_logs = QTextEdit()
-        self.text_error_logs.setReadOnly(True)
-        self.text_error_logs.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.text_error_logs.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                color: #ff6b6b;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
-        error_log_layout.addWidget(self.text_error_logs)
-        error_log_tab.setLayout(error_log_layout)
-        log_tabs.addTab(error_log_tab, "❌ Errors")
-        
-        # Admin Actions Log
-        admin_log_tab = QWidget()
-        admin_log_layout = QVBoxLayout()
-        self.text_admin_logs = QTextEdit()
-        self.text_admin_logs.setReadOnly(True)
-        self.text_admin_logs.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.text_admin_logs.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                color: #ffb86b;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
-        admin_log_layout.addWidget(self.text_admin_logs)
-        admin_log_tab.setLayout(admin_log_layout)
-        log_tabs.addTab(admin_log_tab, "⚡ Admin Actions")
-        
-        # Events Log
-        events_log_tab = QWidget()
-        events_log_layout = QVBoxLayout()
-        self.text_events_logs = QTextEdit()
-        self.text_events_logs.setReadOnly(True)
-        self.text_events_logs.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.text_events_logs.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                color: #8be9fd;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
-        events_log_layout.addWidget(self.text_events_logs)
-        events_log_tab.setLayout(events_log_layout)
-        log_tabs.addTab(events_log_tab, "📊 Events")
+        # The other sub-tabs start as empty pages; _build_log_tab fills one the first time it is selected
+        for label, builder in (
+            ("👥 Player Activity", self._build_player_log_tab),
+            ("❌ Errors", self._build_error_log_tab),
+            ("⚡ Admin Actions", self._build_admin_log_tab),
+            ("📊 Events", self._build_events_log_tab),
+        ):
+            self._log_tab_builders[log_tabs.addTab(QWidget(), label)] = builder
+        log_tabs.currentChanged.connect(self._build_log_tab)
+        self.log_tabs = log_tabs
         
         layout.addWidget(log_tabs)
         
         # Log statistics
         stats_layout = QHBoxLayout()
         self.log_stats = QLabel("📈 Stats: 0 total | 0 errors | 0 warnings | 0 players")
-        self.log_stats.setStyleSheet("color: #8be9fd; font-size: 10px; padding: 5px;")
+        self.log_stats.setProperty("variant", "caption")
         stats_layout.addWidget(self.log_stats)
         stats_layout.addStretch()
         layout.addLayout(stats_layout)
@@ -3812,6 +5470,55 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Use optimized tail_logs() instead of load_logs() for better performance
         # This loads only the last 1000 lines instead of the entire log file
         self.tail_logs()
+        self._start_log_tailer()
+
+    def _make_log_view(self, color):
+        """Read-only, block-capped log viewer shared by the Logs sub-tabs"""
+        view = QPlainTextEdit()
+        view.setFont(self._mono)
+        view.setReadOnly(True)
+        view.setMaximumBlockCount(LOG_VIEW_MAX_LINES)
+        view.setCenterOnScroll(True)
+        view.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
+        _set_qss(view, f"""
+            QPlainTextEdit {{
+                background: #0d1016;
+                border: 1px solid #2b2f36;
+                color: {color};
+                font-size: 10px;
+            }}
+        """)
+        return view
+
+    def _build_log_tab(self, index):
+        """Fill a placeholder Logs sub-tab the first time it is shown"""
+        builder = self._log_tab_builders.pop(index, None)
+        if builder is None:
+            return
+        page = self.log_tabs.widget(index)
+        page_layout = QVBoxLayout()
+        page_layout.addWidget(builder())
+        page.setLayout(page_layout)
+
+    def _build_player_log_tab(self):
+        self.text_player_logs = self._make_log_view("#e6eef6")
+        self.load_player_logs()
+        return self.text_player_logs
+
+    def _build_error_log_tab(self):
+        self.text_error_logs = self._make_log_view("#ff6b6b")
+        self.load_error_logs()
+        return self.text_error_logs
+
+    def _build_admin_log_tab(self):
+        self.text_admin_logs = self._make_log_view("#ffb86b")
+        self.load_admin_logs()
+        return self.text_admin_logs
+
+    def _build_events_log_tab(self):
+        self.text_events_logs = self._make_log_view("#8be9fd")
+        self.load_events_logs()
+        return self.text_events_logs
 
     def build_bans(self):
         layout = QVBoxLayout()
@@ -3827,9 +5534,8 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         h.addWidget(self.btn_remove_ban)
         layout.addLayout(h)
 
-        self.table_bans = QTableWidget()
-        self.table_bans.setColumnCount(1)
-        self.table_bans.setHorizontalHeaderLabels(["Banned Entry"])
+        self.table_bans = QTableView()
+        self.table_bans.setModel(self._bans_model)
         layout.addWidget(self.table_bans)
         self.page_bans.setLayout(layout)
         self.populate_bans()
@@ -3853,33 +5559,34 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         self.btn_save_settings.setToolTip("Manually save all settings (auto-saves on changes)")
 
         # RCON Settings Group
-        rcon_group = QGroupBox("🔧 RCON Configuration")
-        rcon_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #bd93f9; margin-top: 6px; }")
-        rcon_layout = QGridLayout()
+        rcon_group, rcon_layout = self._make_group("🔧 RCON Configuration", "purple", QFormLayout)
 
         # RCON Host
-        rcon_layout.addWidget(QLabel("RCON Host:"), 0, 0)
         self.rcon_host = QLineEdit("127.0.0.1")
         self.rcon_host.setToolTip("RCON server host (usually 127.0.0.1 for local server)")
-        rcon_layout.addWidget(self.rcon_host, 0, 1)
 
         # RCON Port
-        rcon_layout.addWidget(QLabel("RCON Port:"), 1, 0)
         self.rcon_port = QSpinBox()
-        self.rcon_port.setRange(1024, 65535)
+        self.rcon_port.setRange(*self._PORT_RANGE)
         self.rcon_port.setValue(27015)
         self.rcon_port.setToolTip("RCON server port (usually 27015)")
-        rcon_layout.addWidget(self.rcon_port, 1, 1)
 
         # RCON Password
-        rcon_layout.addWidget(QLabel("RCON Password:"), 2, 0)
         self.rcon_password = QLineEdit()
         self.rcon_password.setEchoMode(QLineEdit.Password)
         self.rcon_password.setPlaceholderText("Enter RCON password")
         self.rcon_password.setToolTip("RCON authentication password")
-        rcon_layout.addWidget(self.rcon_password, 2, 1)
 
-        rcon_group.setLayout(rcon_layout)
+        _add_form_rows(rcon_layout, (
+            ("RCON Host:", self.rcon_host),
+            ("RCON Port:", self.rcon_port),
+            ("RCON Password:", self.rcon_password),
+        ))
+
+        # Keep the cached RCON target in step with manual edits
+        self.rcon_host.editingFinished.connect(self._on_rcon_fields_edited)
+        self.rcon_port.editingFinished.connect(self._on_rcon_fields_edited)
+        self.rcon_password.editingFinished.connect(self._on_rcon_fields_edited)
 
         layout.addWidget(self.label_path)
         layout.addWidget(self.btn_browse)
@@ -3887,6 +5594,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         layout.addWidget(self.btn_save_settings)
         layout.addStretch()
         self.page_settings.setLayout(layout)
+        self._widgets_ready.update(('label_path', 'rcon_host', 'rcon_port', 'rcon_password'))
         self.load_settings()
 
     def build_setup(self):
@@ -3895,73 +5603,48 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Header with status
         header_layout = QHBoxLayout()
         title = QLabel("🚀 Server Setup & Configuration")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #e6eef6; margin-bottom: 5px;")
+        _set_qss(title, "font-size: 20px; font-weight: bold; color: #e6eef6; margin-bottom: 5px;")
         header_layout.addWidget(title)
 
         # Status indicator
         self.setup_status_label = QLabel("⚠️ Setup Incomplete")
-        self.setup_status_label.setStyleSheet("font-size: 12px; color: #ffb86b; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self.setup_status_label.setObjectName("statusPill")
+        self.setup_status_label.setProperty("state", "warn")
         header_layout.addStretch()
         header_layout.addWidget(self.setup_status_label)
 
         layout.addLayout(header_layout)
 
         # Progress bar for setup completion
-        self.setup_progress = QProgressBar()
+        self.setup_progress = _FastProgressBar()
         self.setup_progress.setMaximum(100)
         self.setup_progress.setValue(0)
-        self.setup_progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2b2f36;
-                border-radius: 5px;
-                text-align: center;
-                background: #0d1016;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
-                border-radius: 3px;
-            }
-        """)
         layout.addWidget(self.setup_progress)
 
         # Setup sections
         setup_tabs = QTabWidget()
-        setup_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #2b2f36;
-                background: #0f1117;
-            }
-            QTabBar::tab {
-                background: #1a1d23;
-                border: 1px solid #2b2f36;
-                padding: 8px 16px;
-                margin-right: 2px;
-                color: #e6eef6;
-            }
-            QTabBar::tab:selected {
-                background: #2b2f36;
-                border-bottom: 2px solid #1e8b57;
-            }
-        """)
+        _set_qss(setup_tabs, _STYLE_SETUP_TABS)
+        if STYLED:
+            tab_style = SetupTabStyle()
+            tab_style.setParent(setup_tabs.tabBar())  # QWidget.setStyle doesn't take ownership
+            setup_tabs.tabBar().setStyle(tab_style)
 
         # === BASIC SETUP TAB ===
         basic_tab = QWidget()
         basic_layout = QVBoxLayout()
 
         # Server Installation Section
-        install_group = QGroupBox("📁 Server Installation")
-        install_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #1e8b57; margin-top: 6px; }")
-        install_layout = QVBoxLayout()
+        install_group, install_layout = self._make_group("📁 Server Installation", "teal")
 
         # Server Path
         path_layout = QHBoxLayout()
         path_layout.addWidget(QLabel("Server Executable:"))
         self.setup_label_path = QLabel(self.scum_path or "Not configured")
-        self.setup_label_path.setStyleSheet("font-size: 12px; padding: 5px; background: #0d1016; border-radius: 3px; border: 1px solid #2b2f36;")
-        self.setup_btn_browse = QPushButton("🔍 Browse")
+        _set_qss(self.setup_label_path, "font-size: 12px; padding: 5px; background: #0d1016; border-radius: 3px; border: 1px solid #2b2f36;")
+        self.setup_btn_browse = QPushButton(self._icon("search"), "Browse")
         self.setup_btn_browse.clicked.connect(self.pick_scum)
         self.setup_btn_browse.setToolTip("Locate SCUMServer.exe")
-        self.setup_btn_auto_detect = QPushButton("🔎 Auto-Detect")
+        self.setup_btn_auto_detect = QPushButton(self._icon("magnify"), "Auto-Detect")
         self.setup_btn_auto_detect.clicked.connect(self.auto_detect_server)
         self.setup_btn_auto_detect.setToolTip("Automatically find SCUMServer.exe")
         path_layout.addWidget(self.setup_label_path, 1)
@@ -3971,77 +5654,67 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Installation status
         self.install_status = QLabel("❌ Server not found")
-        self.install_status.setStyleSheet("color: #ff6b6b; font-size: 11px;")
+        _set_qss(self.install_status, self._SS_INSTALL_MISSING)
         install_layout.addWidget(self.install_status)
 
-        install_group.setLayout(install_layout)
         basic_layout.addWidget(install_group)
 
         # Server Configuration Section
-        config_group = QGroupBox("⚙️ Server Configuration")
-        config_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #ffb86b; margin-top: 6px; }")
-        config_layout = QGridLayout()
+        config_group, config_layout = self._make_group("⚙️ Server Configuration", "orange", QFormLayout)
 
         # Server Name
-        config_layout.addWidget(QLabel("Server Name:"), 0, 0)
         self.setup_server_name = QLineEdit("My SCUM Server")
         self.setup_server_name.setToolTip("Display name for your server")
         self.setup_server_name.textChanged.connect(self.update_setup_status)
-        config_layout.addWidget(self.setup_server_name, 0, 1)
 
         # Max Players
-        config_layout.addWidget(QLabel("Max Players:"), 1, 0)
-        self.setup_max_players = QSpinBox()
-        self.setup_max_players.setRange(1, 100)
-        self.setup_max_players.setValue(50)
+        self.setup_max_players = _IntEdit(*self._MAX_PLAYERS_RANGE, 50)
         self.setup_max_players.setToolTip("Maximum number of players (1-100)")
-        self.setup_max_players.valueChanged.connect(self.update_setup_status)
-        config_layout.addWidget(self.setup_max_players, 1, 1)
+        self.setup_max_players.textChanged.connect(self.update_setup_status)
 
         # Port
-        config_layout.addWidget(QLabel("Server Port:"), 2, 0)
         port_layout = QHBoxLayout()
-        self.setup_port = QSpinBox()
-        self.setup_port.setRange(1024, 65535)
-        self.setup_port.setValue(27015)
+        self.setup_port = _IntEdit(*self._PORT_RANGE, 27015)
         self.setup_port.setToolTip("Server port (1024-65535)")
-        self.setup_port.valueChanged.connect(self.update_setup_status)
+        self.setup_port.textChanged.connect(self.update_setup_status)
         port_layout.addWidget(self.setup_port)
 
-        self.setup_port_test = QPushButton("🧪 Test Port")
+        self.setup_port_test = QPushButton(self._icon("test"), "Test Port")
         self.setup_port_test.clicked.connect(self.test_server_port)
         self.setup_port_test.setToolTip("Check if port is available")
         port_layout.addWidget(self.setup_port_test)
         port_layout.addStretch()
-        config_layout.addLayout(port_layout, 2, 1)
 
         # Password
-        config_layout.addWidget(QLabel("Server Password:"), 3, 0)
         self.setup_password = QLineEdit()
         self.setup_password.setEchoMode(QLineEdit.Password)
         self.setup_password.setPlaceholderText("Optional - leave empty for no password")
         self.setup_password.setToolTip("Server access password (optional)")
-        config_layout.addWidget(self.setup_password, 3, 1)
 
         # Difficulty
-        config_layout.addWidget(QLabel("Difficulty:"), 4, 0)
         self.setup_difficulty = QComboBox()
-        self.setup_difficulty.addItems(["0 - Peaceful", "1 - Easy", "2 - Normal", "3 - Hard", "4 - Extreme"])
+        self.setup_difficulty.addItems(_DIFFICULTIES)
         self.setup_difficulty.setCurrentIndex(2)
         self.setup_difficulty.setToolTip("Game difficulty level")
-        config_layout.addWidget(self.setup_difficulty, 4, 1)
 
-        config_group.setLayout(config_layout)
+        _add_form_rows(config_layout, (
+            ("Server Name:", self.setup_server_name),
+            ("Max Players:", self.setup_max_players),
+            ("Server Port:", port_layout),
+            ("Server Password:", self.setup_password),
+            ("Difficulty:", self.setup_difficulty),
+        ))
+
         basic_layout.addWidget(config_group)
 
         # Save Basic Settings
         basic_buttons = QHBoxLayout()
-        self.setup_btn_save_basic = QPushButton("💾 Save Basic Settings")
+        self.setup_btn_save_basic = QPushButton(self._icon("disk"), "Save Basic Settings")
         self.setup_btn_save_basic.clicked.connect(self.save_basic_setup)
         self.setup_btn_save_basic.setToolTip("Save server configuration")
         basic_buttons.addWidget(self.setup_btn_save_basic)
 
-        self.setup_btn_generate_config = QPushButton("📄 Generate Config File")
+        self.setup_btn_generate_config = QPushButton(self._icon("document"), "Generate Config File")
         self.setup_btn_generate_config.clicked.connect(self.generate_server_config)
         self.setup_btn_generate_config.setToolTip("Create server config files")
         basic_buttons.addWidget(self.setup_btn_generate_config)
@@ -4056,50 +5729,22 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         advanced_layout = QVBoxLayout()
 
         # Directory Configuration
-        dir_group = QGroupBox("📂 Directory Configuration")
-        dir_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #bd93f9; margin-top: 6px; }")
-        dir_layout = QGridLayout()
-
-        # Logs Directory
-        dir_layout.addWidget(QLabel("Logs Directory:"), 0, 0)
-        logs_layout = QHBoxLayout()
-        self.setup_logs_dir = QLineEdit("Logs")
-        self.setup_logs_dir.setToolTip("Directory for server logs")
-        self.setup_btn_logs_browse = QPushButton("📁")
-        self.setup_btn_logs_browse.clicked.connect(lambda: self.browse_directory(self.setup_logs_dir))
-        logs_layout.addWidget(self.setup_logs_dir)
-        logs_layout.addWidget(self.setup_btn_logs_browse)
-        dir_layout.addLayout(logs_layout, 0, 1)
-
-        # Config Directory
-        dir_layout.addWidget(QLabel("Config Directory:"), 1, 0)
-        config_dir_layout = QHBoxLayout()
-        self.setup_config_dir = QLineEdit("Config")
-        self.setup_config_dir.setToolTip("Directory for server configuration")
-        self.setup_btn_config_browse = QPushButton("📁")
-        self.setup_btn_config_browse.clicked.connect(lambda: self.browse_directory(self.setup_config_dir))
-        config_dir_layout.addWidget(self.setup_config_dir)
-        config_dir_layout.addWidget(self.setup_btn_config_browse)
-        dir_layout.addLayout(config_dir_layout, 1, 1)
-
-        # Save Directory
-        dir_layout.addWidget(QLabel("Save Directory:"), 2, 0)
-        save_layout = QHBoxLayout()
-        self.setup_save_dir = QLineEdit("Save")
-        self.setup_save_dir.setToolTip("Directory for save files")
-        self.setup_btn_save_browse = QPushButton("📁")
-        self.setup_btn_save_browse.clicked.connect(lambda: self.browse_directory(self.setup_save_dir))
-        save_layout.addWidget(self.setup_save_dir)
-        save_layout.addWidget(self.setup_btn_save_browse)
-        dir_layout.addLayout(save_layout, 2, 1)
-
-        dir_group.setLayout(dir_layout)
+        dir_group, dir_layout = self._make_group("📂 Directory Configuration", "purple", QFormLayout)
+
+        # Logs / Config / Save directories
+        self.setup_logs_dir, logs_layout = self._make_dir_row("Logs", "Directory for server logs")
+        self.setup_config_dir, config_dir_layout = self._make_dir_row("Config", "Directory for server configuration")
+        self.setup_save_dir, save_layout = self._make_dir_row("Save", "Directory for save files")
+        _add_form_rows(dir_layout, (
+            ("Logs Directory:", logs_layout),
+            ("Config Directory:", config_dir_layout),
+            ("Save Directory:", save_layout),
+        ))
+
         advanced_layout.addWidget(dir_group)
 
         # Performance & Automation
-        perf_group = QGroupBox("⚡ Performance & Automation")
-        perf_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #50fa7b; margin-top: 6px; }")
-        perf_layout = QVBoxLayout()
+        perf_group, perf_layout = self._make_group("⚡ Performance & Automation", "green")
 
         # Auto-restart
         restart_layout = QHBoxLayout()
@@ -4109,9 +5754,7 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         restart_layout.addWidget(self.setup_auto_restart)
 
         restart_layout.addWidget(QLabel("Restart Delay (seconds):"))
-        self.setup_restart_delay = QSpinBox()
-        self.setup_restart_delay.setRange(5, 300)
-        self.setup_restart_delay.setValue(30)
+        self.setup_restart_delay = _IntEdit(*self._RESTART_DELAY_RANGE, 30)
         self.setup_restart_delay.setToolTip("Delay before auto-restart")
         restart_layout.addWidget(self.setup_restart_delay)
         restart_layout.addStretch()
@@ -4125,12 +5768,10 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         backup_layout.addWidget(self.setup_auto_backup)
 
         backup_layout.addWidget(QLabel("Backup Interval (minutes):"))
-        self.setup_backup_interval = QSpinBox()
-        self.setup_backup_interval.setRange(15, 1440)
-        self.setup_backup_interval.setValue(60)
+        self.setup_backup_interval = _IntEdit(*self._BACKUP_INTERVAL_RANGE, 60)
         self.setup_backup_interval.setToolTip("Backup frequency in minutes")
         self.setup_backup_interval.setEnabled(False)
-        self.setup_auto_backup.stateChanged.connect(lambda: self.setup_backup_interval.setEnabled(self.setup_auto_backup.isChecked()))
+        self.setup_auto_backup.toggled.connect(self.setup_backup_interval.setEnabled)
         backup_layout.addWidget(self.setup_backup_interval)
         backup_layout.addStretch()
         perf_layout.addLayout(backup_layout)
@@ -4138,57 +5779,47 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         # Memory limits
         memory_layout = QHBoxLayout()
         memory_layout.addWidget(QLabel("Memory Limit (MB):"))
-        self.setup_memory_limit = QSpinBox()
-        self.setup_memory_limit.setRange(1024, 16384)
-        self.setup_memory_limit.setValue(4096)
+        self.setup_memory_limit = _IntEdit(*self._MEMORY_RANGE, 4096)
         self.setup_memory_limit.setToolTip("Maximum RAM usage (MB)")
         memory_layout.addWidget(self.setup_memory_limit)
 
         memory_layout.addWidget(QLabel("CPU Priority:"))
         self.setup_cpu_priority = QComboBox()
-        self.setup_cpu_priority.addItems(["Low", "Normal", "High", "Realtime"])
+        self.setup_cpu_priority.addItems(_CPU_PRIORITIES)
         self.setup_cpu_priority.setCurrentText("High")
         self.setup_cpu_priority.setToolTip("Server process priority")
         memory_layout.addWidget(self.setup_cpu_priority)
         memory_layout.addStretch()
         perf_layout.addLayout(memory_layout)
 
-        perf_group.setLayout(perf_layout)
         advanced_layout.addWidget(perf_group)
 
         # Network Settings
-        network_group = QGroupBox("🌐 Network Settings")
-        network_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #8be9fd; margin-top: 6px; }")
-        network_layout = QGridLayout()
+        network_group, network_layout = self._make_group("🌐 Network Settings", "cyan", QFormLayout)
 
         # Query Port
-        network_layout.addWidget(QLabel("Query Port:"), 0, 0)
-        self.setup_query_port = QSpinBox()
-        self.setup_query_port.setRange(1024, 65535)
-        self.setup_query_port.setValue(27016)
+        self.setup_query_port = _IntEdit(*self._PORT_RANGE, 27016)
         self.setup_query_port.setToolTip("Steam query port")
-        network_layout.addWidget(self.setup_query_port, 0, 1)
 
         # RCON Settings
-        network_layout.addWidget(QLabel("RCON Port:"), 1, 0)
-        self.setup_rcon_port = QSpinBox()
-        self.setup_rcon_port.setRange(1024, 65535)
-        self.setup_rcon_port.setValue(27017)
+        self.setup_rcon_port = _IntEdit(*self._PORT_RANGE, 27017)
         self.setup_rcon_port.setToolTip("Remote console port")
-        network_layout.addWidget(self.setup_rcon_port, 1, 1)
 
-        network_layout.addWidget(QLabel("RCON Password:"), 2, 0)
         self.setup_rcon_password = QLineEdit()
         self.setup_rcon_password.setEchoMode(QLineEdit.Password)
         self.setup_rcon_password.setPlaceholderText("Set RCON password")
         self.setup_rcon_password.setToolTip("Remote console password")
-        network_layout.addWidget(self.setup_rcon_password, 2, 1)
 
-        network_group.setLayout(network_layout)
+        _add_form_rows(network_layout, (
+            ("Query Port:", self.setup_query_port),
+            ("RCON Port:", self.setup_rcon_port),
+            ("RCON Password:", self.setup_rcon_password),
+        ))
+
         advanced_layout.addWidget(network_group)
 
         # Save Advanced Settings
-        self.setup_btn_save_advanced = QPushButton("💾 Save Advanced Settings")
+        self.setup_btn_save_advanced = QPushButton(self._icon("disk"), "Save Advanced Settings")
         self.setup_btn_save_advanced.clicked.connect(self.save_advanced_setup)
         self.setup_btn_save_advanced.setToolTip("Save advanced configuration")
         advanced_layout.addWidget(self.setup_btn_save_advanced)
@@ -4197,14 +5828,67 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         advanced_tab.setLayout(advanced_layout)
         setup_tabs.addTab(advanced_tab, "🔧 Advanced Setup")
 
-        # === QUICK SETUP TAB ===
+        # Quick Setup and Download start as empty pages; _build_setup_tab fills one the first
+        # time it is selected (Basic and Advanced are built now: the setup score reads both)
+        for label, builder in (
+            ("⚡ Quick Setup", self._build_quick_setup_tab),
+            ("📥 Download SteamCMD and SCUM Server", self._build_download_setup_tab),
+        ):
+            self._setup_tab_builders[setup_tabs.addTab(QWidget(), label)] = builder
+        setup_tabs.currentChanged.connect(self._build_setup_tab)
+        self.setup_tabs = setup_tabs
+
+        layout.addWidget(setup_tabs)
+        self.page_setup.setLayout(layout)
+        self._widgets_ready.update(('setup_label_path', 'install_status', 'setup_server_name'))
+
+        # Score the defaults now; saved setup data is read off the GUI thread and applied
+        # through setupConfigLoaded once it arrives, so the page paints without waiting on disk
+        self._recompute_setup_status()
+        threading.Thread(target=lambda: self.setupConfigLoaded.emit(self._read_setup_config()),
+                         daemon=True).start()
+
+    def _make_group(self, title, accent, layout_cls=QVBoxLayout):
+        """Group box tinted by an APP_QSS accent rule, with a fresh layout; returns (group, layout)"""
+        group = QGroupBox(title)
+        group.setProperty("accent", accent)
+        layout = layout_cls()
+        group.setLayout(layout)
+        return group, layout
+
+    def _make_dir_row(self, default, tooltip, auto_detect=None, auto_detect_tip=""):
+        """Line edit + browse button (+ optional Auto-Detect) in one row; returns (edit, layout)"""
+        edit = QLineEdit(default)
+        edit.setToolTip(tooltip)
+        browse = QPushButton(self._icon("open_folder"), "")
+        browse.clicked.connect(partial(self.browse_directory, edit))
+        row = QHBoxLayout()
+        row.addWidget(edit)
+        row.addWidget(browse)
+        if auto_detect is not None:
+            detect = QPushButton(self._icon("magnify"), "Auto-Detect")
+            detect.clicked.connect(auto_detect)
+            detect.setToolTip(auto_detect_tip)
+            row.addWidget(detect)
+        return edit, row
+
+    def _build_setup_tab(self, index):
+        """Fill a placeholder Setup sub-tab the first time it is shown"""
+        builder = self._setup_tab_builders.pop(index, None)
+        if builder is None:
+            return
+        page = self.setup_tabs.widget(index)
+        page_layout = QVBoxLayout()
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(builder())
+        page.setLayout(page_layout)
+
+    def _build_quick_setup_tab(self):
         quick_tab = QWidget()
         quick_layout = QVBoxLayout()
 
         # Quick Setup Wizard
-        wizard_group = QGroupBox("🚀 Quick Setup Wizard")
-        wizard_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #ff79c6; margin-top: 6px; }")
-        wizard_layout = QVBoxLayout()
+        wizard_group, wizard_layout = self._make_group("🚀 Quick Setup Wizard", "pink")
 
         # Setup steps
         steps_layout = QVBoxLayout()
@@ -4231,69 +5915,64 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
 
         # Quick setup buttons
         quick_buttons = QHBoxLayout()
-        self.setup_btn_quick_setup = QPushButton("🚀 Run Complete Setup")
+        self.setup_btn_quick_setup = QPushButton(self._icon("rocket"), "Run Complete Setup")
         self.setup_btn_quick_setup.clicked.connect(self.run_complete_quick_setup)
         self.setup_btn_quick_setup.setToolTip("Run full automated setup")
         quick_buttons.addWidget(self.setup_btn_quick_setup)
 
-        self.setup_btn_validate = QPushButton("✅ Validate Setup")
+        self.setup_btn_validate = QPushButton(self._icon("verify"), "Validate Setup")
         self.setup_btn_validate.clicked.connect(self.validate_complete_setup)
         self.setup_btn_validate.setToolTip("Check if all settings are configured")
         quick_buttons.addWidget(self.setup_btn_validate)
 
         wizard_layout.addLayout(quick_buttons)
-        wizard_group.setLayout(wizard_layout)
         quick_layout.addWidget(wizard_group)
 
         # Import/Export
-        io_group = QGroupBox("💾 Import/Export Configuration")
-        io_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #f1fa8c; margin-top: 6px; }")
-        io_layout = QHBoxLayout()
+        io_group, io_layout = self._make_group("💾 Import/Export Configuration", "yellow", QHBoxLayout)
 
-        self.setup_btn_export = QPushButton("📤 Export Config")
+        self.setup_btn_export = QPushButton(self._icon("upload"), "Export Config")
         self.setup_btn_export.clicked.connect(self.export_setup_config)
         self.setup_btn_export.setToolTip("Save configuration to file")
         io_layout.addWidget(self.setup_btn_export)
 
-        self.setup_btn_import = QPushButton("📥 Import Config")
+        self.setup_btn_import = QPushButton(self._icon("download"), "Import Config")
         self.setup_btn_import.clicked.connect(self.import_setup_config)
         self.setup_btn_import.setToolTip("Load configuration from file")
         io_layout.addWidget(self.setup_btn_import)
 
         io_layout.addStretch()
-        io_group.setLayout(io_layout)
         quick_layout.addWidget(io_group)
 
         quick_layout.addStretch()
         quick_tab.setLayout(quick_layout)
-        setup_tabs.addTab(quick_tab, "⚡ Quick Setup")
+        return quick_tab
 
-        # === DOWNLOAD STEAMCMD AND SCUM SERVER TAB ===
+    def _build_download_setup_tab(self):
         download_tab = QWidget()
         download_layout = QVBoxLayout()
 
         # SteamCMD Download Section
-        steamcmd_group = QGroupBox("🔄 SteamCMD Installation")
-        steamcmd_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #ff5555; margin-top: 6px; }")
-        steamcmd_layout = QVBoxLayout()
+        steamcmd_group, steamcmd_layout = self._make_group("🔄 SteamCMD Installation", "red")
 
         # SteamCMD status
         steamcmd_status_layout = QHBoxLayout()
         steamcmd_status_layout.addWidget(QLabel("SteamCMD Status:"))
         self.steamcmd_status = QLabel("❌ Not installed")
-        self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self.steamcmd_status.setObjectName("statusPill")
+        self.steamcmd_status.setProperty("state", "bad")
         steamcmd_status_layout.addWidget(self.steamcmd_status)
         steamcmd_status_layout.addStretch()
         steamcmd_layout.addLayout(steamcmd_status_layout)
 
         # SteamCMD installation
         steamcmd_buttons = QHBoxLayout()
-        self.btn_download_steamcmd = QPushButton("📥 Download SteamCMD")
+        self.btn_download_steamcmd = QPushButton(self._icon("download"), "Download SteamCMD")
         self.btn_download_steamcmd.clicked.connect(self.download_steamcmd)
         self.btn_download_steamcmd.setToolTip("Download and install SteamCMD")
         steamcmd_buttons.addWidget(self.btn_download_steamcmd)
 
-        self.btn_verify_steamcmd = QPushButton("✅ Verify SteamCMD")
+        self.btn_verify_steamcmd = QPushButton(self._icon("verify"), "Verify SteamCMD")
         self.btn_verify_steamcmd.clicked.connect(self.verify_steamcmd)
         self.btn_verify_steamcmd.setToolTip("Check if SteamCMD is properly installed")
         steamcmd_buttons.addWidget(self.btn_verify_steamcmd)
@@ -4301,127 +5980,52 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         steamcmd_layout.addLayout(steamcmd_buttons)
 
         # SteamCMD directory
-        steamcmd_dir_layout = QHBoxLayout()
-        steamcmd_dir_layout.addWidget(QLabel("SteamCMD Directory:"))
-        self.steamcmd_dir = QLineEdit("SteamCMD")
-        self.steamcmd_dir.setToolTip("Directory where SteamCMD will be installed")
-        self.btn_steamcmd_browse = QPushButton("📁")
-        self.btn_steamcmd_browse.clicked.connect(lambda: self.browse_directory(self.steamcmd_dir))
-        self.btn_steamcmd_auto_detect = QPushButton("🔎 Auto-Detect")
-        self.btn_steamcmd_auto_detect.clicked.connect(self.auto_detect_steamcmd_dir)
-        self.btn_steamcmd_auto_detect.setToolTip("Automatically find SteamCMD directory")
-        steamcmd_dir_layout.addWidget(self.steamcmd_dir)
-        steamcmd_dir_layout.addWidget(self.btn_steamcmd_browse)
-        steamcmd_dir_layout.addWidget(self.btn_steamcmd_auto_detect)
+        self.steamcmd_dir, steamcmd_dir_layout = self._make_dir_row(
+            "SteamCMD", "Directory where SteamCMD will be installed",
+            self.auto_detect_steamcmd_dir, "Automatically find SteamCMD directory")
+        steamcmd_dir_layout.insertWidget(0, QLabel("SteamCMD Directory:"))
         steamcmd_layout.addLayout(steamcmd_dir_layout)
 
-        steamcmd_group.setLayout(steamcmd_layout)
         download_layout.addWidget(steamcmd_group)
 
         # SCUM Server Download Section
-        scum_group = QGroupBox("🎮 SCUM Server Download")
-        scum_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #50fa7b; margin-top: 6px; }")
-        scum_layout = QVBoxLayout()
+        scum_group, scum_layout = self._make_group("🎮 SCUM Server Download", "green")
 
         # SCUM server status
         scum_status_layout = QHBoxLayout()
         scum_status_layout.addWidget(QLabel("SCUM Server Status:"))
         self.scum_server_status = QLabel("❌ Not downloaded")
-        self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self.scum_server_status.setObjectName("statusPill")
+        self.scum_server_status.setProperty("state", "bad")
         scum_status_layout.addWidget(self.scum_server_status)
         scum_status_layout.addStretch()
         scum_layout.addLayout(scum_status_layout)
 
         # SCUM server directory
-        scum_dir_layout = QHBoxLayout()
-        scum_dir_layout.addWidget(QLabel("Server Directory:"))
-        self.scum_server_dir = QLineEdit("SCUM_Server")
-        self.scum_server_dir.setToolTip("Directory where SCUM server will be downloaded")
-        self.btn_scum_browse = QPushButton("📁")
-        self.btn_scum_browse.clicked.connect(lambda: self.browse_directory(self.scum_server_dir))
-        self.btn_scum_auto_detect = QPushButton("🔎 Auto-Detect")
-        self.btn_scum_auto_detect.clicked.connect(self.auto_detect_scum_server_dir)
-        self.btn_scum_auto_detect.setToolTip("Automatically find SCUM server directory")
-        scum_dir_layout.addWidget(self.scum_server_dir)
-        scum_dir_layout.addWidget(self.btn_scum_browse)
-        scum_dir_layout.addWidget(self.btn_scum_auto_detect)
+        self.scum_server_dir, scum_dir_layout = self._make_dir_row(
+            "SCUM_Server", "Directory where SCUM server will be downloaded",
+            self.auto_detect_scum_server_dir, "Automatically find SCUM server directory")
+        scum_dir_layout.insertWidget(0, QLabel("Server Directory:"))
         scum_layout.addLayout(scum_dir_layout)
 
-        # Connection progress bar (separate from download progress)
-        connection_progress_layout = QVBoxLayout()
-        
-        # Connection progress bar
-        self.connection_progress_bar = QProgressBar()
-        self.connection_progress_bar.setMaximum(100)
-        self.connection_progress_bar.setValue(0)
-        self.connection_progress_bar.setVisible(False)
-        self.connection_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2b2f36;
-                border-radius: 5px;
-                text-align: center;
-                background: #0d1016;
-                font-size: 11px;
-                font-weight: bold;
-                color: #e6eef6;
-                min-height: 20px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #8be9fd, stop:1 #6eb5d8);
-                border-radius: 3px;
-            }
-        """)
-        self.connection_progress_bar.setFormat("🔌 Connecting to Steam... %p%")
-        connection_progress_layout.addWidget(self.connection_progress_bar)
-        
-        # Connection status label
-        self.connection_status_label = QLabel("")
-        self.connection_status_label.setStyleSheet("color: #8be9fd; font-size: 10px; padding: 2px;")
-        self.connection_status_label.setVisible(False)
-        connection_progress_layout.addWidget(self.connection_status_label)
-        
-        scum_layout.addLayout(connection_progress_layout)
-        
-        # Main download progress bar
-        download_progress_layout = QVBoxLayout()
-        
-        self.scum_download_progress = QProgressBar()
-        self.scum_download_progress.setMaximum(100)
-        self.scum_download_progress.setValue(0)
-        self.scum_download_progress.setVisible(False)
-        self.scum_download_progress.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #2b2f36;
-                border-radius: 5px;
-                text-align: center;
-                background: #0d1016;
-                font-size: 12px;
-                font-weight: bold;
-                color: #e6eef6;
-                min-height: 25px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
-                border-radius: 3px;
-            }
-        """)
-        download_progress_layout.addWidget(self.scum_download_progress)
-        
-        scum_layout.addLayout(download_progress_layout)
+        # The connection/download progress widgets stay hidden until a download or update
+        # starts, so they are only built then (see _ensure_download_widgets); this holds their slot
+        self._download_progress_layout = QVBoxLayout()
+        scum_layout.addLayout(self._download_progress_layout)
 
         # Download buttons
         scum_buttons = QHBoxLayout()
-        self.btn_download_scum = QPushButton("🎮 Download SCUM Server")
+        self.btn_download_scum = QPushButton(self._icon("game"), "Download SCUM Server")
         self.btn_download_scum.clicked.connect(self.download_scum_server)
         self.btn_download_scum.setToolTip("Download SCUM dedicated server using SteamCMD")
         scum_buttons.addWidget(self.btn_download_scum)
 
-        self.btn_verify_scum = QPushButton("✅ Verify SCUM Server")
+        self.btn_verify_scum = QPushButton(self._icon("verify"), "Verify SCUM Server")
         self.btn_verify_scum.clicked.connect(self.verify_scum_server)
         self.btn_verify_scum.setToolTip("Check if SCUM server is properly downloaded")
         scum_buttons.addWidget(self.btn_verify_scum)
 
-        self.btn_update_scum = QPushButton("🔄 Update SCUM Server")
+        self.btn_update_scum = QPushButton(self._icon("update"), "Update SCUM Server")
         self.btn_update_scum.clicked.connect(self.update_scum_server)
         self.btn_update_scum.setToolTip("Update SCUM server to latest version")
         scum_buttons.addWidget(self.btn_update_scum)
@@ -4429,90 +6033,130 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         scum_layout.addLayout(scum_buttons)
 
         # Download log
-        self.scum_download_log = QTextEdit()
+        self.scum_download_log = _CachedLogEdit()
         self.scum_download_log.setMaximumHeight(150)
-        self.scum_download_log.setReadOnly(True)
         self.scum_download_log.setTextInteractionFlags(Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard)
-        self.scum_download_log.setStyleSheet("""
-            QTextEdit {
-                background: #0d1016;
-                border: 1px solid #2b2f36;
-                border-radius: 5px;
-                color: #e6eef6;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-        """)
+        self.scum_download_log.setFont(self._mono)
+        _set_qss(self.scum_download_log, _STYLE_DOWNLOAD_LOG)
         self.scum_download_log.setPlaceholderText("Download progress and logs will appear here...")
         scum_layout.addWidget(self.scum_download_log)
 
-        scum_group.setLayout(scum_layout)
         download_layout.addWidget(scum_group)
 
         # Quick Actions
-        actions_group = QGroupBox("⚡ Quick Actions")
-        actions_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #bd93f9; margin-top: 6px; }")
-        actions_layout = QHBoxLayout()
+        actions_group, actions_layout = self._make_group("⚡ Quick Actions", "purple", QHBoxLayout)
 
-        self.btn_download_all = QPushButton("🚀 Download Everything")
+        self.btn_download_all = QPushButton(self._icon("rocket"), "Download Everything")
         self.btn_download_all.clicked.connect(self.download_everything)
         self.btn_download_all.setToolTip("Download SteamCMD and SCUM server in sequence")
         actions_layout.addWidget(self.btn_download_all)
 
-        self.btn_check_updates = QPushButton("🔍 Check for Updates")
+        self.btn_check_updates = QPushButton(self._icon("search"), "Check for Updates")
         self.btn_check_updates.clicked.connect(self.check_for_updates)
         self.btn_check_updates.setToolTip("Check if SCUM server updates are available")
         actions_layout.addWidget(self.btn_check_updates)
 
-        self.btn_save_config = QPushButton("💾 Save Config")
+        self.btn_save_config = QPushButton(self._icon("disk"), "Save Config")
         self.btn_save_config.clicked.connect(self.save_download_config)
         self.btn_save_config.setToolTip("Save current download configuration")
         actions_layout.addWidget(self.btn_save_config)
 
-        self.btn_import_config = QPushButton("📥 Import Config")
+        self.btn_import_config = QPushButton(self._icon("download"), "Import Config")
         self.btn_import_config.clicked.connect(self.import_download_config)
         self.btn_import_config.setToolTip("Import download configuration from file")
         actions_layout.addWidget(self.btn_import_config)
 
-        self.btn_export_config = QPushButton("📤 Export Config")
+        self.btn_export_config = QPushButton(self._icon("upload"), "Export Config")
         self.btn_export_config.clicked.connect(self.export_download_config)
         self.btn_export_config.setToolTip("Export download configuration to file")
         actions_layout.addWidget(self.btn_export_config)
 
         actions_layout.addStretch()
-        actions_group.setLayout(actions_layout)
         download_layout.addWidget(actions_group)
 
         download_layout.addStretch()
         download_tab.setLayout(download_layout)
-        setup_tabs.addTab(download_tab, "📥 Download SteamCMD and SCUM Server")
+        self._widgets_ready.update(('steamcmd_dir', 'scum_server_dir'))
 
-        layout.addWidget(setup_tabs)
-        self.page_setup.setLayout(layout)
+        # load_settings ran before these fields existed; pick up the saved directories now
+        self._apply_download_dirs(self._settings_cache or {})
+        # Replace the placeholder status pills once the tab is up instead of waiting for Verify
+        QTimer.singleShot(0, self._async_detect_installations)
+        return download_tab
 
-        # Load existing setup data
-        self.load_setup_config()
-        self.update_setup_status()
+    def _ensure_download_widgets(self):
+        """Build the hidden connection/download progress widgets on the first download or update"""
+        if self.scum_download_progress is not None:
+            return
+        # Connection progress bar (separate from download progress)
+        self.connection_progress_bar = _FastProgressBar("#8be9fd", "#6eb5d8")
+        self.connection_progress_bar.setMaximum(100)
+        self.connection_progress_bar.setValue(0)
+        self.connection_progress_bar.setVisible(False)
+        _set_qss(self.connection_progress_bar, _STYLE_CONNECTION_PROGRESS)
+        self.connection_progress_bar.setFormat("🔌 Connecting to Steam... %p%")
+        self._download_progress_layout.addWidget(self.connection_progress_bar)
+
+        # Connection status label
+        self.connection_status_label = QLabel("")
+        _set_qss(self.connection_status_label, "color: #8be9fd; font-size: 10px; padding: 2px;")
+        self.connection_status_label.setVisible(False)
+        self._download_progress_layout.addWidget(self.connection_status_label)
+
+        # Main download progress bar
+        self.scum_download_progress = _FastProgressBar()
+        self.scum_download_progress.setMaximum(100)
+        self.scum_download_progress.setValue(0)
+        self.scum_download_progress.setVisible(False)
+        _set_qss(self.scum_download_progress, _STYLE_DOWNLOAD_PROGRESS)
+        self._download_progress_layout.addWidget(self.scum_download_progress)
+
+    def _async_detect_installations(self):
+        """Check for steamcmd.exe / SCUMServer.exe off the GUI thread, see installationsDetected"""
+        steamcmd_exe = APP_ROOT / self.steamcmd_dir.text() / "steamcmd.exe"
+        scum_exe = APP_ROOT / self.scum_server_dir.text() / "SCUM" / "Binaries" / "Win64" / "SCUMServer.exe"
+        threading.Thread(
+            target=lambda: self.installationsDetected.emit(steamcmd_exe.exists(), scum_exe.exists()),
+            daemon=True).start()
+
+    def _apply_installation_status(self, steamcmd_ok, scum_ok):
+        # Leave the pills alone if a download or verify already moved them off the placeholder
+        if self.steamcmd_status.text() == "❌ Not installed" and steamcmd_ok:
+            self.steamcmd_status.setText("✅ SteamCMD installed")
+            self._set_status_state(self.steamcmd_status, "ok")
+        if self.scum_server_status.text() == "❌ Not downloaded" and scum_ok:
+            self.scum_server_status.setText("✅ SCUM server installed")
+            self._set_status_state(self.scum_server_status, "ok")
 
     # --- setup actions ---
     def save_basic_setup(self):
         """Save basic setup configuration"""
-        # Save to main settings with message
-        self.save_settings(show_message=True)
-        
-        # Also update setup status
-        if hasattr(self, 'update_setup_status'):
+        if self._warn_invalid_numbers((("Max Players", self.setup_max_players), ("Port", self.setup_port))):
+            return
+        # Save to main settings with message; the score only needs a refresh if something changed
+        if self.save_settings(show_message=True):
             self.update_setup_status()
 
+    def _warn_invalid_numbers(self, fields):
+        """Warn about (label, _IntEdit) pairs whose text is out of range; True if there were any"""
+        bad = [label for label, edit in fields if not edit.hasAcceptableInput()]
+        if bad:
+            QMessageBox.warning(self, "Invalid Value",
+                                "Please enter a number within range for:\n" + "\n".join(bad))
+        return bool(bad)
+
+    def _advanced_setup(self):
+        """Snapshot of the Advanced setup fields"""
+        return AdvancedSetup(
+            logs_dir=self.setup_logs_dir.text(),
+            config_dir=self.setup_config_dir.text(),
+            auto_restart=self.setup_auto_restart.isChecked(),
+            auto_backup=self.setup_auto_backup.isChecked(),
+        )
+
     def save_advanced_setup(self):
-        config = {
-            'logs_dir': self.setup_logs_dir.text(),
-            'config_dir': self.setup_config_dir.text(),
-            'auto_restart': self.setup_auto_restart.isChecked(),
-            'auto_backup': self.setup_auto_backup.isChecked()
-        }
-        self.save_setup_config(config)
-        QMessageBox.information(self, "Saved", "Advanced configuration saved!")
+        if self.save_setup_config(asdict(self._advanced_setup())):
+            QMessageBox.information(self, "Saved", "Advanced configuration saved!")
 
     def run_quick_setup(self):
         # Auto-detect server path
@@ -4552,12 +6196,12 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         if not self.setup_server_name.text().strip():
             issues.append("Server name not set")
         
-        try:
-            port = int(self.setup_port.text())
-            if port < 1024 or port > 65535:
-                issues.append("Invalid port number")
-        except:
+        # The fields' QIntValidator already holds their range; text it would not
+        # accept (empty, or below the minimum) is what gets reported here
+        if not self.setup_port.hasAcceptableInput():
             issues.append("Invalid port number")
+        if not self.setup_max_players.hasAcceptableInput():
+            issues.append("Invalid max players")
         
         if issues:
             QMessageBox.warning(self, "Validation Failed", "Issues found:\n" + "\n".join(issues))
@@ -4565,37 +6209,79 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
             QMessageBox.information(self, "Validation Passed", "All settings are valid!")
 
     def setup_config_file(self) -> Path:
-        return APP_ROOT / 'scum_setup.json'
+        return self._setup_cfg_path
 
-    def load_setup_config(self):
+    def _setup_config_cached(self):
+        """Parsed scum_setup.json, only re-read when its mtime/size changed; raises if unreadable"""
         sf = self.setup_config_file()
-        if sf.exists():
-            try:
-                data = json.loads(sf.read_text(encoding='utf-8'))
+        try:
+            st = sf.stat()
+        except FileNotFoundError:
+            return {}
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._setup_cfg_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = _load_json_file(sf)
+        self._setup_cfg_cache = (key, data)
+        return data
+
+    def _read_setup_config(self):
+        """Return the saved scum_setup.json contents, or {} if missing/unreadable (any thread)"""
+        try:
+            return self._setup_config_cached()
+        except Exception:
+            return {}
+
+    def load_setup_config(self):
+        data = self._read_setup_config()
+        self._apply_setup_config(data)
+        return data
+
+    def _apply_setup_config(self, data):
+        """Fill the Basic/Advanced setup fields from saved data and rescore once"""
+        if not data:
+            return
+        try:
+            # The score fields would each re-run update_setup_status; do it once at the end
+            with QSignalBlocker(self.setup_server_name), QSignalBlocker(self.setup_max_players), \
+                    QSignalBlocker(self.setup_port):
                 self.setup_server_name.setText(data.get('server_name', 'My SCUM Server'))
-                self.setup_max_players.setText(str(data.get('max_players', '50')))
-                self.setup_port.setText(str(data.get('port', '27015')))
-                self.setup_logs_dir.setText(data.get('logs_dir', 'Logs'))
-                self.setup_config_dir.setText(data.get('config_dir', 'Config'))
-                self.setup_auto_restart.setChecked(data.get('auto_restart', True))
-                self.setup_auto_backup.setChecked(data.get('auto_backup', False))
-            except Exception:
-                pass
+                self.setup_max_players.setValue(int(data.get('max_players', 50)))
+                self.setup_port.setValue(int(data.get('port', 27015)))
+            self.setup_logs_dir.setText(data.get('logs_dir', 'Logs'))
+            self.setup_config_dir.setText(data.get('config_dir', 'Config'))
+            self.setup_auto_restart.setChecked(data.get('auto_restart', True))
+            self.setup_auto_backup.setChecked(data.get('auto_backup', False))
+        except (TypeError, ValueError):
+            pass
+        self.update_setup_status()
 
-    def save_setup_config(self, config: dict):
+    def save_setup_config(self, config: dict) -> bool:
+        """Merge config into scum_setup.json (unchanged data is not rewritten); returns False (after warning) if it could not be written"""
         sf = self.setup_config_file()
         try:
-            current_data = {}
-            if sf.exists():
-                current_data = json.loads(sf.read_text(encoding='utf-8'))
+            stored = self._setup_config_cached()
+            current_data = dict(stored)
             current_data.update(config)
-            sf.write_text(json.dumps(current_data, indent=2), encoding='utf-8')
+            if current_data == stored:
+                return True  # nothing new for the file; skip the encode and write
+            sf.write_bytes(_dump_json_bytes(current_data))
+            # What was just written is the parsed content; no need to read it back
+            st = sf.stat()
+            self._setup_cfg_cache = ((st.st_mtime_ns, st.st_size), current_data)
+            return True
         except Exception as e:
             QMessageBox.warning(self, 'Error', f'Could not save setup config: {e}')
+            return False
 
     # --- enhanced setup methods ---
-    def auto_detect_server(self):
-        """Auto-detect SCUM server - asks user where to scan, then scans that location"""
+    def auto_detect_server(self, *, on_done=None):
+        """Auto-detect SCUM server - asks user where to scan, then scans that location
+
+        The scan runs in the background; on_done, if given, is called on the GUI thread
+        once its result has been handled (or straight away if no folder was picked).
+        """
         # First ask user where to scan
         scan_dir = QFileDialog.getExistingDirectory(
             self,
@@ -4606,159 +6292,142 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
         
         if not scan_dir:
             # User cancelled
+            if on_done is not None:
+                on_done()
             return
         
-        # Show progress dialog
-        progress = QMessageBox(self)
+        # Walk the tree on a worker thread so the dialog stays responsive and Cancel can stop it
+        cancel = threading.Event()
+        self._scan_cancel = cancel
+        self._scan_done = on_done
+        progress = QProgressDialog(f"Scanning {scan_dir} for SCUM server installations...", "Cancel", 0, 0, self)
         progress.setWindowTitle("🔍 Scanning...")
-        progress.setText(f"Scanning {scan_dir} for SCUM server installations...\n\nThis may take a moment.")
-        progress.setStandardButtons(QMessageBox.NoButton)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.canceled.connect(cancel.set)
+        self._scan_progress = progress
         progress.show()
-        QApplication.processEvents()
-        
-        try:
-            # Scan the selected directory for installations
+
+        def scan():
             from scum_core import find_scum_installations_in_directory
-            installations = find_scum_installations_in_directory(Path(scan_dir))
-            
-            progress.close()
-            
-            if not installations:
-                self.install_status.setText("❌ Server not found - please browse manually")
-                self.install_status.setStyleSheet("color: #ff6b6b; font-size: 11px;")
-                QMessageBox.warning(self, "Not Found", 
-                    f"Could not find SCUMServer.exe in the selected directory.\n\n"
-                    f"Scanned: {scan_dir}\n\n"
-                    "Please browse to it manually or install SCUM Dedicated Server first.")
-                return
-            
-            # If only one found, use it directly
-            if len(installations) == 1:
-                selected_path = installations[0]
-                self.scum_path = str(selected_path)
-                self.setup_label_path.setText(f"✅ {selected_path.name}")
-                self.install_status.setText("✅ Server found")
-                self.install_status.setStyleSheet("color: #50fa7b; font-size: 11px;")
-                self.update_setup_status()
-                
-                # Auto-save settings
-                self.save_settings()
-                QMessageBox.information(self, "✅ Found & Saved", 
-                    f"SCUMServer.exe found and saved:\n\n{selected_path}\n\n"
-                    f"Location: {selected_path.parent}\n"
-                    f"Size: {selected_path.stat().st_size / (1024*1024):.1f} MB")
-                return
-            
-            # Multiple installations found - let user choose
-            dialog = QDialog(self)
-            dialog.setWindowTitle("🎯 Multiple SCUM Installations Found")
-            dialog.resize(700, 400)
-            dialog.setStyleSheet("""
-                QDialog {
-                    background: #0f1117;
-                    color: #e6eef6;
-                }
-                QLabel {
-                    color: #e6eef6;
-                }
-                QPushButton {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
-                    color: #072018;
-                    padding: 8px 16px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
-                }
-                QListWidget {
-                    background: #0d1016;
-                    border: 1px solid #2b2f36;
-                    border-radius: 5px;
-                    color: #e6eef6;
-                    padding: 5px;
-                }
-                QListWidget::item {
-                    padding: 10px;
-                    border-bottom: 1px solid #2b2f36;
-                }
-                QListWidget::item:selected {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e8b57, stop:1 #35c06f);
-                    color: #ffffff;
-                    font-weight: bold;
-                }
-                QListWidget::item:hover {
-                    background: #2b2f36;
-                }
-            """)
-            
-            layout = QVBoxLayout()
-            
-            # Title
-            title = QLabel(f"🎯 Found {len(installations)} SCUM Server Installations")
-            title.setStyleSheet("font-size: 16px; font-weight: bold; color: #50fa7b; padding: 10px;")
-            layout.addWidget(title)
-            
-            # Instructions
-            instructions = QLabel("Select which installation you want to use:")
-            instructions.setStyleSheet("font-size: 12px; color: #8be9fd; padding: 5px;")
-            layout.addWidget(instructions)
-            
-            # List widget
-            list_widget = QListWidget()
-            for path in installations:
-                # Get size info
-                try:
-                    size_mb = path.stat().st_size / (1024*1024)
-                    size_text = f"{size_mb:.1f} MB"
-                except:
-                    size_text = "Unknown size"
-                
-                # Format item text
-                item_text = f"📁 {path.parent.name}\n   {path}\n   Size: {size_text}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, str(path))  # Store full path
-                list_widget.addItem(item)
-            
-            list_widget.setCurrentRow(0)  # Select first by default
-            layout.addWidget(list_widget)
-            
-            # Buttons
-            button_layout = QHBoxLayout()
-            button_layout.addStretch()
-            
-            btn_cancel = QPushButton("❌ Cancel")
-            btn_cancel.clicked.connect(dialog.reject)
-            button_layout.addWidget(btn_cancel)
-            
-            btn_select = QPushButton("✅ Use Selected")
-            btn_select.setDefault(True)
-            btn_select.clicked.connect(dialog.accept)
-            button_layout.addWidget(btn_select)
-            
-            layout.addLayout(button_layout)
-            dialog.setLayout(layout)
+            try:
+                found = find_scum_installations_in_directory(Path(scan_dir), cancel)
+                self.installScanFinished.emit(cancel, scan_dir, found, "")
+            except Exception as e:
+                self.installScanFinished.emit(cancel, scan_dir, [], str(e))
+
+        threading.Thread(target=scan, daemon=True).start()
+
+    def _on_scan_complete(self, cancel, scan_dir, installations, error):
+        """Handle the auto_detect_server scan result on the GUI thread, then run its on_done"""
+        if cancel is not self._scan_cancel:
+            return  # a newer scan replaced this one
+        self._scan_cancel = None
+        cancelled = cancel.is_set()  # read first: closing the progress dialog emits canceled
+        self._scan_progress.close()
+        self._scan_progress = None
+        on_done, self._scan_done = self._scan_done, None
+        try:
+            if not cancelled:
+                self._use_scan_result(scan_dir, installations, error)
+        finally:
+            if on_done is not None:
+                on_done()
+
+    def _use_scan_result(self, scan_dir, installations, error):
+        """Report a finished scan and take the installation it found (or the one picked)"""
+        if error:
+            QMessageBox.critical(self, "Error", f"Error during auto-detection:\n{error}")
+            return
+
+        if not installations:
+            self.install_status.setText("❌ Server not found - please browse manually")
+            _set_qss(self.install_status, self._SS_INSTALL_MISSING)
+            QMessageBox.warning(self, "Not Found", 
+                f"Could not find SCUMServer.exe in the selected directory.\n\n"
+                f"Scanned: {scan_dir}\n\n"
+                "Please browse to it manually or install SCUM Dedicated Server first.")
+            return
+        
+        # If only one found, use it directly
+        if len(installations) == 1:
+            selected_path, size_bytes = installations[0]
+            self.scum_path = str(selected_path)
+            self.setup_label_path.setText(f"✅ {selected_path.name}")
+            self.install_status.setText("✅ Server found")
+            _set_qss(self.install_status, self._SS_INSTALL_OK)
+            self.update_setup_status()
             
-            # Show dialog
-            if dialog.exec() == QDialog.Accepted:
-                selected_item = list_widget.currentItem()
-                if selected_item:
-                    selected_path = Path(selected_item.data(Qt.UserRole))
-                    self.scum_path = str(selected_path)
-                    self.setup_label_path.setText(f"✅ {selected_path.name}")
-                    self.install_status.setText("✅ Server found")
-                    self.install_status.setStyleSheet("color: #50fa7b; font-size: 11px;")
-                    self.update_setup_status()
-                    
-                    # Auto-save settings
-                    self.save_settings()
-                    QMessageBox.information(self, "✅ Saved", 
-                        f"Selected SCUM server saved:\n\n{selected_path}\n\n"
-                        f"Location: {selected_path.parent}")
+            # Auto-save settings
+            self._schedule_settings_save()
+            QMessageBox.information(self, "✅ Found", 
+                f"SCUMServer.exe found:\n\n{selected_path}\n\n"
+                f"Location: {selected_path.parent}\n"
+                f"Size: {_format_mb(size_bytes)}")
+            return
         
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Error", f"Error during auto-detection:\n{str(e)}")
+        # Multiple installations found - let user choose
+        dialog = QDialog(self)
+        dialog.setWindowTitle("🎯 Multiple SCUM Installations Found")
+        dialog.setObjectName("installPicker")
+        dialog.resize(700, 400)
+        
+        layout = QVBoxLayout()
+        
+        # Title
+        title = QLabel(f"🎯 Found {len(installations)} SCUM Server Installations")
+        title.setObjectName("installPickerTitle")
+        layout.addWidget(title)
+        
+        # Instructions
+        instructions = QLabel("Select which installation you want to use:")
+        instructions.setObjectName("installPickerHint")
+        layout.addWidget(instructions)
+        
+        # List widget
+        list_widget = QListWidget()
+        for path, size_bytes in installations:
+            # Size came with the scan result; no need to stat again
+            item_text = f"📁 {path.parent.name}\n   {path}\n   Size: {_format_mb(size_bytes)}"
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, str(path))  # Store full path
+            list_widget.addItem(item)
+        
+        list_widget.setCurrentRow(0)  # Select first by default
+        layout.addWidget(list_widget)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        btn_cancel = QPushButton("❌ Cancel")
+        btn_cancel.clicked.connect(dialog.reject)
+        button_layout.addWidget(btn_cancel)
+        
+        btn_select = QPushButton("✅ Use Selected")
+        btn_select.setDefault(True)
+        btn_select.clicked.connect(dialog.accept)
+        button_layout.addWidget(btn_select)
+        
+        layout.addLayout(button_layout)
+        dialog.setLayout(layout)
+        
+        # Show dialog
+        if dialog.exec() == QDialog.Accepted:
+            selected_item = list_widget.currentItem()
+            if selected_item:
+                selected_path = Path(selected_item.data(Qt.UserRole))
+                self.scum_path = str(selected_path)
+                self.setup_label_path.setText(f"✅ {selected_path.name}")
+                self.install_status.setText("✅ Server found")
+                _set_qss(self.install_status, self._SS_INSTALL_OK)
+                self.update_setup_status()
+                
+                # Auto-save settings
+                self._schedule_settings_save()
+                QMessageBox.information(self, "✅ Selected", 
+                    f"Selected SCUM server:\n\n{selected_path}\n\n"
+                    f"Location: {selected_path.parent}")
 
     def auto_detect_steamcmd_dir(self):
         """Auto-detect SteamCMD directory"""
@@ -4773,8 +6442,8 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
                 self.steamcmd_dir.setText(str(p))
             
             # Auto-save settings
-            self.save_settings()
-            QMessageBox.information(self, "Found & Saved", f"SteamCMD directory found and saved:\n{p}")
+            self._schedule_settings_save()
+            QMessageBox.information(self, "Found", f"SteamCMD directory found:\n{p}")
         else:
             QMessageBox.warning(self, "Not Found", "Could not auto-detect SteamCMD directory\nPlease browse to it manually.")
 
@@ -4791,21 +6460,22 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
                 self.scum_server_dir.setText(str(p))
             
             # Auto-save settings
-            self.save_settings()
-            QMessageBox.information(self, "Found & Saved", f"SCUM server directory found and saved:\n{p}")
+            self._schedule_settings_save()
+            QMessageBox.information(self, "Found", f"SCUM server directory found:\n{p}")
         else:
             QMessageBox.warning(self, "Not Found", "Could not auto-detect SCUM server directory\nPlease browse to it manually.")
 
     def test_server_port(self):
+        if self._warn_invalid_numbers((("Port", self.setup_port),)):
+            return
         port = self.setup_port.value()
         try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('127.0.0.1', port))
-            sock.close()
-            if result == 0:
-                QMessageBox.warning(self, "Port In Use", f"Port {port} is already in use!")
+            # A bind probe answers at once, unlike connect_ex which can sit out its timeout
+            # on a filtered port. UDP is checked too since the game traffic is UDP.
+            in_use = [kind for kind, sock_type in (("TCP", socket.SOCK_STREAM), ("UDP", socket.SOCK_DGRAM))
+                      if not _port_bindable(port, sock_type)]
+            if in_use:
+                QMessageBox.warning(self, "Port In Use", f"Port {port} is already in use ({'/'.join(in_use)})!")
             else:
                 QMessageBox.information(self, "Port Available", f"Port {port} is available.")
         except Exception as e:
@@ -4822,87 +6492,89 @@ C:\\ScumServer\\SCUM\\Saved\\Config\\WindowsServer\\
                 line_edit.setText(dir_path)
             
             # Auto-save settings after directory selection
-            self.save_settings()
+            self._schedule_settings_save()
 
     def update_setup_status(self):
-        # Calculate setup completion percentage
-        score = 0
-        total = 8
-
-        if self.scum_path:
-            score += 1
-        if self.setup_server_name.text().strip():
-            score += 1
-        if self.setup_max_players.value() > 0:
-            score += 1
-        if self.setup_port.value() >= 1024:
-            score += 1
-        if self.setup_logs_dir.text().strip():
-            score += 1
-        if self.setup_config_dir.text().strip():
-            score += 1
-        if self.setup_save_dir.text().strip():
-            score += 1
-        if self.setup_rcon_password.text().strip():
-            score += 1
+        """Schedule a setup score refresh; repeated calls within 150 ms collapse into one"""
+        self._status_timer.start()
+
+    def _recompute_setup_status(self):
+        # Calculate setup completion percentage: one read per field, scored in a single pass
+        checks = (
+            bool(self.scum_path),
+            bool(self.setup_server_name.text().strip()),
+            self.setup_max_players.hasAcceptableInput(),
+            self.setup_port.hasAcceptableInput(),
+            bool(self.setup_logs_dir.text().strip()),
+            bool(self.setup_config_dir.text().strip()),
+            bool(self.setup_save_dir.text().strip()),
+            bool(self.setup_rcon_password.text().strip()),
+        )
+        score = sum(checks)
+        total = len(checks)
 
         percentage = int((score / total) * 100)
         self.setup_progress.setValue(percentage)
 
         if percentage == 100:
             self.setup_status_label.setText("✅ Setup Complete")
-            self.setup_status_label.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.setup_status_label, "ok")
         elif percentage >= 75:
             self.setup_status_label.setText("🟡 Almost Ready")
-            self.setup_status_label.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.setup_status_label, "warn")
         else:
             self.setup_status_label.setText("⚠️ Setup Incomplete")
-            self.setup_status_label.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.setup_status_label, "bad")
 
     def generate_server_config(self):
         if not self.scum_path:
             QMessageBox.warning(self, "Error", "Please set the server executable path first!")
             return
 
+        if self._warn_invalid_numbers((
+                ("Max Players", self.setup_max_players), ("Port", self.setup_port),
+                ("Query Port", self.setup_query_port), ("RCON Port", self.setup_rcon_port),
+                ("Memory Limit", self.setup_memory_limit), ("Restart Delay", self.setup_restart_delay),
+                ("Backup Interval", self.setup_backup_interval))):
+            return
+
         config_dir = APP_ROOT / self.setup_config_dir.text()
         config_dir.mkdir(exist_ok=True)
 
         # Generate server.cfg
-        server_config = f"""# SCUM Server Configuration - Generated by SCUM Server Manager
-# Generated on {QTime.currentTime().toString()} {QDate.currentDate().toString()}
-
-[Server]
-Name = "{self.setup_server_name.text()}"
-Password = "{self.setup_password.text()}"
-MaxPlayers = {self.setup_max_players.value()}
-Port = {self.setup_port.value()}
-QueryPort = {self.setup_query_port.value()}
-RCONPort = {self.setup_rcon_port.value()}
-RCONPassword = "{self.setup_rcon_password.text()}"
-Difficulty = {self.setup_difficulty.currentIndex()}
-
-[Directories]
-Logs = "{self.setup_logs_dir.text()}"
-Save = "{self.setup_save_dir.text()}"
-
-[Performance]
-MemoryLimit = {self.setup_memory_limit.value()}
-AutoRestart = {1 if self.setup_auto_restart.isChecked() else 0}
-RestartDelay = {self.setup_restart_delay.value()}
-AutoBackup = {1 if self.setup_auto_backup.isChecked() else 0}
-BackupInterval = {self.setup_backup_interval.value()}
-"""
+        server_config = _SERVER_CFG_TEMPLATE.format(
+            generated=datetime.now().isoformat(timespec='seconds'),  # one clock read, ISO 8601
+            name=self.setup_server_name.text(),
+            password=self.setup_password.text(),
+            max_players=self.setup_max_players.value(),
+            port=self.setup_port.value(),
+            query_port=self.setup_query_port.value(),
+            rcon_port=self.setup_rcon_port.value(),
+            rcon_password=self.setup_rcon_password.text(),
+            difficulty=self.setup_difficulty.currentIndex(),
+            logs_dir=self.setup_logs_dir.text(),
+            save_dir=self.setup_save_dir.text(),
+            memory_limit=self.setup_memory_limit.value(),
+            auto_restart=int(self.setup_auto_restart.isChecked()),
+            restart_delay=self.setup_restart_delay.value(),
+            auto_backup=int(self.setup_auto_backup.isChecked()),
+            backup_interval=self.setup_backup_interval.value(),
+        )
 
         config_file = config_dir / "server.cfg"
         try:
-            config_file.write_text(server_config, encoding='utf-8')
+            config_file.write_bytes(server_config.encode('utf-8'))
             QMessageBox.information(self, "Success", f"Server configuration generated:\n{config_file}")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not generate config: {e}")
 
     def run_complete_quick_setup(self):
-        # Step 1: Auto-detect server
-        self.auto_detect_server()
+        # Step 1: Auto-detect server; the scan runs in the background and the
+        # remaining steps continue from its result
+        self.auto_detect_server(on_done=self._finish_complete_quick_setup)
+
+    def _finish_complete_quick_setup(self):
+        """Quick setup steps 2-4 and the save, once the step 1 scan has been handled"""
         self.setup_steps[0].setChecked(bool(self.scum_path))
 
         # Step 2: Set basic settings
@@ -4922,16 +6594,18 @@ BackupInterval = {self.setup_backup_interval.value()}
         self.generate_server_config()
         self.setup_steps[3].setChecked(True)
 
-        # Save all settings
-        self.save_basic_setup()
-        self.save_advanced_setup()
+        # Save once, without the per-page "Saved" popups; save_settings also drops any
+        # debounced auto-save the steps above queued, since it writes the same data
+        self.save_settings()
+        self.save_setup_config(asdict(self._advanced_setup()))
 
         QMessageBox.information(self, "Quick Setup Complete", "Server setup completed successfully!\n\nYou can now start your SCUM server.")
 
     def build_player_stats(self):
         """Build the Player Stats tab with comprehensive player statistics and analytics"""
-        # Create main widget for Player Stats tab
-        page_player_stats = QWidget()
+        # Fill the placeholder page that already sits in the stack, like the other builders
+        page_player_stats = self.page_player_stats
+        page_player_stats.setObjectName("pagePlayerStats")
         layout = QVBoxLayout(page_player_stats)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
@@ -4941,33 +6615,14 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Title
         title_label = QLabel("📊 Player Statistics")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #e6eef6;
-                padding: 10px 0px;
-            }
-        """)
+        title_label.setObjectName("statsTitle")
         header_layout.addWidget(title_label)
 
         header_layout.addStretch()
 
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh Stats")
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #3b82f6, stop:1 #1d4ed8);
-                color: #ffffff;
-                padding: 8px 16px;
-                border-radius: 6px;
-                border: 1px solid #2b2f36;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #60a5fa, stop:1 #3b82f6);
-            }
-        """)
+        refresh_btn.setObjectName("btnRefreshStats")
         refresh_btn.clicked.connect(self.refresh_player_stats)
         header_layout.addWidget(refresh_btn)
 
@@ -5006,36 +6661,11 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Activity chart section
         chart_section = QGroupBox("📈 Player Activity Trends")
-        chart_section.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #e6eef6;
-                padding: 10px;
-                border: 2px solid #44475a;
-                border-radius: 8px;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-        """)
         chart_layout = QVBoxLayout(chart_section)
 
         # Placeholder for activity chart
         chart_placeholder = QLabel("📊 Activity chart will be displayed here\n\nFeatures planned:\n• Daily active players over time\n• Peak hours analysis\n• Session duration trends\n• Player retention metrics")
-        chart_placeholder.setStyleSheet("""
-            QLabel {
-                color: #6272a4;
-                font-size: 12px;
-                padding: 20px;
-                background: #2b2f36;
-                border-radius: 6px;
-                border: 1px solid #44475a;
-            }
-        """)
+        chart_placeholder.setObjectName("statsChartPlaceholder")
         chart_placeholder.setAlignment(Qt.AlignCenter)
         chart_layout.addWidget(chart_placeholder)
 
@@ -5043,69 +6673,23 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Detailed stats section
         stats_section = QGroupBox("📋 Detailed Statistics")
-        stats_section.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #e6eef6;
-                padding: 10px;
-                border: 2px solid #44475a;
-                border-radius: 8px;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-        """)
         stats_layout = QVBoxLayout(stats_section)
 
         # Stats table
-        self.player_stats_table = QTableWidget()
-        self.player_stats_table.setColumnCount(4)
-        self.player_stats_table.setHorizontalHeaderLabels(["Metric", "Value", "Change", "Trend"])
+        self.player_stats_table = QTableView()
+        self.player_stats_table.setModel(StatsTableModel([
+            ("Total Unique Players", "0", "+0", "→"),
+            ("Total Sessions", "0", "+0", "→"),
+            ("Average Session Time", "0 min", "+0 min", "→"),
+            ("Longest Session", "0 min", "N/A", "→"),
+            ("Peak Concurrent Players", "0", "0", "→"),
+            ("Server Uptime", "0%", "0%", "→"),
+            ("Player Retention (7d)", "0%", "0%", "→"),
+            ("New Players Today", "0", "+0", "→"),
+        ], parent=self.player_stats_table))
         self.player_stats_table.horizontalHeader().setStretchLastSection(True)
         self.player_stats_table.setAlternatingRowColors(True)
-        self.player_stats_table.setStyleSheet("""
-            QTableWidget {
-                background: #2b2f36;
-                color: #e6eef6;
-                border: 1px solid #44475a;
-                border-radius: 6px;
-                gridline-color: #44475a;
-            }
-            QHeaderView::section {
-                background: #44475a;
-                color: #e6eef6;
-                padding: 8px;
-                border: 1px solid #6272a4;
-                font-weight: bold;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #44475a;
-            }
-        """)
-
-        # Add sample stats data
-        stats_data = [
-            ["Total Unique Players", "0", "+0", "→"],
-            ["Total Sessions", "0", "+0", "→"],
-            ["Average Session Time", "0 min", "+0 min", "→"],
-            ["Longest Session", "0 min", "N/A", "→"],
-            ["Peak Concurrent Players", "0", "0", "→"],
-            ["Server Uptime", "0%", "0%", "→"],
-            ["Player Retention (7d)", "0%", "0%", "→"],
-            ["New Players Today", "0", "+0", "→"]
-        ]
-
-        self.player_stats_table.setRowCount(len(stats_data))
-        for row, (metric, value, change, trend) in enumerate(stats_data):
-            self.player_stats_table.setItem(row, 0, QTableWidgetItem(metric))
-            self.player_stats_table.setItem(row, 1, QTableWidgetItem(value))
-            self.player_stats_table.setItem(row, 2, QTableWidgetItem(change))
-            self.player_stats_table.setItem(row, 3, QTableWidgetItem(trend))
+        self.player_stats_table.setObjectName("playerStatsTable")
 
         stats_layout.addWidget(self.player_stats_table)
         left_layout.addWidget(stats_section)
@@ -5117,89 +6701,26 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Top players section
         top_players_section = QGroupBox("🏆 Top Players")
-        top_players_section.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #e6eef6;
-                padding: 10px;
-                border: 2px solid #44475a;
-                border-radius: 8px;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-        """)
         top_layout = QVBoxLayout(top_players_section)
 
         # Top players list
         self.top_players_list = QListWidget()
-        self.top_players_list.setStyleSheet("""
-            QListWidget {
-                background: #2b2f36;
-                color: #e6eef6;
-                border: 1px solid #44475a;
-                border-radius: 6px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #44475a;
-            }
-            QListWidget::item:hover {
-                background: #44475a;
-            }
-        """)
-
-        # Add sample top players
-        sample_top_players = [
-            "🥇 No players yet - start your server!",
-            "🥈 Server activity will appear here",
-            "🥉 Player statistics loading..."
-        ]
-
-        for player in sample_top_players:
-            self.top_players_list.addItem(player)
+        self.top_players_list.setObjectName("topPlayersList")
+        self.top_players_list.addItems(self._TOP_PLAYERS_PLACEHOLDER)
 
         top_layout.addWidget(self.top_players_list)
         right_layout.addWidget(top_players_section)
 
         # Recent activity section
         activity_section = QGroupBox("🕒 Recent Activity")
-        activity_section.setStyleSheet("""
-            QGroupBox {
-                font-size: 14px;
-                font-weight: bold;
-                color: #e6eef6;
-                padding: 10px;
-                border: 2px solid #44475a;
-                border-radius: 8px;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-            }
-        """)
         activity_layout = QVBoxLayout(activity_section)
 
         # Activity log
         self.activity_log = QTextEdit()
         self.activity_log.setReadOnly(True)
         self.activity_log.setMaximumHeight(200)
-        self.activity_log.setStyleSheet("""
-            QTextEdit {
-                background: #2b2f36;
-                color: #e6eef6;
-                border: 1px solid #44475a;
-                border-radius: 6px;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-        """)
+        self.activity_log.setFont(self._mono)
+        self.activity_log.setObjectName("statsActivityLog")
 
         # Add sample activity
         sample_activity = "📊 Player Statistics Dashboard\n\n• Server statistics will update automatically\n• Player activity trends will be displayed\n• Top players list will populate with data\n• Recent activity log will show live updates\n\nStart your server to see real statistics!"
@@ -5214,7 +6735,6 @@ BackupInterval = {self.setup_backup_interval.value()}
         splitter.setSizes([600, 400])  # Left panel slightly larger
 
         # Store references for updates
-        self.page_player_stats = page_player_stats
         self.stats_total_card = total_card
         self.stats_online_card = online_card
         self.stats_session_card = session_card
@@ -5225,20 +6745,25 @@ BackupInterval = {self.setup_backup_interval.value()}
     def create_stats_card(self, title, value, color):
         """Create a statistics card widget"""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
+        card.setObjectName("statsCard")
+        # Scoped to the card itself: a bare QFrame rule would also box its QLabels
+        _set_qss(card, f"""
+            QFrame#statsCard {{
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 {color}, stop:1 #2b2f36);
                 border: 2px solid #44475a;
                 border-radius: 10px;
                 padding: 15px;
             }}
+            QFrame#statsCard QLabel {{
+                background: transparent;
+            }}
         """)
         card.setFixedHeight(100)
 
         layout = QVBoxLayout(card)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
+        _set_qss(title_label, """
             QLabel {
                 color: #e6eef6;
                 font-size: 12px;
@@ -5248,7 +6773,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         layout.addWidget(title_label)
 
         value_label = QLabel(value)
-        value_label.setStyleSheet("""
+        _set_qss(value_label, """
             QLabel {
                 color: #ffffff;
                 font-size: 24px;
@@ -5282,9 +6807,10 @@ BackupInterval = {self.setup_backup_interval.value()}
                 # Find most active player
                 most_active = "None"
                 if players_data:
-                    # Simple heuristic: player with most play time
-                    most_active = max(players_data, key=lambda p: float(p.get('play_time', '0').replace('h', '').replace('m', '')) if p.get('play_time') else 0)
-                    most_active = most_active.get('name', 'None')
+                    # Simple heuristic: player with most play time, each parsed once
+                    times = [_parse_playtime(p.get('play_time')) for p in players_data]
+                    idx = max(range(len(times)), key=times.__getitem__)
+                    most_active = players_data[idx].get('name', 'None')
 
                 self.update_stats_card(self.stats_active_card, "🏆 Most Active", most_active)
 
@@ -5325,80 +6851,65 @@ BackupInterval = {self.setup_backup_interval.value()}
         online_count = sum(1 for p in players_data if p.get('status') == 'Online')
 
         # Calculate average session time
-        session_times = []
-        for p in players_data:
-            play_time = p.get('play_time', '0')
-            if play_time and play_time != '0':
-                # Convert to minutes (simplified)
-                if 'h' in play_time:
-                    hours = float(play_time.replace('h', ''))
-                    session_times.append(hours * 60)
-                elif 'm' in play_time:
-                    minutes = float(play_time.replace('m', ''))
-                    session_times.append(minutes)
+        session_times = [m for m in (_parse_playtime(p.get('play_time')) for p in players_data) if m]
 
         avg_session = "0 min"
         if session_times:
             avg_minutes = sum(session_times) / len(session_times)
             if avg_minutes >= 60:
-                avg_session = ".1f"
+                avg_session = f"{avg_minutes/60:.1f} h"
             else:
-                avg_session = ".0f"
+                avg_session = f"{avg_minutes:.0f} min"
 
         # Find longest session
         longest_session = "0 min"
         if session_times:
             max_minutes = max(session_times)
             if max_minutes >= 60:
-                longest_session = ".1f"
+                longest_session = f"{max_minutes/60:.1f} h"
             else:
-                longest_session = ".0f"
-
-        # Update table data
-        stats_data = [
-            ["Total Unique Players", str(total_players), "+0", "→"],
-            ["Total Sessions", str(total_players), "+0", "→"],  # Simplified
-            ["Average Session Time", avg_session, "+0 min", "→"],
-            ["Longest Session", longest_session, "N/A", "→"],
-            ["Peak Concurrent Players", str(online_count), "0", "→"],
-            ["Server Uptime", "100%", "0%", "↑"],  # Assuming server is running
-            ["Player Retention (7d)", "N/A", "0%", "→"],
-            ["New Players Today", "0", "+0", "→"]
-        ]
-
-        for row, (metric, value, change, trend) in enumerate(stats_data):
-            if row < self.player_stats_table.rowCount():
-                self.player_stats_table.setItem(row, 1, QTableWidgetItem(value))
-                self.player_stats_table.setItem(row, 2, QTableWidgetItem(change))
+                longest_session = f"{max_minutes:.0f} min"
+
+        # Update table data; one model reset repaints the whole table
+        self.player_stats_table.model().set_rows([
+            ("Total Unique Players", str(total_players), "+0", "→"),
+            ("Total Sessions", str(total_players), "+0", "→"),  # Simplified
+            ("Average Session Time", avg_session, "+0 min", "→"),
+            ("Longest Session", longest_session, "N/A", "→"),
+            ("Peak Concurrent Players", str(online_count), "0", "→"),
+            ("Server Uptime", "100%", "0%", "↑"),  # Assuming server is running
+            ("Player Retention (7d)", "N/A", "0%", "→"),
+            ("New Players Today", "0", "+0", "→"),
+        ])
 
     def update_top_players_list(self, players_data):
         """Update the top players list"""
         if not hasattr(self, 'top_players_list'):
             return
 
-        self.top_players_list.clear()
-
         if not players_data:
-            self.top_players_list.addItem("🥇 No players yet - start your server!")
-            self.top_players_list.addItem("🥈 Server activity will appear here")
-            self.top_players_list.addItem("🥉 Player statistics loading...")
-            return
-
-        # Sort by play time (simplified)
-        sorted_players = sorted(players_data,
-                              key=lambda p: float(p.get('play_time', '0').replace('h', '').replace('m', '')) if p.get('play_time') else 0,
-                              reverse=True)
+            items = self._TOP_PLAYERS_PLACEHOLDER
+        else:
+            # Sort by play time
+            sorted_players = sorted(players_data, key=lambda p: _parse_playtime(p.get('play_time')), reverse=True)
 
-        medals = ["🥇", "🥈", "🥉"]
-        for i, player in enumerate(sorted_players[:10]):  # Top 10
-            medal = medals[i] if i < 3 else "🏅"
-            name = player.get('name', 'Unknown')
-            play_time = player.get('play_time', '0')
-            status = player.get('status', 'Offline')
-            status_icon = "🟢" if status == 'Online' else "⚪"
+            medals = ["🥇", "🥈", "🥉"]
+            items = []
+            for i, player in enumerate(sorted_players[:10]):  # Top 10
+                medal = medals[i] if i < 3 else "🏅"
+                name = player.get('name', 'Unknown')
+                play_time = player.get('play_time', '0')
+                status = player.get('status', 'Offline')
+                status_icon = "🟢" if status == 'Online' else "⚪"
+                items.append(f"{medal} {name} - {play_time} {status_icon}")
 
-            item_text = f"{medal} {name} - {play_time} {status_icon}"
-            self.top_players_list.addItem(item_text)
+        # Clear and refill as one repaint
+        self.top_players_list.setUpdatesEnabled(False)
+        try:
+            self.top_players_list.clear()
+            self.top_players_list.addItems(items)
+        finally:
+            self.top_players_list.setUpdatesEnabled(True)
 
     def update_activity_log(self, players_data):
         """Update the recent activity log"""
@@ -5437,10 +6948,10 @@ BackupInterval = {self.setup_backup_interval.value()}
         if not self.setup_server_name.text().strip():
             issues.append("• Server name not set")
 
-        if self.setup_max_players.value() <= 0:
+        if not self.setup_max_players.hasAcceptableInput():
             issues.append("• Invalid max players")
 
-        if self.setup_port.value() < 1024:
+        if not self.setup_port.hasAcceptableInput():
             issues.append("• Invalid server port")
 
         if not self.setup_logs_dir.text().strip():
@@ -5463,7 +6974,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         filename, _ = QFileDialog.getSaveFileName(self, "Export Configuration", str(APP_ROOT), "JSON files (*.json)")
         if filename:
             try:
-                config = self.load_setup_config()
+                config = self._read_setup_config()
                 Path(filename).write_text(json.dumps(config, indent=2), encoding='utf-8')
                 QMessageBox.information(self, "Exported", f"Configuration exported to:\n{filename}")
             except Exception as e:
@@ -5476,7 +6987,6 @@ BackupInterval = {self.setup_backup_interval.value()}
                 data = json.loads(Path(filename).read_text(encoding='utf-8'))
                 self.save_setup_config(data)
                 self.load_setup_config()
-                self.update_setup_status()
                 QMessageBox.information(self, "Imported", f"Configuration imported from:\n{filename}")
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not import config: {e}")
@@ -5521,19 +7031,19 @@ BackupInterval = {self.setup_backup_interval.value()}
     @Slot(str)
     def update_connection_status(self, text):
         """Thread-safe method to update connection status label"""
-        if hasattr(self, 'connection_status_label'):
+        if self.connection_status_label is not None:
             self.connection_status_label.setText(text)
 
     @Slot(bool)
     def set_connection_progress_visible(self, visible):
         """Thread-safe method to show/hide connection progress bar"""
-        if hasattr(self, 'connection_progress_bar'):
+        if self.connection_progress_bar is not None:
             self.connection_progress_bar.setVisible(visible)
 
     @Slot(int)
     def update_connection_progress(self, value):
         """Thread-safe method to update connection progress bar"""
-        if hasattr(self, 'connection_progress_bar'):
+        if self.connection_progress_bar is not None:
             self.connection_progress_bar.setValue(value)
 
     @Slot(bool)
@@ -5542,9 +7052,9 @@ BackupInterval = {self.setup_backup_interval.value()}
         self.scum_download_progress.setVisible(visible)
 
     @Slot(str)
-    def update_status_stylesheet(self, stylesheet):
-        """Thread-safe method to update status label stylesheet"""
-        self.scum_server_status.setStyleSheet(stylesheet)
+    def update_status_state(self, state):
+        """Thread-safe method to update status label state (ok/warn/bad/info)"""
+        self._set_status_state(self.scum_server_status, state)
 
     @Slot(str)
     def update_label_path(self, text):
@@ -5608,10 +7118,10 @@ BackupInterval = {self.setup_backup_interval.value()}
                 self.verify_steamcmd()
                 return
 
-        self.btn_download_steamcmd.setText("📥 Downloading...")
+        self.btn_download_steamcmd.setText("Downloading...")
         self.btn_download_steamcmd.setEnabled(False)
         self.steamcmd_status.setText("⏳ Downloading...")
-        self.steamcmd_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.steamcmd_status, "warn")
 
         # Download SteamCMD
         import urllib.request
@@ -5660,7 +7170,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             # Verify installation
             if steamcmd_exe.exists():
                 self.steamcmd_status.setText("✅ SteamCMD installed")
-                self.steamcmd_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                self._set_status_state(self.steamcmd_status, "ok")
                 QMessageBox.information(self, "✅ Success", "SteamCMD downloaded and installed successfully!")
             else:
                 raise Exception("steamcmd.exe not found after extraction")
@@ -5677,16 +7187,16 @@ BackupInterval = {self.setup_backup_interval.value()}
                 f"Error: {str(e)}"
             )
             self.steamcmd_status.setText("❌ Permission denied")
-            self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.steamcmd_status, "bad")
             QMessageBox.critical(self, "Permission Error", error_msg)
             
         except Exception as e:
             self.steamcmd_status.setText("❌ Download failed")
-            self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.steamcmd_status, "bad")
             QMessageBox.warning(self, "Download Failed", f"Could not download SteamCMD:\n{str(e)}")
 
         finally:
-            self.btn_download_steamcmd.setText("📥 Download SteamCMD")
+            self.btn_download_steamcmd.setText("Download SteamCMD")
             self.btn_download_steamcmd.setEnabled(True)
 
     def verify_steamcmd(self):
@@ -5696,13 +7206,13 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         if not steamcmd_exe.exists():
             self.steamcmd_status.setText("❌ Not installed")
-            self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.steamcmd_status, "bad")
             QMessageBox.warning(self, "Not Found", "SteamCMD is not installed.\nPlease download it first.")
             return
 
         # Test SteamCMD functionality
         self.steamcmd_status.setText("🧪 Testing...")
-        self.steamcmd_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.steamcmd_status, "warn")
 
         try:
 
@@ -5723,22 +7233,22 @@ BackupInterval = {self.setup_backup_interval.value()}
 
                 if return_code == 0:
                     self.steamcmd_status.setText("✅ SteamCMD working")
-                    self.steamcmd_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                    self._set_status_state(self.steamcmd_status, "ok")
                     QMessageBox.information(self, "Verified", "SteamCMD is properly installed and working!")
                 else:
                     self.steamcmd_status.setText("❌ SteamCMD error")
-                    self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                    self._set_status_state(self.steamcmd_status, "bad")
                     QMessageBox.warning(self, "Test Failed", f"SteamCMD returned error code {return_code}\n\nOutput:\n{output[:500]}")
 
             except subprocess.TimeoutExpired:
                 process.kill()
                 self.steamcmd_status.setText("❌ SteamCMD timeout")
-                self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                self._set_status_state(self.steamcmd_status, "bad")
                 QMessageBox.warning(self, "Timeout", "SteamCMD took too long to respond.\nIt may be corrupted or need reinstallation.")
 
         except Exception as e:
             self.steamcmd_status.setText("❌ Test failed")
-            self.steamcmd_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.steamcmd_status, "bad")
             QMessageBox.warning(self, "Verification Failed", f"Could not test SteamCMD:\n{str(e)}")
 
     def download_scum_server(self):
@@ -5755,7 +7265,7 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Title
         title = QLabel("Choose Download Method")
-        title.setStyleSheet("font-size: 16px; font-weight: bold; color: #e6eef6; margin-bottom: 10px;")
+        _set_qss(title, "font-size: 16px; font-weight: bold; color: #e6eef6; margin-bottom: 10px;")
         layout.addWidget(title)
 
         # Description
@@ -5765,7 +7275,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             "Manual download gives you more control but requires Steam to be running.\n"
             "Automatic download is faster but requires SteamCMD to be installed."
         )
-        desc.setStyleSheet("color: #e6eef6; margin-bottom: 20px;")
+        _set_qss(desc, "color: #e6eef6; margin-bottom: 20px;")
         desc.setWordWrap(True)
         layout.addWidget(desc)
 
@@ -5774,7 +7284,7 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         # Manual download button
         btn_manual = QPushButton("📱 Manual Download")
-        btn_manual.setStyleSheet("""
+        _set_qss(btn_manual, """
             QPushButton {
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #4ade80, stop:1 #22c55e);
                 color: #072018;
@@ -5788,12 +7298,12 @@ BackupInterval = {self.setup_backup_interval.value()}
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #6ef08b, stop:1 #4ade80);
             }
         """)
-        btn_manual.clicked.connect(lambda: self._manual_download_scum_server(dialog))
+        btn_manual.clicked.connect(partial(self._manual_download_scum_server, dialog))
         button_layout.addWidget(btn_manual)
 
         # Automatic download button
         btn_auto = QPushButton("🤖 Automatic Download")
-        btn_auto.setStyleSheet("""
+        _set_qss(btn_auto, """
             QPushButton {
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #3b82f6, stop:1 #1d4ed8);
                 color: #ffffff;
@@ -5807,7 +7317,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #60a5fa, stop:1 #3b82f6);
             }
         """)
-        btn_auto.clicked.connect(lambda: self._auto_download_scum_server(dialog))
+        btn_auto.clicked.connect(partial(self._auto_download_scum_server, dialog))
         button_layout.addWidget(btn_auto)
 
         layout.addLayout(button_layout)
@@ -5816,7 +7326,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         cancel_layout = QHBoxLayout()
         cancel_layout.addStretch()
         btn_cancel = QPushButton("Cancel")
-        btn_cancel.setStyleSheet("""
+        _set_qss(btn_cancel, """
             QPushButton {
                 background: #666;
                 color: #ddd;
@@ -5927,7 +7437,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             self.scum_server_dir.setText(download_dir)
         
         # Save the setting
-        self.save_settings()
+        self._schedule_settings_save()
 
         steamcmd_dir = APP_ROOT / self.steamcmd_dir.text()
         steamcmd_exe = steamcmd_dir / "steamcmd.exe"
@@ -5994,8 +7504,9 @@ BackupInterval = {self.setup_backup_interval.value()}
             QMessageBox.warning(self, "Directory Error", f"Cannot create SCUM server directory:\n{str(e)}")
             return
 
-        self.btn_download_scum.setText("🎮 Downloading...")
+        self.btn_download_scum.setText("Downloading...")
         self.btn_download_scum.setEnabled(False)
+        self._ensure_download_widgets()
         
         # Show connection progress bar first
         self.connection_progress_bar.setVisible(True)
@@ -6010,12 +7521,12 @@ BackupInterval = {self.setup_backup_interval.value()}
         
         # Update server status to show connection phase
         self.scum_server_status.setText("🔌 Connecting to Steam...")
-        self.scum_server_status.setStyleSheet("color: #8be9fd; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.scum_server_status, "info")
 
         # Add time estimate label
         if not hasattr(self, 'download_time_label'):
             self.download_time_label = QLabel("")
-            self.download_time_label.setStyleSheet("color: #e6eef6; font-size: 11px; padding: 2px;")
+            _set_qss(self.download_time_label, "color: #e6eef6; font-size: 11px; padding: 2px;")
             # Find the progress bar's parent layout and add the time label
             try:
                 # Find the layout containing the progress bar
@@ -6392,7 +7903,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                                     
                                     # Update status with completion
                                     QMetaObject.invokeMethod(self, "update_status_label", Qt.QueuedConnection, Q_ARG(str, "✅ SCUM Server Ready - 100%"))
-                                    QMetaObject.invokeMethod(self, "update_status_stylesheet", Qt.QueuedConnection, Q_ARG(str, "color: #50fa7b; font-size: 12px; font-weight: bold; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                                    QMetaObject.invokeMethod(self, "update_status_state", Qt.QueuedConnection, Q_ARG(str, "ok"))
                                     QMetaObject.invokeMethod(self, "update_time_label", Qt.QueuedConnection, Q_ARG(str, f"⏱️ Completed in {mins}m {secs}s!"))
                                     
                                     if hasattr(self, 'download_animation_label'):
@@ -6507,7 +8018,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                             )
                             if attempt == max_retries - 1:  # Last attempt
                                 QTimer.singleShot(0, lambda: self.scum_server_status.setText("❌ Download failed (Code 8)"))
-                                QTimer.singleShot(0, lambda: self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                                QTimer.singleShot(0, lambda: self._set_status_state(self.scum_server_status, "bad"))
                                 QTimer.singleShot(0, lambda: self.download_time_label.setText("❌ Failed"))
                                 QTimer.singleShot(0, lambda: self.scum_download_log.append(f"❌ Download failed with exit code {return_code}"))
                                 QMessageBox.critical(self, "Download Failed", error_msg)
@@ -6534,7 +8045,7 @@ BackupInterval = {self.setup_backup_interval.value()}
 
                             if attempt == max_retries - 1:  # Last attempt
                                 QTimer.singleShot(0, lambda: self.scum_server_status.setText(f"❌ Download failed (Code {return_code})"))
-                                QTimer.singleShot(0, lambda: self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                                QTimer.singleShot(0, lambda: self._set_status_state(self.scum_server_status, "bad"))
                                 QTimer.singleShot(0, lambda: self.download_time_label.setText("❌ Failed"))
                                 QTimer.singleShot(0, lambda: self.scum_download_log.append(f"❌ Download failed with exit code {return_code}: {error_desc}"))
                                 QMessageBox.critical(self, "Download Failed",
@@ -6548,7 +8059,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     except subprocess.TimeoutExpired:
                         if attempt == max_retries - 1:
                             QTimer.singleShot(0, lambda: self.scum_server_status.setText("❌ Download timeout"))
-                            QTimer.singleShot(0, lambda: self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                            QTimer.singleShot(0, lambda: self._set_status_state(self.scum_server_status, "bad"))
                             QTimer.singleShot(0, lambda: self.download_time_label.setText("❌ Timeout"))
                             QTimer.singleShot(0, lambda: self.scum_download_log.append("❌ Download timed out after 45 minutes"))
                             QMessageBox.critical(self, "Timeout", "Download timed out after 45 minutes.\n\nThis may indicate:\n• Very slow internet connection\n• Network issues\n• Steam servers overloaded\n\nTry again later or check your connection.")
@@ -6560,7 +8071,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     except Exception as e:
                         if attempt == max_retries - 1:
                             QTimer.singleShot(0, lambda: self.scum_server_status.setText("❌ Download error"))
-                            QTimer.singleShot(0, lambda: self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                            QTimer.singleShot(0, lambda: self._set_status_state(self.scum_server_status, "bad"))
                             QTimer.singleShot(0, lambda: self.download_time_label.setText("❌ Error"))
                             QTimer.singleShot(0, lambda: self.scum_download_log.append(f"❌ Error: {str(e)}"))
                             QMessageBox.critical(self, "Download Error", f"Download failed:\n{str(e)}")
@@ -6602,7 +8113,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     
                     # Update server status for connection phase
                     self.scum_server_status.setText(f"🔌 Connecting to Steam... {connection_progress}%")
-                    self.scum_server_status.setStyleSheet("color: #8be9fd; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                    self._set_status_state(self.scum_server_status, "info")
                     
                 elif connection_progress >= 100:
                     # Connection complete - hide connection bar, show download bar
@@ -6613,7 +8124,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     # Show download bar and update status
                     self.scum_download_progress.setVisible(True)
                     self.scum_server_status.setText(self.download_progress_state['status'])
-                    self.scum_server_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                    self._set_status_state(self.scum_server_status, "ok")
                 
                 # Update main download progress bar value
                 self.scum_download_progress.setValue(self.download_progress_state['progress'])
@@ -6654,12 +8165,12 @@ BackupInterval = {self.setup_backup_interval.value()}
                 
                 if not success:
                     QTimer.singleShot(0, lambda: self.scum_server_status.setText("❌ Download failed"))
-                    QTimer.singleShot(0, lambda: self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;"))
+                    QTimer.singleShot(0, lambda: self._set_status_state(self.scum_server_status, "bad"))
                     QTimer.singleShot(0, lambda: self.download_time_label.setText("❌ Failed"))
                     if hasattr(self, 'download_animation_label'):
                         QTimer.singleShot(0, lambda: self.download_animation_label.setText("❌ Download Failed"))
 
-                QTimer.singleShot(0, lambda: self.btn_download_scum.setText("🎮 Download SCUM Server"))
+                QTimer.singleShot(0, lambda: self.btn_download_scum.setText("Download SCUM Server"))
                 QTimer.singleShot(0, lambda: self.btn_download_scum.setEnabled(True))
 
             thread = threading.Thread(target=download_thread)
@@ -6668,11 +8179,11 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         except Exception as e:
             self.scum_server_status.setText("❌ Download failed")
-            self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.scum_server_status, "bad")
             self.download_time_label.setText("❌ Error")
             QTimer.singleShot(0, lambda: self.scum_download_log.append(f"❌ Error: {str(e)}"))
             QMessageBox.warning(self, "Download Failed", f"Could not start download:\n{str(e)}")
-            self.btn_download_scum.setText("🎮 Download SCUM Server")
+            self.btn_download_scum.setText("Download SCUM Server")
             self.btn_download_scum.setEnabled(True)
 
     def verify_scum_server(self):
@@ -6682,11 +8193,11 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         if scum_exe.exists():
             self.scum_server_status.setText("✅ SCUM server installed")
-            self.scum_server_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.scum_server_status, "ok")
             QMessageBox.information(self, "Verified", "SCUM server is properly installed!")
         else:
             self.scum_server_status.setText("❌ Not installed")
-            self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.scum_server_status, "bad")
             QMessageBox.warning(self, "Not Found", "SCUM server is not installed.\nPlease download it first.")
 
     def update_scum_server(self):
@@ -6724,17 +8235,18 @@ BackupInterval = {self.setup_backup_interval.value()}
             QMessageBox.warning(self, "SteamCMD Test Failed", f"Could not verify SteamCMD:\n{str(e)}")
             return
 
-        self.btn_update_scum.setText("🔄 Updating...")
+        self.btn_update_scum.setText("Updating...")
         self.btn_update_scum.setEnabled(False)
+        self._ensure_download_widgets()
         self.scum_download_progress.setVisible(True)
         self.scum_download_progress.setValue(0)
         self.scum_server_status.setText("⏳ Updating...")
-        self.scum_server_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.scum_server_status, "warn")
 
         # Add time estimate label if not already present
         if not hasattr(self, 'download_time_label'):
             self.download_time_label = QLabel("")
-            self.download_time_label.setStyleSheet("color: #e6eef6; font-size: 11px; padding: 2px;")
+            _set_qss(self.download_time_label, "color: #e6eef6; font-size: 11px; padding: 2px;")
             # Find the progress bar's parent layout and add the time label
             try:
                 parent_widget = self.scum_download_progress.parent()
@@ -6754,7 +8266,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         # Add animated downloading indicator
         if not hasattr(self, 'download_animation_label'):
             self.download_animation_label = QLabel("⏳ Downloading")
-            self.download_animation_label.setStyleSheet("color: #50fa7b; font-size: 12px; font-weight: bold; padding: 2px;")
+            _set_qss(self.download_animation_label, "color: #50fa7b; font-size: 12px; font-weight: bold; padding: 2px;")
             try:
                 parent_widget = self.scum_download_progress.parent()
                 if parent_widget and hasattr(parent_widget, 'layout'):
@@ -6906,7 +8418,7 @@ BackupInterval = {self.setup_backup_interval.value()}
 
                         if return_code == 0:
                             self.scum_server_status.setText("✅ SCUM server updated")
-                            self.scum_server_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                            self._set_status_state(self.scum_server_status, "ok")
                             self.scum_download_progress.setValue(100)
                             self.download_time_label.setText("⏱️ Complete!")
                             total_time = time.time() - self.download_start_time
@@ -6927,7 +8439,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                             )
                             if attempt == max_retries - 1:
                                 self.scum_server_status.setText("❌ Update failed (Code 8)")
-                                self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                                self._set_status_state(self.scum_server_status, "bad")
                                 self.download_time_label.setText("❌ Failed")
                                 self.scum_download_log.append(f"❌ Update failed with exit code {return_code}")
                                 QMessageBox.critical(self, "Update Failed", error_msg)
@@ -6946,7 +8458,7 @@ BackupInterval = {self.setup_backup_interval.value()}
 
                             if attempt == max_retries - 1:
                                 self.scum_server_status.setText(f"❌ Update failed (Code {return_code})")
-                                self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                                self._set_status_state(self.scum_server_status, "bad")
                                 self.download_time_label.setText("❌ Failed")
                                 self.scum_download_log.append(f"❌ Update failed with exit code {return_code}: {error_desc}")
                                 QMessageBox.critical(self, "Update Failed",
@@ -6959,7 +8471,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     except subprocess.TimeoutExpired:
                         if attempt == max_retries - 1:
                             self.scum_server_status.setText("❌ Update timeout")
-                            self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                            self._set_status_state(self.scum_server_status, "bad")
                             self.download_time_label.setText("❌ Timeout")
                             self.scum_download_log.append("❌ Update timed out after 15 minutes")
                             QMessageBox.critical(self, "Timeout", "Update timed out.\n\nTry again later or check your connection.")
@@ -6971,7 +8483,7 @@ BackupInterval = {self.setup_backup_interval.value()}
                     except Exception as e:
                         if attempt == max_retries - 1:
                             self.scum_server_status.setText("❌ Update error")
-                            self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                            self._set_status_state(self.scum_server_status, "bad")
                             self.download_time_label.setText("❌ Error")
                             self.scum_download_log.append(f"❌ Error: {str(e)}")
                             QMessageBox.critical(self, "Update Error", f"Update failed:\n{str(e)}")
@@ -6986,10 +8498,10 @@ BackupInterval = {self.setup_backup_interval.value()}
                 success = run_update_with_retry()
                 if not success:
                     self.scum_server_status.setText("❌ Update failed")
-                    self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                    self._set_status_state(self.scum_server_status, "bad")
                     self.download_time_label.setText("❌ Failed")
 
-                self.btn_update_scum.setText("🔄 Update SCUM Server")
+                self.btn_update_scum.setText("Update SCUM Server")
                 self.btn_update_scum.setEnabled(True)
 
             thread = threading.Thread(target=update_thread)
@@ -6998,11 +8510,11 @@ BackupInterval = {self.setup_backup_interval.value()}
 
         except Exception as e:
             self.scum_server_status.setText("❌ Update failed")
-            self.scum_server_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.scum_server_status, "bad")
             self.download_time_label.setText("❌ Error")
             self.scum_download_log.append(f"❌ Error: {str(e)}")
             QMessageBox.warning(self, "Update Failed", f"Could not start update:\n{str(e)}")
-            self.btn_update_scum.setText("🔄 Update SCUM Server")
+            self.btn_update_scum.setText("Update SCUM Server")
             self.btn_update_scum.setEnabled(True)
 
     def download_everything(self):
@@ -7027,7 +8539,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             QMessageBox.warning(self, "SteamCMD Required", "Please download and install SteamCMD first!")
             return
 
-        self.btn_check_updates.setText("🔍 Checking...")
+        self.btn_check_updates.setText("Checking...")
         self.btn_check_updates.setEnabled(False)
 
         try:
@@ -7064,7 +8576,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             QMessageBox.warning(self, "Error", f"Could not check for updates:\n{str(e)}")
 
         finally:
-            self.btn_check_updates.setText("🔍 Check for Updates")
+            self.btn_check_updates.setText("Check for Updates")
             self.btn_check_updates.setEnabled(True)
 
     def save_download_config(self):
@@ -7195,32 +8707,35 @@ BackupInterval = {self.setup_backup_interval.value()}
         
         # Show loading status
         self.config_status.setText("⏳ Loading files...")
-        self.config_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.config_status, "warn")
         QApplication.processEvents()  # Update UI
         
-        # Load into tree
-        self.config_tree.clear()
-        for file_path in config_dir.iterdir():
-            if file_path.is_file():
-                item = QTreeWidgetItem([file_path.name])
-                item.setData(0, Qt.UserRole, str(file_path))
-                self.config_tree.addTopLevelItem(item)
+        # Point the file model at the folder; it lists the files asynchronously
+        if self.config_tree.model() is None:
+            self.config_tree.setModel(self._config_fs_model)
+            for column in range(1, self._config_fs_model.columnCount()):
+                self.config_tree.hideColumn(column)  # Name only, no size/type/date
+        self.config_tree.setRootIndex(self._config_fs_model.setRootPath(str(config_dir)))
         
         self.config_base_path = config_dir
         
-        # Count files efficiently
-        file_count = len([f for f in config_dir.iterdir() if f.is_file()])
+        # Count files in one pass (the model may still be scanning)
+        file_count = sum(1 for f in config_dir.iterdir() if f.is_file())
         
         # Update status
         self.config_path_display.setText(str(config_dir))
         self.config_status.setText(f"✅ Loaded {file_count} files")
-        self.config_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.config_status, "ok")
         
         # Save the config folder path to settings
-        self.save_settings()
+        self._schedule_settings_save()
         
         self.write_log('config', f'Loaded {file_count} config files from: {config_dir}', 'INFO')
     
+    def _on_config_tree_clicked(self, index):
+        if not self._config_fs_model.isDir(index):
+            self.load_selected_config_file(self._config_fs_model.filePath(index))
+
     def load_selected_config_file(self, file_path: str):
         """Load selected file into appropriate editor - optimized"""
         # Save current file if changes exist
@@ -7244,7 +8759,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         
         # Show loading indicator
         self.config_status.setText(f"⏳ Loading {Path(file_path).name}...")
-        self.config_status.setStyleSheet("color: #ffb86b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.config_status, "warn")
         QApplication.processEvents()
         
         # Remove old editor
@@ -7266,7 +8781,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             # Header with file name and save button
             header = QHBoxLayout()
             file_label = QLabel(f"📝 {Path(file_path).name}")
-            file_label.setStyleSheet("font-weight: bold; color: #50fa7b; font-size: 14px;")
+            _set_qss(file_label, "font-weight: bold; color: #50fa7b; font-size: 14px;")
             header.addWidget(file_label)
             header.addStretch()
             
@@ -7278,7 +8793,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             
             # Text editor
             text_editor = QPlainTextEdit()
-            text_editor.setFont(QFont("Consolas", 10))
+            text_editor.setFont(self._mono)
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     text_editor.setPlainText(f.read())
@@ -7299,7 +8814,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             # Header
             header = QHBoxLayout()
             file_label = QLabel(f"📊 {Path(file_path).name}")
-            file_label.setStyleSheet("font-weight: bold; color: #50fa7b; font-size: 14px;")
+            _set_qss(file_label, "font-weight: bold; color: #50fa7b; font-size: 14px;")
             header.addWidget(file_label)
             header.addStretch()
             
@@ -7311,7 +8826,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             
             # Text editor for JSON
             text_editor = QPlainTextEdit()
-            text_editor.setFont(QFont("Consolas", 10))
+            text_editor.setFont(self._mono)
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     text_editor.setPlainText(f.read())
@@ -7333,7 +8848,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             # Header
             header = QHBoxLayout()
             file_label = QLabel(f"📄 {Path(file_path).name}")
-            file_label.setStyleSheet("font-weight: bold; color: #50fa7b; font-size: 14px;")
+            _set_qss(file_label, "font-weight: bold; color: #50fa7b; font-size: 14px;")
             header.addWidget(file_label)
             header.addStretch()
             
@@ -7344,7 +8859,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             editor_layout.addLayout(header)
             
             text_editor = QPlainTextEdit()
-            text_editor.setFont(QFont("Consolas", 10))
+            text_editor.setFont(self._mono)
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     text_editor.setPlainText(f.read())
@@ -7360,7 +8875,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             # Update status
             file_name = Path(file_path).name
             self.config_status.setText(f"📄 {file_name}")
-            self.config_status.setStyleSheet("color: #8be9fd; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.config_status, "info")
     
     def toggle_editor_mode(self, file_path: str):
         """Toggle between text and modern visual editor for INI files"""
@@ -7378,7 +8893,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         # Header
         header = QHBoxLayout()
         file_label = QLabel(f"📝 {Path(file_path).name}")
-        file_label.setStyleSheet("font-weight: bold; color: #bd93f9; font-size: 14px;")
+        _set_qss(file_label, "font-weight: bold; color: #bd93f9; font-size: 14px;")
         header.addWidget(file_label)
         header.addStretch()
         
@@ -7394,7 +8909,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         
         # Simple text editor
         visual_editor = QPlainTextEdit()
-        visual_editor.setFont(QFont("Consolas", 10))
+        visual_editor.setFont(self._mono)
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 visual_editor.setPlainText(f.read())
@@ -7413,7 +8928,7 @@ BackupInterval = {self.setup_backup_interval.value()}
         # Update status
         file_name = Path(file_path).name
         self.config_status.setText(f"🎨 {file_name} (Visual)")
-        self.config_status.setStyleSheet("color: #bd93f9; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        self._set_status_state(self.config_status, "visual")
     
     def save_current_config(self):
         """Save the currently open config file"""
@@ -7451,7 +8966,7 @@ BackupInterval = {self.setup_backup_interval.value()}
             
             file_name = Path(self.current_config_file).name
             self.config_status.setText(f"💾 Saved: {file_name}")
-            self.config_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.config_status, "ok")
             self.write_log('config', f'Saved config file: {file_name}', 'INFO')
             
         except Exception as e:
@@ -8305,7 +9820,7 @@ bEnableLegacyInputScales=False
                 self.server_settings_editor.setPlainText(content)
             
             self.config_status.setText(f"✅ Loaded: {Path(filename).name}")
-            self.config_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.config_status, "ok")
             QMessageBox.information(self, "Loaded", f"Configuration loaded from:\n{filename}")
             
         except Exception as e:
@@ -8503,11 +10018,11 @@ bEnableLegacyInputScales=False
         # Update validation status
         if is_valid:
             self.validation_status.setText("✓ All Valid")
-            self.validation_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.validation_status, "ok")
             QMessageBox.information(self, "Validation Success", "✅ All configuration files are valid!\n\n" + "\n".join([r['message'] for r in validation_results]))
         else:
             self.validation_status.setText("⚠ Errors Found")
-            self.validation_status.setStyleSheet("color: #ff6b6b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+            self._set_status_state(self.validation_status, "bad")
             error_msg = "\n\n".join([f"{r['file']}: {r['message']}" for r in validation_results if not r['valid']])
             QMessageBox.warning(self, "Validation Errors", f"❌ Configuration validation failed:\n\n{error_msg}")
     
@@ -8695,7 +10210,7 @@ bEnableLegacyInputScales=False
             
             if applied_files:
                 self.config_status.setText(f"✅ Preset '{preset_name}' applied")
-                self.config_status.setStyleSheet("color: #50fa7b; font-size: 12px; padding: 5px; background: #2b2f36; border-radius: 3px;")
+                self._set_status_state(self.config_status, "ok")
                 QMessageBox.information(self, "Preset Applied", f"Preset '{preset_name}' has been applied to:\n\n" + "\n".join(applied_files) + "\n\nDon't forget to save!")
             
         except Exception as e:
@@ -8803,22 +10318,7 @@ bEnableLegacyInputScales=False
     
     def parse_ini_to_dict(self, content):
         """Parse INI content into a dictionary"""
-        result = {}
-        current_section = None
-        
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith(';'):
-                continue
-            
-            if line.startswith('[') and line.endswith(']'):
-                current_section = line
-                result[current_section] = {}
-            elif '=' in line and current_section:
-                key, value = line.split('=', 1)
-                result[current_section][key.strip()] = value.strip()
-        
-        return result
+        return _parse_ini_lines(content.splitlines())
 
     def open_visual_config_editor(self):
         """Open visual editor for currently selected file"""
@@ -9258,28 +10758,28 @@ bEnableLegacyInputScales=False
         
         # Top bar with database info
         info_bar = QWidget()
-        info_bar.setStyleSheet("background: #2d2d30; padding: 10px; border-bottom: 2px solid #007acc;")
+        _set_qss(info_bar, "background: #2d2d30; padding: 10px; border-bottom: 2px solid #007acc;")
         info_layout = QHBoxLayout()
         
         # Database icon and name
         db_icon = QLabel("🗄️")
-        db_icon.setStyleSheet("font-size: 24px;")
+        _set_qss(db_icon, "font-size: 24px;")
         info_layout.addWidget(db_icon)
         
         db_name = QLabel(f"<b>{db_path.name}</b>")
-        db_name.setStyleSheet("font-size: 16px; color: #ffffff; font-weight: bold;")
+        _set_qss(db_name, "font-size: 16px; color: #ffffff; font-weight: bold;")
         info_layout.addWidget(db_name)
         
         # Connection status
         self.db_connection_status = QLabel("● Connected")
-        self.db_connection_status.setStyleSheet("color: #16c60c; font-weight: bold; margin-left: 20px;")
+        _set_qss(self.db_connection_status, "color: #16c60c; font-weight: bold; margin-left: 20px;")
         info_layout.addWidget(self.db_connection_status)
         
         info_layout.addStretch()
         
         # Database stats
         self.db_stats_label = QLabel("Loading...")
-        self.db_stats_label.setStyleSheet("color: #cccccc; font-size: 10pt;")
+        _set_qss(self.db_stats_label, "color: #cccccc; font-size: 10pt;")
         info_layout.addWidget(self.db_stats_label)
         
         info_bar.setLayout(info_layout)
@@ -9287,7 +10787,7 @@ bEnableLegacyInputScales=False
         
         # Toolbar
         toolbar = QWidget()
-        toolbar.setStyleSheet("background: #2d2d30; padding: 5px; border-bottom: 1px solid #3e3e42;")
+        _set_qss(toolbar, "background: #2d2d30; padding: 5px; border-bottom: 1px solid #3e3e42;")
         toolbar_layout = QHBoxLayout()
         toolbar_layout.setSpacing(5)
         
@@ -9353,7 +10853,7 @@ bEnableLegacyInputScales=False
     def _create_separator(self):
         """Create a vertical separator line"""
         separator = QLabel("|")
-        separator.setStyleSheet("color: #3e3e42; padding: 0px 5px;")
+        _set_qss(separator, "color: #3e3e42; padding: 0px 5px;")
         return separator
     
     def _create_database_navigator(self, db_path):
@@ -9361,14 +10861,14 @@ bEnableLegacyInputScales=False
         navigator = QWidget()
         navigator.setMinimumWidth(250)
         navigator.setMaximumWidth(400)
-        navigator.setStyleSheet("background: #252526; border-right: 1px solid #3e3e42;")
+        _set_qss(navigator, "background: #252526; border-right: 1px solid #3e3e42;")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Navigator header
         nav_header = QLabel("📑 Database Objects")
-        nav_header.setStyleSheet("""
+        _set_qss(nav_header, """
             background: #2d2d30;
             color: #ffffff;
             font-weight: bold;
@@ -9407,7 +10907,7 @@ bEnableLegacyInputScales=False
         
         # Quick stats
         self.nav_stats = QLabel("Loading statistics...")
-        self.nav_stats.setStyleSheet("""
+        _set_qss(self.nav_stats, """
             background: #2d2d30;
             color: #cccccc;
             padding: 10px;
@@ -9423,24 +10923,24 @@ bEnableLegacyInputScales=False
     def _create_status_bar(self):
         """Create bottom status bar"""
         status_bar = QWidget()
-        status_bar.setStyleSheet("background: #007acc; padding: 5px;")
+        _set_qss(status_bar, "background: #007acc; padding: 5px;")
         status_bar.setFixedHeight(30)
         
         layout = QHBoxLayout()
         layout.setContentsMargins(10, 0, 10, 0)
         
         self.status_message = QLabel("Ready")
-        self.status_message.setStyleSheet("color: #ffffff; font-weight: bold;")
+        _set_qss(self.status_message, "color: #ffffff; font-weight: bold;")
         layout.addWidget(self.status_message)
         
         layout.addStretch()
         
         self.status_query_time = QLabel("")
-        self.status_query_time.setStyleSheet("color: #ffffff;")
+        _set_qss(self.status_query_time, "color: #ffffff;")
         layout.addWidget(self.status_query_time)
         
         self.status_rows = QLabel("")
-        self.status_rows.setStyleSheet("color: #ffffff; margin-left: 20px;")
+        _set_qss(self.status_rows, "color: #ffffff; margin-left: 20px;")
         layout.addWidget(self.status_rows)
         
         status_bar.setLayout(layout)
@@ -9451,7 +10951,7 @@ bEnableLegacyInputScales=False
         try:
             # Update status
             self.db_status_indicator.setText("🟢 Connected")
-            self.db_status_indicator.setStyleSheet("font-size: 14px; padding: 10px; color: #50fa7b;")
+            _set_qss(self.db_status_indicator, "font-size: 14px; padding: 10px; color: #50fa7b;")
 
             # Populate table selector
             self._populate_table_selector(db_path)
@@ -9472,7 +10972,7 @@ bEnableLegacyInputScales=False
 
         except Exception as e:
             self.db_status_indicator.setText("🔴 Error")
-            self.db_status_indicator.setStyleSheet("font-size: 14px; padding: 10px; color: #ff6b6b;")
+            _set_qss(self.db_status_indicator, "font-size: 14px; padding: 10px; color: #ff6b6b;")
             print(f"Error initializing database manager: {e}")
 
     def _populate_table_selector(self, db_path):
@@ -9496,14 +10996,14 @@ bEnableLegacyInputScales=False
         """Connect all the signals for the database manager"""
         # Data browser signals
         self.table_selector.currentTextChanged.connect(lambda: self._load_table_data(db_path))
-        self.btn_refresh_data.clicked.connect(lambda: self._load_table_data(db_path))
-        self.btn_add_row.clicked.connect(lambda: self._add_table_row(db_path))
-        self.btn_delete_row.clicked.connect(lambda: self._delete_table_row(db_path))
-        self.btn_apply_filter.clicked.connect(lambda: self._apply_table_filter(db_path))
-        self.btn_clear_filter.clicked.connect(lambda: self._clear_table_filter(db_path))
+        self.btn_refresh_data.clicked.connect(partial(self._load_table_data, db_path))
+        self.btn_add_row.clicked.connect(partial(self._add_table_row, db_path))
+        self.btn_delete_row.clicked.connect(partial(self._delete_table_row, db_path))
+        self.btn_apply_filter.clicked.connect(partial(self._apply_table_filter, db_path))
+        self.btn_clear_filter.clicked.connect(partial(self._clear_table_filter, db_path))
 
         # SQL Editor signals
-        self.btn_execute_sql.clicked.connect(lambda: self._execute_sql_query(db_path))
+        self.btn_execute_sql.clicked.connect(partial(self._execute_sql_query, db_path))
         self.btn_format_sql.clicked.connect(self._format_sql_query)
         self.btn_clear_sql.clicked.connect(self._clear_sql_editor)
         self.btn_export_results.clicked.connect(self._export_query_results)
@@ -9511,9 +11011,9 @@ bEnableLegacyInputScales=False
         self.btn_save_query.clicked.connect(self._save_query_to_history)
 
         # Schema viewer signals
-        self.btn_refresh_schema.clicked.connect(lambda: self._load_database_schema(db_path))
-        self.btn_create_table.clicked.connect(lambda: self._create_new_table(db_path))
-        self.btn_drop_table.clicked.connect(lambda: self._drop_selected_table(db_path))
+        self.btn_refresh_schema.clicked.connect(partial(self._load_database_schema, db_path))
+        self.btn_create_table.clicked.connect(partial(self._create_new_table, db_path))
+        self.btn_drop_table.clicked.connect(partial(self._drop_selected_table, db_path))
         self.schema_tree.itemClicked.connect(self._show_object_details)
 
         # Query history
@@ -10507,7 +12007,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
             viewer_dialog = QDialog(self)
             viewer_dialog.setWindowTitle("👁️ Database Viewer")
             viewer_dialog.resize(1000, 700)
-            viewer_dialog.setStyleSheet("""
+            _set_qss(viewer_dialog, """
                 QDialog {
                     background: #0f1117;
                     color: #e6eef6;
@@ -10549,7 +12049,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
             # Header
             header = QLabel("👁️ Built-in Database Viewer")
-            header.setStyleSheet("font-size: 18px; font-weight: bold; color: #50fa7b; padding: 10px;")
+            _set_qss(header, "font-size: 18px; font-weight: bold; color: #50fa7b; padding: 10px;")
             layout.addWidget(header)
 
             # Table selector
@@ -10577,7 +12077,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
             # Status label
             status_label = QLabel("Select a table to view its data")
-            status_label.setStyleSheet("color: #8be9fd; padding: 5px;")
+            _set_qss(status_label, "color: #8be9fd; padding: 5px;")
             layout.addWidget(status_label)
 
             # Load table function
@@ -10791,7 +12291,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
             export_dialog = QDialog(self)
             export_dialog.setWindowTitle("📤 Export Database Data")
             export_dialog.resize(500, 300)
-            export_dialog.setStyleSheet("""
+            _set_qss(export_dialog, """
                 QDialog {
                     background: #0f1117;
                     color: #e6eef6;
@@ -10821,7 +12321,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
             # Header
             header = QLabel("📤 Export Database Data")
-            header.setStyleSheet("font-size: 16px; font-weight: bold; color: #50fa7b; padding: 10px;")
+            _set_qss(header, "font-size: 16px; font-weight: bold; color: #50fa7b; padding: 10px;")
             layout.addWidget(header)
 
             # Export options
@@ -10992,12 +12492,12 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         
         # Header
         header_label = QLabel("📝 Easy Visual Configuration Editor")
-        header_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #e6eef6; padding: 10px;")
+        _set_qss(header_label, "font-size: 18px; font-weight: bold; color: #e6eef6; padding: 10px;")
         main_layout.addWidget(header_label)
         
         # Info label
         info_label = QLabel("💡 Modify settings below. Changes will be applied to your server configuration files.")
-        info_label.setStyleSheet("color: #8be9fd; padding: 5px; background: #2b2f36; border-radius: 3px;")
+        _set_qss(info_label, "color: #8be9fd; padding: 5px; background: #2b2f36; border-radius: 3px;")
         main_layout.addWidget(info_label)
         
         # Splitter for tree and editor
@@ -11007,7 +12507,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         tree = QTreeWidget()
         tree.setHeaderLabels(["Setting", "Value"])
         tree.setColumnWidth(0, 400)
-        tree.setStyleSheet("""
+        _set_qss(tree, """
             QTreeWidget {
                 background: #0d1016;
                 border: 1px solid #2b2f36;
@@ -11034,16 +12534,16 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         
         setting_name_label = QLabel("Setting Name:")
         self.visual_setting_name = QLabel("Select a setting from the tree")
-        self.visual_setting_name.setStyleSheet("font-weight: bold; color: #50fa7b; font-size: 14px;")
+        _set_qss(self.visual_setting_name, "font-weight: bold; color: #50fa7b; font-size: 14px;")
         
         setting_desc_label = QLabel("Description:")
         self.visual_setting_desc = QLabel("No setting selected")
         self.visual_setting_desc.setWordWrap(True)
-        self.visual_setting_desc.setStyleSheet("color: #8be9fd; padding: 10px; background: #1a1d23; border-radius: 5px;")
+        _set_qss(self.visual_setting_desc, "color: #8be9fd; padding: 10px; background: #1a1d23; border-radius: 5px;")
         
         value_label = QLabel("Value:")
         self.visual_setting_value = QLineEdit()
-        self.visual_setting_value.setStyleSheet("""
+        _set_qss(self.visual_setting_value, """
             QLineEdit {
                 background: #0d1016;
                 border: 1px solid #2b2f36;
@@ -11055,7 +12555,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         """)
         
         apply_button = QPushButton("✅ Apply Change")
-        apply_button.setStyleSheet("""
+        _set_qss(apply_button, """
             QPushButton {
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
                 color: #ffffff;
@@ -11091,7 +12591,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         
         save_btn = QPushButton("💾 Save All Changes")
         save_btn.clicked.connect(lambda: self.save_visual_config_changes(dialog))
-        save_btn.setStyleSheet("""
+        _set_qss(save_btn, """
             QPushButton {
                 background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #35c06f, stop:1 #1e8b57);
                 padding: 10px 20px;
@@ -11270,6 +12770,8 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
     def load_player_logs(self):
         """Load player activity logs with auto-scroll"""
+        if self.text_player_logs is None:
+            return  # Sub-tab not opened yet; its builder loads the file
         logs_dir = APP_ROOT / "Logs"
         logs_dir.mkdir(exist_ok=True)
         
@@ -11294,45 +12796,23 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         except:
             pass
         
-        # Check if user is at the bottom BEFORE updating content
-        scrollbar = self.text_player_logs.verticalScrollBar()
-        # Only consider "at bottom" if scrollbar is at the end (within 50 pixels for better UX)
-        # This allows slight scrolling without disabling auto-scroll
-        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 50
-        
-        # Read and display logs
+        # Read and display logs with color coding
         try:
-            with logs.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                if content.strip():
-                    # Apply color formatting for player events
-                    import html
-                    lines = []
-                    for line in content.splitlines():
-                        esc = html.escape(line)
-                        if "connected" in line.lower() or "joined" in line.lower():
-                            lines.append(f"<span style='color:#50fa7b'>✅ {esc}</span>")
-                        elif "disconnected" in line.lower() or "left" in line.lower():
-                            lines.append(f"<span style='color:#ffb86b'>❌ {esc}</span>")
-                        elif "kicked" in line.lower() or "banned" in line.lower():
-                            lines.append(f"<span style='color:#ff6b6b'>⛔ {esc}</span>")
-                        elif "identified" in line.lower():
-                            lines.append(f"<span style='color:#8be9fd'>🔍 {esc}</span>")
-                        else:
-                            lines.append(esc)
-                    html_text = "<pre style='font-family: Consolas, monospace; font-size: 11px; line-height: 1.4;'>{}</pre>".format("\n".join(lines))
-                    self.text_player_logs.setHtml(html_text)
-                else:
-                    self.text_player_logs.setPlainText("👥 Player activity log is empty. Events will appear here when players connect.")
+            lines, end = _read_log_tail(logs)
+            if any(line.strip() for line in lines):
+                self._log_view_pos['players'] = end
+                self._load_log_view('players', lines)
+            else:
+                self._log_view_pos.pop('players', None)
+                self._log_store.pop('players', None)
+                self.text_player_logs.setPlainText("👥 Player activity log is empty. Events will appear here when players connect.")
         except Exception as e:
             self.text_player_logs.setPlainText(f"❌ Could not read player logs: {e}")
-        
-        # ONLY auto-scroll if user was truly at the bottom
-        if was_at_bottom:
-            QTimer.singleShot(50, lambda: scrollbar.setValue(scrollbar.maximum()))
 
     def load_error_logs(self):
         """Load error logs with auto-scroll"""
+        if self.text_error_logs is None:
+            return  # Sub-tab not opened yet; its builder loads the file
         logs_dir = APP_ROOT / "Logs"
         logs_dir.mkdir(exist_ok=True)
         
@@ -11357,42 +12837,23 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         except:
             pass
         
-        # Check if user is at the bottom BEFORE updating content
-        scrollbar = self.text_error_logs.verticalScrollBar()
-        # Only consider "at bottom" if scrollbar is at the end (within 50 pixels for better UX)
-        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 50
-        
         # Read and display logs with color coding
         try:
-            with logs.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                if content.strip():
-                    # Apply color formatting for errors
-                    import html
-                    lines = []
-                    for line in content.splitlines():
-                        esc = html.escape(line)
-                        if "critical" in line.lower() or "fatal" in line.lower():
-                            lines.append(f"<span style='color:#ff0000; font-weight:bold;'>🔴 {esc}</span>")
-                        elif "error" in line.lower():
-                            lines.append(f"<span style='color:#ff6b6b'>❌ {esc}</span>")
-                        elif "warn" in line.lower():
-                            lines.append(f"<span style='color:#ffb86b'>⚠️ {esc}</span>")
-                        else:
-                            lines.append(esc)
-                    html_text = "<pre style='font-family: Consolas, monospace; font-size: 11px; line-height: 1.4;'>{}</pre>".format("\n".join(lines))
-                    self.text_error_logs.setHtml(html_text)
-                else:
-                    self.text_error_logs.setPlainText("✅ Error log is empty. No errors detected - server is running smoothly!")
+            lines, end = _read_log_tail(logs)
+            if any(line.strip() for line in lines):
+                self._log_view_pos['errors'] = end
+                self._load_log_view('errors', lines)
+            else:
+                self._log_view_pos.pop('errors', None)
+                self._log_store.pop('errors', None)
+                self.text_error_logs.setPlainText("✅ Error log is empty. No errors detected - server is running smoothly!")
         except Exception as e:
             self.text_error_logs.setPlainText(f"❌ Could not read error logs: {e}")
-        
-        # ONLY auto-scroll if user was truly at the bottom
-        if was_at_bottom:
-            QTimer.singleShot(50, lambda: scrollbar.setValue(scrollbar.maximum()))
 
     def load_admin_logs(self):
         """Load admin action logs with auto-scroll"""
+        if self.text_admin_logs is None:
+            return  # Sub-tab not opened yet; its builder loads the file
         logs_dir = APP_ROOT / "Logs"
         logs_dir.mkdir(exist_ok=True)
         
@@ -11417,42 +12878,23 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         except:
             pass
         
-        # Check if user is at the bottom BEFORE updating content
-        scrollbar = self.text_admin_logs.verticalScrollBar()
-        # Only consider "at bottom" if scrollbar is at the end (within 50 pixels for better UX)
-        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 50
-        
         # Read and display logs with color coding
         try:
-            with logs.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                if content.strip():
-                    # Apply color formatting for admin actions
-                    import html
-                    lines = []
-                    for line in content.splitlines():
-                        esc = html.escape(line)
-                        if "kick" in line.lower() or "ban" in line.lower():
-                            lines.append(f"<span style='color:#ff6b6b'>⛔ {esc}</span>")
-                        elif "unban" in line.lower() or "pardon" in line.lower():
-                            lines.append(f"<span style='color:#50fa7b'>✅ {esc}</span>")
-                        elif "teleport" in line.lower() or "spawn" in line.lower():
-                            lines.append(f"<span style='color:#bd93f9'>✨ {esc}</span>")
-                        else:
-                            lines.append(f"<span style='color:#ffb86b'>⚡ {esc}</span>")
-                    html_text = "<pre style='font-family: Consolas, monospace; font-size: 11px; line-height: 1.4;'>{}</pre>".format("\n".join(lines))
-                    self.text_admin_logs.setHtml(html_text)
-                else:
-                    self.text_admin_logs.setPlainText("⚡ Admin log is empty. Admin actions will be recorded here.")
+            lines, end = _read_log_tail(logs)
+            if any(line.strip() for line in lines):
+                self._log_view_pos['admin'] = end
+                self._load_log_view('admin', lines)
+            else:
+                self._log_view_pos.pop('admin', None)
+                self._log_store.pop('admin', None)
+                self.text_admin_logs.setPlainText("⚡ Admin log is empty. Admin actions will be recorded here.")
         except Exception as e:
             self.text_admin_logs.setPlainText(f"❌ Could not read admin logs: {e}")
-        
-        # ONLY auto-scroll if user was truly at the bottom
-        if was_at_bottom:
-            QTimer.singleShot(50, lambda: scrollbar.setValue(scrollbar.maximum()))
 
     def load_events_logs(self):
         """Load server events logs with auto-scroll"""
+        if self.text_events_logs is None:
+            return  # Sub-tab not opened yet; its builder loads the file
         logs_dir = APP_ROOT / "Logs"
         logs_dir.mkdir(exist_ok=True)
         
@@ -11477,43 +12919,18 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         except:
             pass
         
-        # Check if user is at the bottom BEFORE updating content
-        scrollbar = self.text_events_logs.verticalScrollBar()
-        # Only consider "at bottom" if scrollbar is at the end (within 50 pixels for better UX)
-        was_at_bottom = scrollbar.maximum() == 0 or scrollbar.value() >= scrollbar.maximum() - 50
-        
         # Read and display logs with color coding
         try:
-            with logs.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                if content.strip():
-                    # Apply color formatting for events
-                    import html
-                    lines = []
-                    for line in content.splitlines():
-                        esc = html.escape(line)
-                        if "started" in line.lower() or "online" in line.lower():
-                            lines.append(f"<span style='color:#50fa7b'>✅ {esc}</span>")
-                        elif "stopped" in line.lower() or "shutdown" in line.lower():
-                            lines.append(f"<span style='color:#ff6b6b'>⛔ {esc}</span>")
-                        elif "restart" in line.lower():
-                            lines.append(f"<span style='color:#ffb86b'>🔄 {esc}</span>")
-                        elif "backup" in line.lower() or "save" in line.lower():
-                            lines.append(f"<span style='color:#8be9fd'>💾 {esc}</span>")
-                        elif "connected" in line.lower() or "player" in line.lower():
-                            lines.append(f"<span style='color:#bd93f9'>👥 {esc}</span>")
-                        else:
-                            lines.append(esc)
-                    html_text = "<pre style='font-family: Consolas, monospace; font-size: 11px; line-height: 1.4;'>{}</pre>".format("\n".join(lines))
-                    self.text_events_logs.setHtml(html_text)
-                else:
-                    self.text_events_logs.setPlainText("📊 Events log is empty. Server events will be recorded here.")
+            lines, end = _read_log_tail(logs)
+            if any(line.strip() for line in lines):
+                self._log_view_pos['events'] = end
+                self._load_log_view('events', lines)
+            else:
+                self._log_view_pos.pop('events', None)
+                self._log_store.pop('events', None)
+                self.text_events_logs.setPlainText("📊 Events log is empty. Server events will be recorded here.")
         except Exception as e:
             self.text_events_logs.setPlainText(f"❌ Could not read events logs: {e}")
-        
-        # ONLY auto-scroll if user was truly at the bottom
-        if was_at_bottom:
-            QTimer.singleShot(50, lambda: scrollbar.setValue(scrollbar.maximum()))
 
     def update_log_stats(self):
         """Update log statistics"""
@@ -11521,7 +12938,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
             total = len(self.text_logs.toPlainText().splitlines())
             errors = self.text_logs.toPlainText().lower().count('error')
             warnings = self.text_logs.toPlainText().lower().count('warn')
-            players = len(self.text_player_logs.toPlainText().splitlines())
+            players = len(self.text_player_logs.toPlainText().splitlines()) if self.text_player_logs is not None else 0
             
             self.log_stats.setText(f"📈 Stats: {total} total lines | {errors} errors | {warnings} warnings | {players} player events")
         except:
@@ -11529,11 +12946,10 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
     def clear_log_displays(self):
         """Clear all log displays"""
-        self.text_logs.clear()
-        self.text_player_logs.clear()
-        self.text_error_logs.clear()
-        self.text_admin_logs.clear()
-        self.text_events_logs.clear()
+        for view in (self.text_logs, self.text_player_logs, self.text_error_logs,
+                     self.text_admin_logs, self.text_events_logs):
+            if view is not None:
+                view.clear()
         QMessageBox.information(self, "Cleared", "All log displays have been cleared.\n\nNote: Log files are not deleted.")
 
     def export_logs(self):
@@ -11550,6 +12966,10 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
         if not filename:
             return
         
+        # Export covers every log, so build any sub-tabs that haven't been opened
+        for index in list(self._log_tab_builders):
+            self._build_log_tab(index)
+        
         try:
             with open(filename, 'w', encoding='utf-8') as f:
                 f.write("=== SCUM SERVER LOGS EXPORT ===\n")
@@ -11579,37 +12999,79 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
             QMessageBox.critical(self, "Export Failed", f"Failed to export logs:\n{str(e)}")
 
     def filter_logs(self):
-        """Filter logs by search term"""
-        search_term = self.log_search.text().lower()
-        if not search_term:
-            return
-        
-        # Simple highlight - could be enhanced
-        QMessageBox.information(self, "Search", f"Searching for: {search_term}\n\nUse Ctrl+F in the log viewer for better search functionality.")
+        """Filter logs by search term (plain text, or a regex if it contains regex syntax)"""
+        self._apply_log_filters()
 
     def filter_logs_by_time(self):
         """Filter logs by time range"""
-        time_range = self.log_time_filter.currentText()
-        # Placeholder - would need timestamp parsing
-        QMessageBox.information(self, "Time Filter", f"Time filter: {time_range}\n\n(Feature coming soon)")
+        self._apply_log_filters()
 
     def filter_logs_by_level(self):
         """Filter logs by log level"""
-        level = self.log_level_filter.currentText()
-        # Placeholder - would need log level parsing
-        QMessageBox.information(self, "Level Filter", f"Level filter: {level}\n\n(Feature coming soon)")
+        self._apply_log_filters()
 
     # === LOG WRITING FUNCTIONS ===
-    def write_log(self, log_type: str, message: str, level: str = "INFO"):
-        try:
-            from datetime import datetime
+    def _log_handle(self, log_type):
+        """Return the buffered append handle for Logs/<log_type>.log, opening it on first use
+
+        Call with _log_handles_lock held.
+        """
+        handle = self._log_handles.get(log_type)
+        if handle is None:
             log_dir = APP_ROOT / "Logs"
             log_dir.mkdir(exist_ok=True)
-            log_file = log_dir / f"{log_type}.log"
+            handle = (log_dir / f"{log_type}.log").open("a", encoding="utf-8", buffering=8192)
+            self._log_handles[log_type] = handle
+        return handle
+
+    def _flush_log_handles(self):
+        """Push buffered log lines to disk (1s timer, and before the window closes)"""
+        if not self._log_dirty:
+            return
+        with self._log_handles_lock:
+            self._log_dirty = False
+            for handle in self._log_handles.values():
+                try:
+                    handle.flush()
+                except Exception:
+                    pass
+
+    def _close_log_handles(self):
+        """Flush and close every write_log handle (closing flushes the buffers)"""
+        self._log_flush_timer.stop()
+        with self._log_handles_lock:
+            self._logs_closed = True
+            for handle in self._log_handles.values():
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+            self._log_handles.clear()
+
+    def write_log(self, log_type: str, message: str, level: str = "INFO"):
+        try:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            with self._log_handles_lock:
+                if self._logs_closed:
+                    return
+                self._log_handle(log_type).write(f"[{timestamp}] [{level}] {message}\n")
+                self._log_dirty = True
+        except Exception:
+            pass
+
+    def write_logs_batched(self, entries):
+        """Write several (log_type, message, level) entries with one write per log file"""
+        try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            log_entry = f"[{timestamp}] [{level}] {message}\n"
-            with log_file.open("a", encoding="utf-8") as f:
-                f.write(log_entry)
+            by_type = {}
+            for log_type, message, level in entries:
+                by_type.setdefault(log_type, []).append(f"[{timestamp}] [{level}] {message}\n")
+            with self._log_handles_lock:
+                if self._logs_closed:
+                    return
+                for log_type, lines in by_type.items():
+                    self._log_handle(log_type).write("".join(lines))
+                self._log_dirty = True
         except Exception:
             pass
 
@@ -11622,6 +13084,8 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}"""
 
 def main():
     app = QApplication(sys.argv)
+    if not STYLED:
+        app.setStyle("Fusion")
     win = SCUMManager()
     win.show()
     sys.exit(app.exec())